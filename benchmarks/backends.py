@@ -0,0 +1,32 @@
+"""Compare the closure and codegen backends on tests/test_data/aifc.py.
+
+Run from the repository root:
+
+    python -m benchmarks.backends
+"""
+import timeit
+from tree_ql import LarkQuery
+from .common import parse_aifc
+
+QUERIES = [
+    '//assign_stmt',
+    '/classdef/suite//assign_stmt',
+    '//*[@type=="NAME" and @value=="file"]',
+    '/funcdef/parameters/child::*[@value=="file"]',
+    '/classdef[.//funcdef/descendant::*[@value=="__exit__"]]',
+    '/child::*[@data=="classdef" or @data=="funcdef"]',
+    '//funcdef/child::*[@type=="NAME"]/@value',
+]
+
+def main(repeat=5, number=20):
+    tree = parse_aifc()
+    print(f'{"query":<60} {"closure (ms)":>12} {"codegen (ms)":>12} {"speedup":>8}')
+    for query_str in QUERIES:
+        times = []
+        for backend in ('closure', 'codegen'):
+            query = LarkQuery(query_str, trace=False, backend=backend)
+            times.append(min(timeit.repeat(lambda: query.execute(tree), number=number, repeat=repeat))/number)
+        print(f'{query_str:<60} {times[0]*1e3:>12.3f} {times[1]*1e3:>12.3f} {times[0]/times[1]:>7.2f}x')
+
+if __name__ == '__main__':
+    main()
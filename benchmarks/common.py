@@ -0,0 +1,45 @@
+"""Shared test data for the benchmarks"""
+from pathlib import Path
+from lark import Lark, Token, Tree
+from tests.test_data.python_indenter import PythonIndenter
+
+_TEST_DATA = Path(__file__).parent.parent / 'tests' / 'test_data'
+AIFC_PATH = _TEST_DATA / 'aifc.py'
+
+def python_parser():
+    return Lark.open(_TEST_DATA / 'python3.lark', start = 'file_input', postlex = PythonIndenter(), parser = 'lalr')
+
+def parse_aifc():
+    """The parse tree of tests/test_data/aifc.py"""
+    with open(AIFC_PATH, 'r') as f:
+        return python_parser().parse(f.read() +'\n')
+
+# Rule names for the levels of synthetic trees, cycled through by depth
+SYNTHETIC_RULES = ('funcdef', 'suite', 'expr_stmt', 'arith_expr', 'term', 'power')
+
+def synthetic_tree(nodes, depth=8, fanout=4):
+    """A tree of about nodes nodes: complete subtrees of the root, depth levels deep
+    with fanout children per node, added until there are enough nodes. The last 
+    level is NAME tokens, with values v0 to v99. Built iteratively, so any depth works"""
+    count = 1
+    root = Tree('file_input', [])
+    while count < nodes:
+        top = Tree(SYNTHETIC_RULES[0], [])
+        root.children.append(top)
+        count += 1
+        level = [top]
+        for d in range(1, depth):
+            next_level = []
+            for parent in level:
+                for _ in range(fanout):
+                    if count >= nodes:
+                        break
+                    if d < depth-1:
+                        child = Tree(SYNTHETIC_RULES[d % len(SYNTHETIC_RULES)], [])
+                        next_level.append(child)
+                    else:
+                        child = Token('NAME', f'v{count % 100}')
+                    parent.children.append(child)
+                    count += 1
+            level = next_level
+    return root
@@ -0,0 +1,31 @@
+"""Descendant scans over a degenerate (chain) tree of increasing depth.
+
+Run from the repository root:
+
+    python -m benchmarks.deep_tree
+
+Time per node should stay flat as the depth grows.
+"""
+import timeit
+from lark import Tree, Token
+from tree_ql import LarkQuery
+
+def build_chain(depth):
+    """A chain of nested 'expr' nodes, each with a leaf token. Built iteratively, as
+    it is deeper than the recursion limit"""
+    node = Tree('atom', [Token('NAME', 'x')])
+    for _ in range(depth):
+        node = Tree('expr', [Token('NAME', 'y'), node])
+    return Tree('file_input', [node])
+
+def main(depths=(1000, 2000, 4000, 8000, 16000, 32000), repeat=5):
+    query = LarkQuery('//atom', trace=False)
+    print(f'{"depth":>8} {"nodes":>8} {"best (ms)":>10} {"ns/node":>8}')
+    for depth in depths:
+        tree = build_chain(depth)
+        nodes = 2*depth + 3
+        best = min(timeit.repeat(lambda: query.execute(tree), number=1, repeat=repeat))
+        print(f'{depth:>8} {nodes:>8} {best*1e3:>10.2f} {best*1e9/nodes:>8.0f}')
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,33 @@
+"""Chained descendant steps (//suite//suite//expr_stmt) over deeply nested suites.
+
+Run from the repository root:
+
+    python -m benchmarks.nested
+
+Each step's working set is free of duplicates, so the result size and the time 
+per node stay linear in the depth of nesting.
+"""
+import timeit
+from lark import Tree, Token
+from tree_ql import LarkQuery
+
+def build_nested(depth):
+    """depth nested suites, each with an expr_stmt. Built iteratively, as it can be
+    deeper than the recursion limit"""
+    node = Tree('suite', [Tree('expr_stmt', [Token('NAME', 'x')])])
+    for _ in range(depth-1):
+        node = Tree('suite', [Tree('expr_stmt', [Token('NAME', 'x')]), node])
+    return Tree('file_input', [node])
+
+def main(depths=(100, 200, 400, 800, 1600, 3200), repeat=5):
+    query = LarkQuery('//suite//suite//expr_stmt', trace=False)
+    print(f'{"depth":>8} {"nodes":>8} {"results":>8} {"best (ms)":>10} {"ns/node":>8}')
+    for depth in depths:
+        tree = build_nested(depth)
+        nodes = 3*depth + 1
+        results = len(query.execute(tree))
+        best = min(timeit.repeat(lambda: query.execute(tree), number=1, repeat=repeat))
+        print(f'{depth:>8} {nodes:>8} {results:>8} {best*1e3:>10.2f} {best*1e9/nodes:>8.0f}')
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,146 @@
+"""A repeatable workload for the query engine, with baselines to catch regressions.
+
+Run from the repository root:
+
+    python -m benchmarks.suite                                # report only
+    python -m benchmarks.suite --save-baseline baseline.json  # record a baseline
+    python -m benchmarks.suite --baseline baseline.json       # compare with it
+
+Each case is run against tests/test_data/aifc.py and synthetic trees (see
+common.synthetic_tree) of the sizes given by --nodes: E.g. --nodes 100000 1000000 10000000.
+Trees of 10**7 nodes need several GB of memory.
+
+Time is the best of --repeat runs (of several calls, for fast cases). Peak memory
+is measured by tracemalloc, in a separate run. A case is flagged as a regression if its time or peak memory is more
+than --threshold times the baseline's, and the exit status is then 1.
+
+'import' is the time to import tree_ql in a fresh interpreter, and 'cold start' the time
+to import it & compile a first query, which loads the query parser. They are also
+flagged, whatever the baseline, if they take longer than --import-budget or
+--cold-start-budget seconds.
+"""
+import argparse
+import json
+import subprocess
+import sys
+import timeit
+import tracemalloc
+from tree_ql import LarkQuery
+from .common import parse_aifc, synthetic_tree
+
+# (workload, query, uses an index)
+WORKLOADS = [
+    ('//name', '//expr_stmt', False),
+    ('//name, indexed', '//expr_stmt', True),
+    ('attribute filter', '//*[@type=="NAME" and @value=="v7"]', False),
+    ('predicate', '//funcdef[.//expr_stmt]', False),
+    ('slice', '//expr_stmt[10:20]', False),
+    ('nested sub-query', '//funcdef[.//suite[.//expr_stmt]]', False),
+    ('descendant chain, indexed', '//funcdef//suite//expr_stmt', True),
+]
+
+def measure(func, repeat):
+    """(best time in seconds, peak traced memory in bytes) of func().
+    Fast cases are run enough times per repeat to be timed accurately"""
+    timer = timeit.Timer(func)
+    number, _ = timer.autorange()
+    best = min(timer.repeat(repeat=repeat, number=number)) / number
+    tracemalloc.start()
+    try:
+        func()
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+    return best, peak
+
+# Run in a fresh interpreter: imports tree_ql & (with 'compile') compiles a query.
+# Prints the time taken, or (with 'peak') the peak traced memory
+_STARTUP_SCRIPT = """
+import sys, time, tracemalloc
+if 'peak' in sys.argv:
+    tracemalloc.start()
+start = time.perf_counter()
+import tree_ql
+if 'compile' in sys.argv:
+    tree_ql.LarkQuery('//funcdef', trace=False)
+print(tracemalloc.get_traced_memory()[1] if 'peak' in sys.argv else time.perf_counter() - start)
+"""
+
+def measure_startup(repeat, *args):
+    """(best time in seconds, peak traced memory in bytes) of _STARTUP_SCRIPT.
+    As for measure, memory is measured in a separate run"""
+    def _run(*args):
+        return subprocess.run([sys.executable, '-c', _STARTUP_SCRIPT, *args], check=True, capture_output=True, text=True).stdout
+    best = min(float(_run(*args)) for _ in range(repeat))
+    return best, int(_run('peak', *args))
+
+def compile_queries():
+    LarkQuery.cache_clear()
+    for _, query_str, _ in WORKLOADS:
+        LarkQuery(query_str, trace=False)
+
+def cases(targets, repeat):
+    """Generates (case name, time, peak memory)"""
+    yield ('import', *measure_startup(repeat))
+    yield ('cold start', *measure_startup(repeat, 'compile'))
+    yield ('compile', *measure(compile_queries, repeat))
+    for target, tree in targets:
+        def build_index():
+            return len(LarkQuery.create_index(tree))
+        yield (f'{target} | index build', *measure(build_index, repeat))
+        index = LarkQuery.create_index(tree)
+        len(index)
+        for workload, query_str, indexed in WORKLOADS:
+            query = LarkQuery(query_str, trace=False)
+            func = (lambda: query.execute(tree, index)) if indexed else (lambda: query.execute(tree))
+            yield (f'{target} | {workload}', *measure(func, repeat))
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--nodes', type=int, nargs='*', default=[10**5], help='sizes of the synthetic trees')
+    parser.add_argument('--depth', type=int, default=8, help='depth of the synthetic trees')
+    parser.add_argument('--fanout', type=int, default=4, help='children per node of the synthetic trees')
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--baseline', help='JSON baseline to compare with')
+    parser.add_argument('--save-baseline', help='save the results as a JSON baseline')
+    parser.add_argument('--threshold', type=float, default=1.25, help='flag cases slower or bigger than this times the baseline')
+    parser.add_argument('--import-budget', type=float, default=0.3, help='flag importing tree_ql if it takes longer than this (seconds)')
+    parser.add_argument('--cold-start-budget', type=float, default=0.6, help='flag a cold start if it takes longer than this (seconds)')
+    args = parser.parse_args(argv)
+
+    targets = [('aifc.py', parse_aifc())]
+    targets += [(f'synthetic {nodes} (depth {args.depth}, fanout {args.fanout})', synthetic_tree(nodes, args.depth, args.fanout))
+                for nodes in args.nodes]
+    baseline = {}
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+
+    budgets = {'import': args.import_budget, 'cold start': args.cold_start_budget}
+    results = {}
+    regressions = 0
+    print(f'{"case":<70} {"best (ms)":>10} {"peak (KiB)":>11} {"vs baseline":>12}')
+    for name, best, peak in cases(targets, args.repeat):
+        results[name] = {'time': best, 'peak': peak}
+        comparison = ''
+        if name in baseline:
+            time_ratio = best / baseline[name]['time']
+            peak_ratio = peak / max(baseline[name]['peak'], 1)
+            comparison = f'{time_ratio:>11.2f}x'
+            if time_ratio > args.threshold or peak_ratio > args.threshold:
+                comparison += f'  REGRESSION (time {time_ratio:.2f}x, peak {peak_ratio:.2f}x)'
+                regressions += 1
+        if name in budgets and best > budgets[name]:
+            comparison += f'  OVER BUDGET ({budgets[name]*1e3:.0f} ms)'
+            regressions += 1
+        print(f'{name:<70} {best*1e3:>10.3f} {peak/1024:>11.1f} {comparison}')
+
+    if args.save_baseline:
+        with open(args.save_baseline, 'w') as f:
+            json.dump(results, f, indent=2)
+    if regressions:
+        print(f'{regressions} regression(s)')
+    return 1 if regressions else 0
+
+if __name__ == '__main__':
+    sys.exit(main())
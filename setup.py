@@ -1,4 +1,19 @@
 from setuptools import setup
+from setuptools.command.build_py import build_py
+
+class _build_py(build_py):
+    """Regenerates the precompiled query parser (tree_ql/_query_grammar.py) if it is out
+    of date with the grammar or Lark version, and Lark is available to build it. 
+    Otherwise the one in the source tree is packaged"""
+    def run(self):
+        try:
+            from tree_ql.build_parser import build, is_current
+        except ImportError:
+            pass
+        else:
+            if not is_current():
+                build()
+        super().run()
 
 setup(name='tree-ql',
       version='0.1',
@@ -18,7 +33,8 @@ setup(name='tree-ql',
       ],      
       license='LGPL',
       packages=['tree_ql'],
-      package_data={'tree_ql': ['*.lark', '*.lark.cache' ]},
+      package_data={'tree_ql': ['*.lark']},
+      cmdclass={'build_py': _build_py},
       install_requires=[
           'lark-parser',
           'more-itertools',
@@ -1,11 +1,17 @@
+import itertools
+import tempfile
 import unittest
-from logging import DEBUG, StreamHandler, getLogger
+from concurrent.futures import ThreadPoolExecutor
+from types import GeneratorType
+from logging import DEBUG, WARNING, StreamHandler, getLogger
 from pathlib import Path
 from test_data.python_indenter import PythonIndenter
 
 # from lark.lexer import Token
-from tree_ql import LarkQuery, logger
-from lark import Lark, LarkError, Tree
+from tree_ql import LarkCorpusExecutor, LarkQuery, LarkQuerySet, logger, rule_reachability
+from tree_ql.tree_ql import create_tree_parser, query_context, logger as _indented_logger
+from tree_ql.tree_ql import _GRAMMAR, _PARSER_OPTIONS, _grammar_hash, _query_parser
+from lark import Lark, LarkError, Token, Tree
 
 # We will use a python file as our test tree
 _PYTHON_GRAMMAR = Path(__file__).parent /'test_data'/'python3.lark'
@@ -15,6 +21,34 @@ test_data_filepath = Path(__file__).parent /'test_data'/'aifc.py'
 with open(test_data_filepath, 'r') as f:
     _TEST_TREE = _PYTHON_PARSER.parse(f.read() +'\n')
 
+class _python_parser:
+    """Parser factory for LarkCorpusExecutor"""
+    def parse(self, text):
+        return _PYTHON_PARSER.parse(text +'\n')
+
+def _is_number(value):
+    try:
+        float(value)
+        return True
+    except ValueError:
+        return False
+
+class _infinite_children:
+    """Children 1, 2, 3, ... without end"""
+    def __iter__(self):
+        return itertools.count(1)
+
+class _recording_tree(Tree):
+    """A Tree that records the names of the trees whose children are read, in reads"""
+    reads = []
+    @property
+    def children(self):
+        _recording_tree.reads.append(self.data)
+        return self._children
+    @children.setter
+    def children(self, value):
+        self._children = value
+
 class test_lark_ql(unittest.TestCase):
 
     def setUp(self):
@@ -112,6 +146,21 @@ class test_lark_ql(unittest.TestCase):
         self.assertIsInstance(result, Tree)
         self.assertEqual(result.data, 'if_stmt')
 
+        children = _TEST_TREE.children
+        self.assertIs(children[-2], LarkQuery('/child::*[-2]').execute(_TEST_TREE))
+        # Out of range: no item
+        for query in ('/child::*[999]', '/child::*[-999]'):
+            subject = LarkQuery(query)
+            self.assertEqual([], list(subject.iter_execute(_TEST_TREE)), query)
+            self.assertIsNone(subject.execute(_TEST_TREE), query)
+            self.assertEqual(0, subject.count(_TEST_TREE), query)
+            self.assertFalse(subject.exists(_TEST_TREE), query)
+        self.assertIsNone(LarkQuery(f'/child::*[{len(children)}]').execute(_TEST_TREE))
+        functions = LarkQuery('//funcdef', trace=False).execute(_TEST_TREE)
+        expected = [function for function in functions if LarkQuery('.//raise_stmt', trace=False).count(function) > 5]
+        self.assertEqual(expected, list(LarkQuery('//funcdef[.//raise_stmt[5]]').iter_execute(_TEST_TREE)))
+        self.assertLess(len(expected), len(functions))
+
     def test_slice(self):
         subject = LarkQuery('/child::*[:]')
         result = subject.execute(_TEST_TREE)
@@ -172,6 +221,22 @@ class test_lark_ql(unittest.TestCase):
         for r in result:
             self.assertEqual('file', r.value) 
 
+    def test_path_operands(self):
+        functions = LarkQuery('//funcdef', trace=False).execute(_TEST_TREE)
+        has = lambda function, name: LarkQuery(f'.//{name}', trace=False).exists(function)
+        for query, test in (('//funcdef[.//return_stmt or .//raise_stmt]', lambda function: has(function, 'return_stmt') or has(function, 'raise_stmt')),
+                            ('//funcdef[.//return_stmt and .//raise_stmt]', lambda function: has(function, 'return_stmt') and has(function, 'raise_stmt')),
+                            ('//funcdef[.//return_stmt or @data=="funcdef"]', lambda function: True),
+                            ('//funcdef[./parameters and .//raise_stmt]', lambda function: has(function, 'raise_stmt'))):
+            expected = [function for function in functions if test(function)]
+            self.assertTrue(expected, query)
+            # Each operand is evaluated from the predicate's item, whatever the backend or tracing
+            for backend in ('closure', 'codegen'):
+                for trace in (True, False):
+                    self.assertEqual(expected, list(LarkQuery(query, trace=trace, backend=backend).iter_execute(_TEST_TREE)), (query, backend, trace))
+        self.assertEqual(57, LarkQuery('//funcdef[.//return_stmt or .//raise_stmt]', trace=False).count(_TEST_TREE))
+        self.assertEqual(12, LarkQuery('//funcdef[.//return_stmt and .//raise_stmt]', trace=False).count(_TEST_TREE))
+
     def test_sub_query(self):
         subject = LarkQuery('/classdef/self::*[.//funcdef/descendant::*[@value=="__exit__"]]')# and @value=="__exit__"]]')
         # subject = LarkQuery('/classdef//funcdef//descendant::*[@value=="__exit__"]')# and @value=="__exit__"]]')
@@ -182,5 +247,579 @@ class test_lark_ql(unittest.TestCase):
         self.assertEqual('Aifc_read', result[0].children[0].value)
         self.assertEqual('Aifc_write', result[1].children[0].value)
 
+    def test_compiled_query_cache(self):
+        LarkQuery.set_cache_size(2)
+        try:
+            self.assertEqual(LarkQuery.cache_info().currsize, 0)
+            first = LarkQuery('//assign_stmt')
+            second = LarkQuery('//assign_stmt')
+            self.assertIs(first._compiled_query, second._compiled_query)
+            info = LarkQuery.cache_info()
+            self.assertEqual((info.hits, info.misses, info.maxsize, info.currsize), (1, 1, 2, 1))
+            self.assertEqual(len(second.execute(_TEST_TREE)), 180)
+
+            LarkQuery('/funcdef')
+            LarkQuery('/classdef')
+            self.assertEqual(LarkQuery.cache_info().currsize, 2)
+
+            LarkQuery.cache_clear()
+            info = LarkQuery.cache_info()
+            self.assertEqual((info.hits, info.misses, info.currsize), (0, 0, 0))
+        finally:
+            LarkQuery.set_cache_size(256)
+
+    def test_untraced_query(self):
+        traced = LarkQuery('/funcdef/parameters/child::*[@value=="file"]', trace=True)
+        untraced = LarkQuery('/funcdef/parameters/child::*[@value=="file"]', trace=False)
+        self.assertIsNot(traced._compiled_query, untraced._compiled_query)
+        self.assertEqual(traced.execute(_TEST_TREE), untraced.execute(_TEST_TREE))
+
+        with self.assertLogs(logger, DEBUG) as logs:
+            LarkQuery('/funcdef', trace=True, optimize=False).execute(_TEST_TREE)
+        self.assertEqual(['DEBUG:tree_ql:absolutelocation_path', 'DEBUG:tree_ql:child_step', 'DEBUG:tree_ql:    child::', 'DEBUG:tree_ql:    tname_test: "funcdef"'], logs.output)
+
+        with self.assertLogs(logger, DEBUG) as logs:
+            LarkQuery('/funcdef', trace=True).execute(_TEST_TREE)
+        self.assertEqual(['DEBUG:tree_ql:absolutelocation_path', 'DEBUG:tree_ql:child::funcdef'], logs.output)
+
+        logger.setLevel(WARNING)
+        with self.assertLogs(logger, WARNING) as logs:
+            LarkQuery('/funcdef').execute(_TEST_TREE)
+            logger.warning('sentinel')
+        self.assertEqual(['WARNING:tree_ql:sentinel'], logs.output)
+
+    def test_deep_tree(self):
+        depth = 5000
+        node = Tree('atom', [])
+        for i in range(depth):
+            node = Tree('expr', [Token('NAME', str(i)), node])
+        tree = Tree('file_input', [node])
+
+        result = LarkQuery('//atom', trace=False).execute(tree)
+        self.assertEqual('atom', result.data)
+        result = LarkQuery('//leaf()', trace=False).execute(tree)
+        self.assertEqual(depth, len(result))
+        self.assertEqual(str(depth-1), result[0])
+        self.assertEqual('0', result[-1])
+
+    def test_iter_execute(self):
+        subject = LarkQuery('//assign_stmt')
+        result = subject.iter_execute(_TEST_TREE)
+        self.assertIsInstance(result, GeneratorType)
+        self.assertEqual(subject.execute(_TEST_TREE), list(result))
+
+    def test_lazy_evaluation(self):
+        # Infinitely wide: only a lazy pipeline can return
+        tree = Tree('file_input', _infinite_children())
+
+        self.assertEqual(1, LarkQuery('/child::*[0]').execute(tree))
+        self.assertEqual([2, 3], LarkQuery('/child::*[1:3]').execute(tree))
+        self.assertEqual(1, next(LarkQuery('//leaf()').iter_execute(tree)))
+        self.assertEqual(11, next(LarkQuery('/child::*[@real==11]').iter_execute(tree)))
+
+    def test_exists_first(self):
+        self.assertTrue(LarkQuery('//assign_stmt').exists(_TEST_TREE))
+        self.assertFalse(LarkQuery('//no_such_rule').exists(_TEST_TREE))
+        self.assertEqual('_read_long', LarkQuery('/funcdef/child::*[@type=="NAME"]/@value').first(_TEST_TREE))
+        self.assertEqual('Aifc_read', LarkQuery('/classdef[.//funcdef/descendant::*[@value=="__exit__"]]').first(_TEST_TREE).children[0].value)
+        self.assertIsNone(LarkQuery('//no_such_rule').first(_TEST_TREE))
+        self.assertEqual(0, LarkQuery('//no_such_rule').first(_TEST_TREE, 0))
+
+    def test_short_circuit_predicate(self):
+        tree = Tree('file_input', [Tree('suite', _infinite_children()), Tree('suite', [])])
+        result = LarkQuery('/child::*[.//leaf()]').execute(tree)
+        self.assertIs(tree.children[0], result)
+        self.assertTrue(LarkQuery('//leaf()').exists(tree))
+        self.assertEqual(1, LarkQuery('//leaf()').first(tree))
+
+    def test_nested_descendants(self):
+        depth = 50
+        node = Tree('suite', [Tree('expr_stmt', [Token('NAME', str(depth))])])
+        for i in range(depth-1, 0, -1):
+            node = Tree('suite', [Tree('expr_stmt', [Token('NAME', str(i))]), node])
+        tree = Tree('file_input', [node])
+        index = LarkQuery.create_index(tree)
+
+        for subject in (LarkQuery('//suite//suite//expr_stmt'), LarkQuery('//suite//suite//expr_stmt', optimize=False)):
+            for result in (subject.execute(tree), subject.execute(tree, index)):
+                self.assertEqual([str(i) for i in range(2, depth+1)], [stmt.children[0] for stmt in result])
+        subject = LarkQuery('//suite/descendant-or-self::suite//expr_stmt')
+        for result in (subject.execute(tree), subject.execute(tree, index)):
+            self.assertEqual([str(i) for i in range(1, depth+1)], [stmt.children[0] for stmt in result])
+
+        result = LarkQuery('//suite//suite//*').execute(tree)
+        self.assertEqual(len(result), len({id(item) for item in result}))
+
+        # Leaves already generated from an earlier item's subtree aren't generated again
+        index = LarkQuery.create_index(_TEST_TREE)
+        document_order = {id(item): position for position, item in enumerate(LarkQuery('//*', trace=False).iter_execute(_TEST_TREE))}
+        for query in ('//*/descendant-or-self::*', '//*[@value=="self" or @data=="var"]/descendant-or-self::*'):
+            subject = LarkQuery(query, trace=False)
+            result = subject.execute(_TEST_TREE)
+            self.assertEqual(sorted({id(item) for item in result}, key=document_order.get), [id(item) for item in result], query)
+            self.assertEqual(subject.execute(_TEST_TREE, index), result, query)
+
+    def test_index(self):
+        index = LarkQuery.create_index(_TEST_TREE)
+        for query in ('//assign_stmt', '/classdef/suite//assign_stmt', '/assign_stmt/descendant::var', 
+                      '/assign_stmt/descendant-or-self::string', '//funcdef//funcdef', '/classdef[.//funcdef/descendant::*[@value=="__exit__"]]'):
+            subject = LarkQuery(query)
+            self.assertEqual(subject.execute(_TEST_TREE), subject.execute(_TEST_TREE, index), query)
+
+        # Sub-trees are answered from the index too
+        subtree = LarkQuery('/classdef[1]').execute(_TEST_TREE)
+        self.assertEqual(LarkQuery('//funcdef').execute(subtree), LarkQuery('//funcdef').execute(subtree, index))
+
+        # A tree that isn't indexed
+        other = Tree('file_input', [Tree('funcdef', []), Tree('funcdef', [])])
+        self.assertEqual(2, len(LarkQuery('//funcdef').execute(other, index)))
+
+    def test_index_arrays(self):
+        tree = Tree('file_input', [Tree('funcdef', [Token('NAME', 'f'), None, Tree('suite', [Token('NAME', 'x')])]), Token('NEWLINE', '\n')])
+        index = LarkQuery.create_index(tree)
+        self.assertEqual(7, len(index))
+        self.assertEqual([7, 6, 3, 4, 6, 6, 7], list(index.ends))
+        self.assertEqual([-1, 0, 1, 1, 1, 4, 0], list(index.parents))
+        self.assertEqual([0, 1, 2, 2, 2, 3, 1], list(index.depths))
+        self.assertEqual(['file_input', 'funcdef', None, None, 'suite', None, None], [index.name_of(i) for i in range(len(index))])
+        self.assertEqual((1, 6), index.span(tree.children[0]))
+
+        # Kind tests & wildcards are range scans; empty items are skipped
+        for query in ('//*', '//leaf()', '//node()', '/funcdef/descendant-or-self::*', '//*[@value=="x"]', '/funcdef/*'):
+            subject = LarkQuery(query)
+            self.assertEqual(subject.execute(tree), subject.execute(tree, index), query)
+
+    def test_query_set(self):
+        queries = ['//assign_stmt', '/classdef/suite//assign_stmt', '/funcdef/parameters', '//no_such_rule',
+                   '/classdef[.//funcdef/descendant::*[@value=="__exit__"]]']
+        subject = LarkQuerySet(queries)
+        self.assertEqual(len(queries), len(subject))
+        self.assertEqual([LarkQuery(query).execute(_TEST_TREE) for query in queries], subject.execute(_TEST_TREE))
+
+        # Queries that scan the whole tree share one pass
+        queries = ['//*[@type=="NAME"]', '//leaf()[@value=="self"]/..', '//*', '//node()', '/descendant-or-self::*[@data=="file_input"]',
+                   '//*[@type=="NAME" and @value!="self"][3]', '//*[@type=="STRING"]/ancestor::funcdef', '//*[@data=="funcdef"]/suite',
+                   '//*[@line > 700]', '//*[@type=="NAME" and @value==$name]', '//*[@type=="NAME" and @type=="STRING"]', '//funcdef']
+        subject = LarkQuerySet(queries, trace=False)
+        self.assertEqual(len(queries)-1, len(subject._scans))
+        for index in (None, LarkQuery.create_index(_TEST_TREE), LarkQuery.create_index(Tree('file_input', []))):
+            self.assertEqual([LarkQuery(query, trace=False).execute(_TEST_TREE, index, variables={'name': 'self'}) for query in queries],
+                             subject.execute(_TEST_TREE, index, variables={'name': 'self'}))
+
+    def test_query_set_single_traversal(self):
+
+        _recording_tree.reads = []
+        tree = _recording_tree('file_input', [_recording_tree('funcdef', [_recording_tree('suite', [Token('NAME', str(i))])]) for i in range(10)])
+        subject = LarkQuerySet(['//funcdef', '//suite', '//funcdef//suite', '//classdef'])
+        result = subject.execute(tree)
+        self.assertEqual(10, len(result[0]))
+        self.assertEqual(result[1], result[2])
+        self.assertIsNone(result[3])
+        # Each node's children are read once
+        self.assertEqual(21, len(_recording_tree.reads))
+
+        # Also by queries that test every node
+        _recording_tree.reads = []
+        subject = LarkQuerySet(['//*[@type=="NAME"]', '//leaf()', '//node()[@data=="suite"]', '//*[@value=="3"]/..'], trace=False)
+        result = subject.execute(tree)
+        self.assertEqual(21, len(_recording_tree.reads))
+        self.assertEqual(10, len(result[0]))
+        self.assertEqual(result[0], result[1])
+        self.assertEqual(LarkQuery('//suite').execute(tree), result[2])
+        self.assertIs(tree.children[3].children[0], result[3])
+
+    def test_corpus_executor(self):
+        paths = [test_data_filepath, Path(__file__).parent /'test_data'/'python_indenter.py']*3
+        subject = LarkCorpusExecutor('/funcdef/child::*[@type=="NAME"]/@value', _python_parser, workers=2, chunk_size=2)
+        result = list(subject.execute(paths))
+        self.assertEqual(paths, [path for path, _ in result])
+        self.assertEqual('_read_long', result[0][1][0])
+        self.assertEqual(result[0], result[2])
+        self.assertEqual(LarkQuery('/funcdef/child::*[@type=="NAME"]/@value').execute(_TEST_TREE), result[4][1])
+
+        queries = ['//funcdef', '//classdef']
+        subject = LarkCorpusExecutor(queries, _python_parser, workers=2)
+        result = list(subject.execute(iter(paths[:1])))
+        self.assertEqual([(paths[0], LarkQuerySet(queries).execute(_TEST_TREE))], result)
+
+        with self.assertRaises(LarkError):
+            LarkCorpusExecutor('//funcdef/', _python_parser)
+
+    def test_optimizer(self):
+        queries = ['//assign_stmt', '/classdef/suite//assign_stmt', '/funcdef/*', '/assign_stmt/child::*', '/assign_stmt/self::*',
+                   '/assign_stmt/descendant::var', '/assign_stmt/descendant-or-self::*', '/assign_stmt/descendant-or-self::string',
+                   '/child::*[6]', '/child::*[1:2]', '/funcdef/parameters/child::*[@value=="file"]', '/funcdef/child::*[@type=="NAME"]/@value',
+                   '/child::*[@data=="classdef" or @data=="funcdef"]', '/funcdef/parameters/child::*["file"==@value and @type=="NAME"]', 
+                   '/classdef/self::*[.//funcdef/descendant::*[@value=="__exit__"]]', '//leaf()[@type!="NAME"]', '//funcdef/./node()',
+                   '/funcdef/child::*[@type=="NAME"][0]']
+        index = LarkQuery.create_index(_TEST_TREE)
+        for query in queries:
+            expected = LarkQuery(query, optimize=False).execute(_TEST_TREE)
+            self.assertEqual(expected, LarkQuery(query).execute(_TEST_TREE), query)
+            self.assertEqual(expected, LarkQuery(query).execute(_TEST_TREE, index), query)
+
+        plan = LarkQuery._query_parser.plan('/funcdef/self::*/child::*[@type=="NAME" and @value=="x"][0]')
+        self.assertEqual(['fused_step', 'fused_step'], [step.data for step in plan.children[0].children])
+        fused = plan.children[0].children[1]
+        self.assertEqual(('child', '*'), (fused.children[0], fused.children[1]))
+        self.assertEqual(2, len(fused.children[2].children))
+        self.assertEqual('index_predicate', fused.children[3].data)
+
+    def test_structural_join(self):
+        plan = LarkQuery._query_parser.plan('/classdef//funcdef//return_stmt')
+        self.assertEqual(['fused_step', 'structural_join'], [step.data for step in plan.children[0].children])
+        plan = LarkQuery._query_parser.plan('//funcdef[1]//return_stmt')
+        self.assertNotIn('structural_join', [step.data for step in plan.children[0].children])
+
+        index = LarkQuery.create_index(_TEST_TREE)
+        for query in ('/classdef//funcdef//return_stmt', '//funcdef//suite//return_stmt', '//classdef/descendant-or-self::classdef//funcdef',
+                      '//funcdef//funcdef', '//suite//no_such_rule', '/classdef[.//funcdef//return_stmt]'):
+            expected = LarkQuery(query, optimize=False).execute(_TEST_TREE)
+            self.assertEqual(expected, LarkQuery(query).execute(_TEST_TREE), query)
+            self.assertEqual(expected, LarkQuery(query).execute(_TEST_TREE, index), query)
+
+        # Partly outside the index: scanned instead
+        other = Tree('file_input', [Tree('funcdef', [Tree('suite', [Tree('return_stmt', [])])])])
+        self.assertIs(other.children[0].children[0].children[0], LarkQuery('//funcdef//return_stmt').execute(other, index))
+
+    def test_grammar_pruning(self):
+        reachability = rule_reachability.of(_PYTHON_PARSER)
+        self.assertIs(reachability, rule_reachability.of(_PYTHON_PARSER))
+        self.assertTrue(reachability.can_contain('funcdef', 'import_from'))
+        self.assertFalse(reachability.can_contain('arith_expr', 'import_from'))
+        self.assertTrue(reachability.can_contain('not_from_the_grammar', 'import_from'))
+
+        for query in ('//import_from', '//funcdef', '/classdef//funcdef//return_stmt', '//funcdef[.//return_stmt]/parameters', 
+                      '//suite/descendant-or-self::suite', '//funcdef//*[@value=="self"]'):
+            expected = LarkQuery(query).execute(_TEST_TREE)
+            self.assertEqual(expected, LarkQuery(query, grammar=_PYTHON_PARSER).execute(_TEST_TREE), query)
+
+        # Subtrees that can't contain a match aren't walked
+        _recording_tree.reads = []
+        tree = _recording_tree('file_input', [_recording_tree('expr_stmt', [_recording_tree('arith_expr', [Token('NUMBER', '1')])]),
+                                              _recording_tree('import_stmt', [_recording_tree('import_from', [])])])
+        subject = LarkQuery('//import_from', grammar=_PYTHON_PARSER)
+        self.assertIs(tree.children[1].children[0], subject.execute(tree))
+        self.assertNotIn('arith_expr', _recording_tree.reads)
+
+        LarkQuery.cache_clear()
+        with self.assertLogs(logger, WARNING) as logs:
+            LarkQuery('//expr_stmt//funcdef', grammar=_PYTHON_PARSER)
+            LarkQuery('/funcdef[.//no_such_rule]', grammar=_PYTHON_PARSER)
+        self.assertEqual(['descendant::funcdef', 'descendant::no_such_rule'], [log.split(': ')[-1].split()[0] for log in logs.output])
+
+        # Checked (and warned about) once per query & grammar, until the cache is cleared
+        with self.assertNoLogs(logger, WARNING):
+            LarkQuery('//expr_stmt//funcdef', grammar=_PYTHON_PARSER)
+            LarkQuery('//expr_stmt//funcdef', grammar=reachability)
+        LarkQuery.cache_clear()
+        with self.assertLogs(logger, WARNING) as logs:
+            LarkQuery('//expr_stmt//funcdef', grammar=reachability)
+        self.assertEqual(1, len(logs.output))
+        self.assertEqual([], reachability.unmatchable_steps(LarkQuery._query_parser.plan('//funcdef//import_from')))
+
+    def test_index_axes(self):
+        name = Token('NAME', 'f')
+        return_stmt = Tree('return_stmt', [])
+        suite = Tree('suite', [return_stmt])
+        funcdef, classdef, last = Tree('funcdef', [name, suite]), Tree('classdef', []), Tree('funcdef', [])
+        tree = Tree('file_input', [funcdef, classdef, last])
+        expected = {
+            '//return_stmt/ancestor::*': [tree, funcdef, suite],
+            '//return_stmt/ancestor::funcdef': funcdef,
+            '//return_stmt/ancestor-or-self::*': [tree, funcdef, suite, return_stmt],
+            '//suite/..': funcdef,
+            '/funcdef/parent::*': tree,
+            '/classdef/following-sibling::*': last,
+            '/classdef/preceding-sibling::*': funcdef,
+            '//suite/following::*': [classdef, last],
+            '/classdef/preceding::*': [funcdef, name, suite, return_stmt],
+            '//return_stmt/preceding::*': name,
+            '/*/following-sibling::node()': [classdef, last],
+            '//*[following-sibling::classdef]': funcdef,
+            '//return_stmt[ancestor::funcdef[@data=="funcdef"]]': return_stmt,
+            '/..': None,
+        }
+        index = LarkQuery.create_index(tree)
+        for query, result in expected.items():
+            for subject in (LarkQuery(query), LarkQuery(query, optimize=False)):
+                self.assertEqual(result, subject.execute(tree), query)
+                self.assertEqual(result, subject.execute(tree, index), query)
+
+        # An index of another tree isn't used
+        other = Tree('file_input', [Tree('funcdef', [Tree('suite', [])])])
+        for query, result in (('/funcdef/..', other), ('//suite/..', other.children[0]), ('//suite/ancestor::*', [other, other.children[0]]), ('/..', None)):
+            self.assertEqual(result, LarkQuery(query).execute(other, index), query)
+        self.assertEqual(215, LarkQuery('//suite/..').count(_TEST_TREE, LarkQuery.create_index(tree)))
+
+        # Without an index, each execution indexes the tree as it is then
+        query, query_set = LarkQuery('/classdef/following-sibling::* | /classdef'), LarkQuerySet(['//funcdef', '//suite/..', '/classdef'])
+        self.assertEqual([classdef, last], query.execute(tree))
+        self.assertEqual([[funcdef, last], funcdef, classdef], query_set.execute(tree))
+        added = Tree('funcdef', [Tree('suite', [])])
+        tree.children.append(added)
+        self.assertEqual([classdef, last, added], query.execute(tree))
+        self.assertEqual([[funcdef, last, added], [funcdef, added], classdef], query_set.execute(tree))
+        self.assertEqual([funcdef, added], LarkQuery('//suite/..').execute(tree))
+        # An index is only valid while its tree is unchanged: one that is given is used as is
+        self.assertEqual(funcdef, LarkQuery('//suite/..').execute(tree, index))
+
+    def test_memoized_predicates(self):
+        plan = LarkQuery._query_parser.plan('//funcdef[.//yield_expr]')
+        self.assertEqual('descendant_exists', plan.children[0].children[0].children[3].data)
+
+        for query in ('//funcdef[.//return_stmt]', '//classdef[.//funcdef[.//return_stmt]]', '//funcdef[descendant-or-self::funcdef[@children]]',
+                      '//suite[.//*[@value=="self"]]', '//funcdef[.//leaf()]/parameters', '//funcdef[.//return_stmt[0]]', '//suite[.//no_such_rule]'):
+            expected = LarkQuery(query, trace=False, optimize=False).execute(_TEST_TREE)
+            self.assertEqual(expected, LarkQuery(query).execute(_TEST_TREE), query)
+            self.assertEqual(expected, LarkQuery(query).execute(_TEST_TREE, LarkQuery.create_index(_TEST_TREE)), query)
+
+        # Nested items don't rescan the same subtrees
+        depth = 200
+        node = _recording_tree('suite', [Token('NAME', 'x')])
+        for i in range(depth):
+            node = _recording_tree('funcdef', [Token('NAME', str(i)), _recording_tree('suite', [node])])
+        tree = _recording_tree('file_input', [node])
+        for query in ('//funcdef[.//yield_expr]', '//funcdef[.//suite[.//yield_expr]]'):
+            _recording_tree.reads = []
+            self.assertIsNone(LarkQuery(query).execute(tree))
+            self.assertLess(len(_recording_tree.reads), 20*depth, query)
+
+    def test_explain(self):
+        query = '//funcdef[.//return_stmt]/suite'
+        subject = LarkQuery(query)
+        profile = subject.explain(_TEST_TREE)
+        self.assertEqual(query, profile.label)
+        self.assertEqual(len(subject.execute(_TEST_TREE)), profile.items_out)
+        labels = [(depth, step.label) for depth, step in profile.walk()]
+        self.assertEqual([(0, query), (1, 'absolutelocation_path'), (2, 'descendant::funcdef'),
+                          (3, 'exists(descendant::return_stmt)'), (2, 'child::suite')], labels)
+        _, _, funcdef, exists, suite = [step for _, step in profile.walk()]
+        self.assertEqual(len(LarkQuery('//funcdef').execute(_TEST_TREE)), funcdef.items_out)
+        self.assertEqual(funcdef.items_out, exists.items_in)
+        self.assertEqual(exists.items_out, suite.items_in)
+        self.assertGreater(funcdef.visited, funcdef.items_out)
+        self.assertTrue(all(step.time>=0 for _, step in profile.walk()))
+
+        # Steps in predicates are evaluated once per item
+        profile = LarkQuery('/classdef[@value=="x" or .//funcdef]', optimize=False).explain(_TEST_TREE)
+        steps = {step.label: step for _, step in profile.walk()}
+        self.assertEqual(steps['predicate_expr'].items_in, steps['or_expr'].evaluations)
+        self.assertEqual(steps['or_expr'].evaluations, steps['relativelocation_path'].evaluations)
+        self.assertEqual(steps['or_expr'].evaluations, steps['equality_expr: eq'].evaluations)
+
+        # Explain doesn't change the compiled query
+        self.assertIs(subject._compiled_query, LarkQuery(query)._compiled_query)
+
+    def test_concurrent_execution(self):
+        queries = ['//assign_stmt', '/classdef/suite//assign_stmt', '//funcdef[.//return_stmt]/parameters',
+                   '//classdef//funcdef//return_stmt', '//return_stmt/ancestor::funcdef', '//funcdef[@x==1 or .//yield_expr]',
+                   '/funcdef/child::*[@type=="NAME"]/@value', '//expr_stmt[2:5]', '//parameters/following-sibling::*']
+        expected = {query: LarkQuery(query, trace=False).execute(_TEST_TREE) for query in queries}
+        index = LarkQuery.create_index(_TEST_TREE)
+
+        def _run(task):
+            query = queries[task % len(queries)]
+            # Traced queries change the log indentation as they execute
+            trace = task % 10 == 0
+            subject = LarkQuery(query, trace=trace)
+            results = [subject.execute(_TEST_TREE), subject.execute(_TEST_TREE, index)]
+            return query, results, _indented_logger.indent_level
+
+        LarkQuery.cache_clear()
+        logger.setLevel(WARNING)
+        with ThreadPoolExecutor(max_workers=16) as executor:
+            for query, results, indent_level in executor.map(_run, range(400)):
+                for result in results:
+                    self.assertEqual(expected[query], result, query)
+                self.assertEqual(0, indent_level)
+        self.assertEqual(0, _indented_logger.indent_level)
+
+    def test_shared_query_parser(self):
+        # Compilers for other attribute names share the query grammar's parser
+        class _node:
+            def __init__(self, name, kids):
+                self.name = name
+                self.kids = kids
+        tree = _node('root', [_node('a', [_node('b', [])]), _node('b', [])])
+        compiler = create_tree_parser('name', 'kids')
+        query = compiler.parse('//b')
+        self.assertEqual([tree.kids[0].kids[0], tree.kids[1]], list(query(query_context(tree, [tree])).working_set))
+        self.assertIs(_query_parser(), _query_parser())
+
+    def test_precompiled_parser(self):
+        # Regenerate with python -m tree_ql.build_parser
+        from tree_ql import _query_grammar, build_parser
+        self.assertEqual(_grammar_hash(), _query_grammar.GRAMMAR_HASH)
+        built = Lark.open(_GRAMMAR, **_PARSER_OPTIONS)
+        for query in ('//funcdef[.//return_stmt]/suite', '/a/b[1][2:3]', '//*[@x=="y" or @z!=1.5]', '..//following-sibling::a[leaf()]',
+                      '//a | //b', '//a[count(.//b) > -(@x - 1) * 2]'):
+            self.assertEqual(built.parse(query), _query_parser().parse(query), query)
+
+        # Generated deterministically, so the file only changes with the grammar or Lark version
+        with tempfile.TemporaryDirectory() as directory:
+            generated = [Path(directory)/f'{i}.py' for i in range(2)]
+            for path in generated:
+                build_parser.build(path)
+            self.assertEqual(generated[0].read_text(), generated[1].read_text())
+            self.assertEqual(Path(_query_grammar.__file__).read_text(), generated[0].read_text())
+        self.assertTrue(build_parser.is_current())
+
+    def test_variables(self):
+        subject = LarkQuery('/funcdef/child::*[@type=="NAME" and @value==$name]')
+        for name in ('_read_long', 'open', 'no_such_function'):
+            expected = LarkQuery(f'/funcdef/child::*[@type=="NAME" and @value=="{name}"]').execute(_TEST_TREE)
+            self.assertEqual(expected, subject.execute(_TEST_TREE, variables={'name': name}), name)
+        self.assertTrue(subject.exists(_TEST_TREE, variables={'name': 'open'}))
+        self.assertEqual('open', subject.first(_TEST_TREE, variables={'name': 'open'}).value)
+
+        # One compiled query for all the values
+        self.assertIs(subject._compiled_query, LarkQuery('/funcdef/child::*[@type=="NAME" and @value==$name]')._compiled_query)
+
+        subject = LarkQuery('//funcdef[.//expr_stmt[@data!=$a]]/child::*[@value==$b]')
+        expected = LarkQuery('//funcdef[.//expr_stmt[@data!="x"]]/child::*[@value=="_write_long"]').execute(_TEST_TREE)
+        self.assertIsNotNone(expected)
+        self.assertEqual(expected, subject.execute(_TEST_TREE, variables={'a': 'x', 'b': '_write_long'}))
+        with self.assertRaises(ValueError):
+            subject.execute(_TEST_TREE, variables={'a': 'x'})
+        self.assertEqual([None, 'open'], [result and result.value for result in LarkQuerySet(
+            ['/classdef[@data==$name]', '/funcdef/child::*[@value==$name]']).execute(_TEST_TREE, variables={'name': 'open'})])
+
+        # Any name can be bound, including the methods' parameter names
+        subject = LarkQuery('/funcdef/child::*[@value==$index or @value==$default or @value==$tree]')
+        expected = LarkQuery('/funcdef/child::*[@value=="open" or @value=="_read_long"]').execute(_TEST_TREE)
+        self.assertEqual(2, len(expected))
+        self.assertEqual(expected, subject.execute(_TEST_TREE, variables={'index': 'open', 'default': '_read_long', 'tree': 'no_such_function'}))
+        self.assertEqual('open', subject.first(_TEST_TREE, None, None, {'index': 'open', 'default': 'x', 'tree': 'x'}).value)
+        with self.assertRaises(TypeError):
+            subject.execute(_TEST_TREE, index='open')
+
+    def test_union(self):
+        document_order = {id(item): position for position, item in enumerate(LarkQuery('//*', trace=False).iter_execute(_TEST_TREE))}
+        for branches in (['//funcdef', '//classdef'], ['//funcdef/suite', '//classdef', '//funcdef'],
+                         ['//return_stmt/..', '//funcdef//return_stmt'], ['/funcdef/child::*[@value=="open"]', '/classdef']):
+            expected = {id(item): item for branch in branches for item in LarkQuery(branch).iter_execute(_TEST_TREE)}
+            expected = sorted(expected.values(), key=lambda item: document_order[id(item)])
+            query = ' | '.join(branches)
+            self.assertEqual([id(item) for item in expected], [id(item) for item in LarkQuery(query).iter_execute(_TEST_TREE)], query)
+            self.assertEqual(expected, LarkQuery(query, optimize=False).execute(_TEST_TREE), query)
+
+        # Merged in document order even with an index that doesn't cover the tree
+        other_index = LarkQuery.create_index(Tree('file_input', []))
+        for branches in (['/funcdef/suite', '//suite'], ['//classdef', '/funcdef']):
+            query = ' | '.join(branches)
+            self.assertEqual(LarkQuery(query).execute(_TEST_TREE), LarkQuery(query).execute(_TEST_TREE, other_index), query)
+
+        # Steps on the same axis share a single traversal
+        plan = LarkQuery._query_parser.plan('//funcdef | //classdef[@x==1] | //leaf()')
+        self.assertEqual('union_step', plan.children[0].children[0].data)
+
+        # In a predicate, any branch matching is enough
+        plan = LarkQuery._query_parser.plan('//funcdef[.//return_stmt | child::parameters/child::*]')
+        self.assertEqual('or_expr', plan.children[0].children[0].children[3].children[0].data)
+        functions = LarkQuery('//funcdef', trace=False).execute(_TEST_TREE)
+        has = lambda function, path: LarkQuery(path, trace=False, optimize=False).exists(function)
+        for query, branches in (('//funcdef[.//return_stmt | .//yield_expr]', ('.//return_stmt', './/yield_expr')),
+                                ('//funcdef[.//raise_stmt | ./parameters]', ('.//raise_stmt', './parameters')),
+                                ('//funcdef[./parameters | .//raise_stmt]', ('./parameters', './/raise_stmt')),
+                                ('//funcdef[.//return_stmt | child::parameters/child::*]', ('.//return_stmt', 'child::parameters/child::*'))):
+            expected = [function for function in functions if any(has(function, branch) for branch in branches)]
+            self.assertTrue(expected, query)
+            for trace in (True, False):
+                self.assertEqual(expected, list(LarkQuery(query, trace=trace).iter_execute(_TEST_TREE)), query)
+        self.assertEqual(73, LarkQuery('//funcdef[.//raise_stmt | ./parameters]', trace=False).count(_TEST_TREE))
+
+    def test_aggregates(self):
+        functions = LarkQuery('//funcdef').execute(_TEST_TREE)
+        returns = {id(function): LarkQuery('.//return_stmt').count(function) for function in functions}
+        expected = [function for function in functions if returns[id(function)]==2]
+        self.assertTrue(expected)
+        self.assertEqual(expected, LarkQuery('//funcdef[count(.//return_stmt)==2]').execute(_TEST_TREE))
+        self.assertEqual([function for function in functions if returns[id(function)]],
+                         LarkQuery('//funcdef[exists(.//return_stmt)]').execute(_TEST_TREE))
+        self.assertEqual(LarkQuery('//funcdef[.//yield_expr]').execute(_TEST_TREE), LarkQuery('//funcdef[boolean(.//yield_expr)]').execute(_TEST_TREE))
+
+        # Numbers are reduced as numbers, whatever their type
+        numbers = {id(function): [float(value) for value in LarkQuery('.//*[@type=="DEC_NUMBER"]/@value').iter_execute(function)] for function in functions}
+        function = max(functions, key=lambda function: len(numbers[id(function)]))
+        for name, reduce in (('sum', sum), ('min', min), ('max', max)):
+            value = reduce(numbers[id(function)])
+            query = f'//funcdef[{name}(.//*[@type=="DEC_NUMBER"]/@value)=={value}]'
+            self.assertIn(function, list(LarkQuery(query).iter_execute(_TEST_TREE)), query)
+        self.assertEqual([function for function in functions if not numbers[id(function)]],
+                         LarkQuery('//funcdef[count(.//*[@type=="DEC_NUMBER"]/@value)==0]').execute(_TEST_TREE))
+        self.assertEqual(LarkQuery('//*[@value]').execute(_TEST_TREE), LarkQuery('//*[count(@value)==1]').execute(_TEST_TREE))
+
+        # Items that aren't numbers (names, nodes) are skipped
+        values = [item.value for item in LarkQuery('.//*', trace=False).iter_execute(function) if isinstance(item, Token)]
+        numeric = [float(value) for value in values if _is_number(value)]
+        self.assertTrue(numeric and len(numeric) < len(values))
+        for name, reduce in (('sum', sum), ('min', min), ('max', max)):
+            query = f'//funcdef[{name}(.//*/@value)=={reduce(numeric)}]'
+            self.assertIn(function, list(LarkQuery(query).iter_execute(_TEST_TREE)), query)
+        self.assertIn(function, list(LarkQuery('//funcdef[sum(.//number/@value)==0]').iter_execute(_TEST_TREE)))
+        self.assertIsNone(LarkQuery('//funcdef[min(.//*[@type=="NAME"]/@value) > 0]').execute(_TEST_TREE))
+
+        # Counting without building a result list
+        for query in ('//funcdef', '//funcdef//return_stmt', '/classdef', '//no_such_rule', '//funcdef | //classdef'):
+            self.assertEqual(len(LarkQuery(query).execute(_TEST_TREE) or []), LarkQuery(query).count(_TEST_TREE), query)
+
+        with self.assertRaises(ValueError):
+            LarkQuery('//funcdef[no_such_function(.//return_stmt)]')
+        with self.assertRaises(ValueError):
+            LarkQuery('//funcdef[count(.//return_stmt, .//yield_expr)]')
+
+    def test_arithmetic(self):
+        items = LarkQuery('//*', trace=False).execute(_TEST_TREE)
+        line = lambda item: getattr(item, 'line', None)
+        end_line = lambda item: getattr(item, 'end_line', None)
+        for query, test in (('//*[@line > 700]', lambda item: line(item) is not None and line(item) > 700),
+                            ('//*[@line <= 3 or @line >= 1000]', lambda item: line(item) is not None and (line(item) <= 3 or line(item) >= 1000)),
+                            ('//*[@end_line - @line > 20]', lambda item: line(item) is not None and end_line(item) - line(item) > 20),
+                            ('//*[(@line + 1) * 2 < 12]', lambda item: line(item) is not None and (line(item) + 1) * 2 < 12),
+                            ('//*[-@line == -701]', lambda item: line(item)==701),
+                            ('//*[@line mod 100 == 1 and @line div 100 > 6]', lambda item: line(item) is not None and line(item) % 100==1 and line(item) > 600),
+                            # Token text compares as a number
+                            ('//*[@type=="DEC_NUMBER" and @value >= 10]', lambda item: getattr(item, 'type', None)=='DEC_NUMBER' and float(item) >= 10),
+                            # Anything that isn't a number compares false
+                            ('//*[@value > 1 or @value div 0 == 1]', lambda item: getattr(item, 'value', None) is not None and _is_number(item.value) and float(item.value) > 1)):
+            expected = [item for item in items if test(item)]
+            self.assertTrue(expected, query)
+            for optimize in (True, False):
+                self.assertEqual(expected, list(LarkQuery(query, trace=False, optimize=optimize).iter_execute(_TEST_TREE)), query)
+        self.assertEqual(LarkQuery('//funcdef/child::*[@line > 700]', trace=False).execute(_TEST_TREE), LarkQuery('//funcdef/child::*[@line > 700]').execute(_TEST_TREE))
+
+        # Constant sub-expressions are folded when the query is compiled
+        plan = LarkQuery._query_parser.plan('//*[@line == (10 * 70 + 1) and @line > -(2 div 4)]')
+        self.assertEqual('fused_step', plan.children[0].children[0].data)
+        self.assertEqual(['701'], [token.value for token in plan.scan_values(lambda value: value.type=='INTEGER_LITERAL')])
+        self.assertEqual(['-0.5'], [token.value for token in plan.scan_values(lambda value: value.type=='DECIMAL_LITERAL')])
+        self.assertEqual('true', LarkQuery._query_parser.plan('//*[1 < 2]').scan_values(lambda value: value.type=='BOOLEAN_LITERAL').__next__())
+        self.assertEqual(LarkQuery('//*[@line == 701]').execute(_TEST_TREE), LarkQuery('//*[@line == 10 * 70 + 1]').execute(_TEST_TREE))
+
+    def test_codegen(self):
+        subject = LarkQuery('/classdef[.//funcdef/descendant::*[@value=="__exit__"]]/child::*[@type=="NAME"]/@value', trace=False, backend='codegen')
+        self.assertIn('def _query(context):', subject._compiled_query.tree_ql_source)
+        self.assertEqual(['Aifc_read', 'Aifc_write'], subject.execute(_TEST_TREE))
+
+        # Not supported by codegen: falls back to the closure backend
+        subject = LarkQuery('/funcdef/@value[0]', trace=False, backend='codegen')
+        self.assertFalse(hasattr(subject._compiled_query, 'tree_ql_source'))
+
+        with self.assertRaises(ValueError):
+            LarkQuery('/funcdef', trace=False, backend='no_such_backend')
+
+class test_lark_ql_codegen(test_lark_ql):
+    """The same tests, using the codegen backend"""
+
+    def setUp(self):
+        super().setUp()
+        # Traced queries always use the closure backend
+        logger.setLevel(WARNING)
+        LarkQuery.default_backend = 'codegen'
+
+    def tearDown(self):
+        LarkQuery.default_backend = 'closure'
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,67 @@
+from collections import deque
+import os
+import more_itertools
+from .LarkQuery import LarkQuery
+from .LarkQuerySet import LarkQuerySet
+
+# Per worker process state, set up by _init_worker
+_worker_parser = None
+_worker_query = None
+
+def _compile(query_strs, trace):
+    if isinstance(query_strs, str):
+        return LarkQuery(query_strs, trace)
+    return LarkQuerySet(query_strs, trace)
+
+def _init_worker(parser_factory, query_strs, trace):
+    global _worker_parser, _worker_query
+    _worker_parser = parser_factory()
+    # Compiled queries are closures, so can't be pickled: recompile from the query string
+    _worker_query = _compile(query_strs, trace)
+
+def _execute_files(paths):
+    results = []
+    for path in paths:
+        with open(path, 'r') as f:
+            tree = _worker_parser.parse(f.read())
+        results.append((path, _worker_query.execute(tree)))
+    return results
+
+class LarkCorpusExecutor():
+    """Parses and queries many files in parallel, using a process pool.
+
+    Each worker process creates its own parser & compiles its own copy of the query.
+    Query results must be picklable (Lark trees and tokens are)."""
+
+    def __init__(self, query_strs, parser_factory, workers=None, chunk_size=16, trace=None):
+        """
+        query_strs: a query string, or an iterable of query strings (run as a LarkQuerySet)
+        parser_factory: a picklable callable (E.g. a module level function) returning an object
+                        with a parse(text) method - usually a Lark instance
+        workers: number of worker processes. Defaults to the number of CPUs
+        chunk_size: number of files sent to a worker at a time
+        trace: as for LarkQuery
+        """
+        self._query_strs = query_strs if isinstance(query_strs, str) else list(query_strs)
+        # Compile here too, so bad queries raise now rather than breaking the worker processes
+        _compile(self._query_strs, trace)
+        self._parser_factory = parser_factory
+        self._workers = workers or os.cpu_count() or 1
+        self._chunk_size = chunk_size
+        self._trace = trace
+
+    def execute(self, paths):
+        """Generates (path, result) pairs, in the same order as paths. Results are
+        the same as LarkQuery.execute (or LarkQuerySet.execute) returns.
+        At most a few chunks per worker are in flight, so paths can be a lazy iterable"""
+        # Imported here, as it's slow to import & only needed for corpus runs
+        from concurrent.futures import ProcessPoolExecutor
+        with ProcessPoolExecutor(max_workers=self._workers, initializer=_init_worker, 
+                                 initargs=(self._parser_factory, self._query_strs, self._trace)) as executor:
+            pending = deque()
+            for chunk in more_itertools.chunked(paths, self._chunk_size):
+                pending.append(executor.submit(_execute_files, chunk))
+                if len(pending) >= 2*self._workers:
+                    yield from pending.popleft().result()
+            while pending:
+                yield from pending.popleft().result()
@@ -1,11 +1,144 @@
-from .tree_ql import create_tree_parser, query_context
+import functools
+import logging
+import more_itertools
+import weakref
+from .tree_ql import create_tree_parser, query_context, to_result
+from .tree_index import tree_index
+from .rule_reachability import rule_reachability
+from .step_profile import step_profile
+from .utils import logger
+
+_DEFAULT_CACHE_SIZE = 256
 
 class LarkQuery():
+    # Used when no backend is specified
+    default_backend = 'closure'
     _query_parser = create_tree_parser('data', 'children')
+    _traced_query_parser = create_tree_parser('data', 'children', trace=True)
+    _profiled_query_parser = create_tree_parser('data', 'children', profile=True)
+    # Steps that can never match, per grammar (rule_reachability) and query string
+    _unmatchable_steps = weakref.WeakKeyDictionary()
+
+    def __init__(self, query_str, trace=None, optimize=True, backend=None, grammar=None):
+        """
+        trace: compile a query that logs each step as it executes. 
+        If None, tracing is on only if the tree_ql logger is enabled for DEBUG
+        optimize: optimize the query plan before compiling it. 
+        Turn off to execute the query exactly as written
+        backend: 'closure' compiles to a chain of functions. 'codegen' compiles 
+        to generated Python code, which is faster. Defaults to default_backend.
+        Traced queries, and queries codegen doesn't support, use 'closure'
+        grammar: optional, the Lark parser the queried trees are parsed with (or its 
+        rule_reachability). Descendant name tests then skip subtrees whose rule can't
+        contain the name, and steps that can never match are logged as warnings
+        """
+        if trace is None:
+            trace = logger.isEnabledFor(logging.DEBUG)
+        backend = backend or self.__class__.default_backend
+        if trace:
+            backend = 'closure'
+        self._query_str = query_str
+        self._optimize = optimize
+        self._trace = trace
+        self._backend = backend
+        # Compiled queries are stateless, so can be shared between instances
+        self._compiled_query = self.__class__._compile(query_str, trace, optimize, backend)
+        self._grammar = rule_reachability.of(grammar)
+        if self._grammar is not None:
+            self.__class__._check_steps(query_str, self._grammar)
+
+    def execute(self, tree, index=None, variables=None):
+        """Returns None, a single item or a list of items.
+        index: optional, from create_index(tree). Speeds up descendant name tests (//foo).
+        Share one across queries on an unchanged tree; if none is given, queries that
+        need one (E.g. for the parent axis) build their own for each execution
+        variables: a mapping, the values of the query's variables. E.g. 
+        execute(tree, variables={'name': 'x'}) for //funcdef[@value==$name]. 
+        The compiled query is the same whatever the values"""
+        return to_result(self.iter_execute(tree, index, variables))
+
+    def iter_execute(self, tree, index=None, variables=None):
+        """Returns a generator over the query results. The tree is only walked as far
+        as is needed to produce each result"""
+        yield from self._compiled_query(self._context(tree, index, variables)).working_set
+
+    def exists(self, tree, index=None, variables=None):
+        """True if the query matches anything. Stops at the first match"""
+        return bool(self._compiled_query(self._context(tree, index, variables)))
+
+    def count(self, tree, index=None, variables=None):
+        """The number of query results. They are counted as they are generated, 
+        without building a list"""
+        return more_itertools.ilen(self.iter_execute(tree, index, variables))
+
+    def first(self, tree, default=None, index=None, variables=None):
+        """The first query result, or default if there are none. Stops at the first match"""
+        return next(self.iter_execute(tree, index, variables), default)
+
+    def explain(self, tree, index=None, variables=None):
+        """Execute the query, recording statistics for each of its compiled steps.
+        Returns a step_profile for the whole query (print it for a table), whose steps
+        are the query's steps, each with its own nested steps & predicates.
+
+        The query is compiled afresh by the closure backend, with profiling wrappers,
+        so costs about a compile plus twice the execution time: cheap enough to sample
+        executions. Queries without explain are not affected"""
+        compiled_query = self.__class__._profiled_query_parser.parse(self._query_str, self._optimize)
+        profile = step_profile(self._query_str)
+        profile.steps = compiled_query.tree_ql_profiles
+        for _ in profile.step(compiled_query)(self._context(tree, index, variables, compiled_query)).working_set:
+            pass
+        return profile
+
+    def _context(self, tree, index, variables, compiled_query=None, working_set=None):
+        compiled_query = compiled_query or self._compiled_query
+        if index is not None and not isinstance(index, tree_index):
+            raise TypeError(f'index must be a tree_index, from create_index(tree), not {type(index).__name__}')
+        variables = {} if variables is None else variables
+        unbound = compiled_query.tree_ql_variables - variables.keys()
+        if unbound:
+            raise ValueError(f'{self._query_str}: no value for ' + ', '.join(f'${name}' for name in sorted(unbound)))
+        if index is None and compiled_query.tree_ql_needs_index:
+            # Parent, ancestor, sibling, ... axes navigate using an index
+            index = self.create_index(tree)
+        return query_context(tree, [tree] if working_set is None else working_set, index, self._grammar, variables=variables)
+
+    @staticmethod
+    def create_index(tree):
+        """Create an index for a Lark tree, to share across queries on that tree. 
+        It is built on first use"""
+        return tree_index(tree, 'data', 'children')
+
+    @classmethod
+    def set_cache_size(cls, maxsize):
+        """Resize the compiled query cache. This clears the cache.
+        maxsize=None is unbounded, maxsize=0 disables caching"""
+        cls._compile = staticmethod(functools.lru_cache(maxsize=maxsize)(cls._parse))
+
+    @classmethod
+    def cache_info(cls):
+        """Compiled query cache statistics: (hits, misses, maxsize, currsize)"""
+        return cls._compile.cache_info()
+
+    @classmethod
+    def cache_clear(cls):
+        """Empty the compiled query cache and reset the statistics"""
+        cls._compile.cache_clear()
+        cls._unmatchable_steps.clear()
+
+    @classmethod
+    def _check_steps(cls, query_str, grammar):
+        """Warn about the query's steps that can never match in trees from grammar.
+        Checked (and warned about) once per query & grammar, not per LarkQuery"""
+        checked = cls._unmatchable_steps.setdefault(grammar, {})
+        if query_str not in checked:
+            checked[query_str] = grammar.unmatchable_steps(cls._query_parser.plan(query_str))
+            for step in checked[query_str]:
+                logger.warning(f'{query_str}: {step} can never match')
 
-    def __init__(self, query_str):
-        self._compiled_query = self.__class__._query_parser.parse(query_str)
+    @classmethod
+    def _parse(cls, query_str, trace, optimize, backend):
+        parser = cls._traced_query_parser if trace else cls._query_parser
+        return parser.parse(query_str, optimize, backend)
 
-    def execute(self, tree):
-        return self._compiled_query(query_context(tree, [tree])) 
-        
\ No newline at end of file
+LarkQuery.set_cache_size(_DEFAULT_CACHE_SIZE)
@@ -0,0 +1,113 @@
+from .LarkQuery import LarkQuery
+from .tree_ql import to_result
+from .tree_index import EMPTY
+
+class LarkQuerySet():
+    """Runs many queries against the same tree.
+
+    The tree is traversed once, to build a tree_index. Queries made of name tests 
+    (//foo, /foo//bar[.//baz], ...) look up the nodes they need from the index, so
+    their cost grows with the number of nodes they match, not with the size of the tree.
+
+    Queries that start by testing every node (E.g. //*[@type=="NAME"]/.., //leaf()) 
+    share a single pass over the index, in document order, which sends each node to
+    the queries it matches. Nodes are looked up by the step's equality tests 
+    (@type=="NAME" and @value=="x"), so most queries aren't tested against most 
+    nodes. The rest of each query is then applied to its matches. Other queries that test every node 
+    below some other node (E.g. /funcdef//*[@value=="x"]) still scan their part of 
+    the tree, as do all queries when tracing"""
+
+    def __init__(self, query_strs, trace=None, grammar=None):
+        """
+        query_strs: an iterable of query strings
+        trace, grammar: as for LarkQuery
+        """
+        self._queries = [LarkQuery(query_str, trace, grammar=grammar) for query_str in query_strs]
+        # Queries starting with a scan of the whole tree: query position -> _scan_step
+        self._scans = {}
+        for position, query in enumerate(self._queries):
+            if not query._trace:
+                scan = LarkQuery._query_parser.split_scan(query._query_str, query._backend)
+                if scan is not None:
+                    self._scans[position] = scan
+        # Scans by key: attributes -> {values: [(position, kind, test)]}, and scans without one
+        self._keyed = {}
+        self._unkeyed = []
+        for position, scan in self._scans.items():
+            if scan.key is None:
+                self._unkeyed.append((position, scan.kind, scan.test))
+            else:
+                attributes, values = scan.key
+                self._keyed.setdefault(attributes, {}).setdefault(values, []).append((position, scan.kind, scan.test))
+
+    def __len__(self):
+        return len(self._queries)
+
+    def execute(self, tree, index=None, variables=None):
+        """Returns a list with one result per query, in the same order as the queries.
+        Each result is the same as LarkQuery.execute would return.
+        index: optional, from LarkQuery.create_index(tree). If not supplied, one is built
+        for this execution and shared by its queries
+        variables: the values of the queries' variables, as for LarkQuery.execute"""
+        return list(self.iter_execute(tree, index, variables))
+
+    def iter_execute(self, tree, index=None, variables=None):
+        """Generates one result per query, in the same order as the queries"""
+        if index is None:
+            index = LarkQuery.create_index(tree)
+        matches = self._scan(tree, index) if self._scans else {}
+        for position, query in enumerate(self._queries):
+            scan = self._scans.get(position)
+            if scan is None:
+                yield query.execute(tree, index, variables)
+            elif scan.rest is None:
+                yield to_result(iter(matches[position]))
+            else:
+                context = query._context(tree, index, variables, scan.rest, matches[position])
+                yield to_result(scan.rest(context).working_set)
+
+    def _scan(self, tree, index):
+        """One pass over the tree, in document order: {query position: the items its scan matches}"""
+        matches = {position: [] for position in self._scans}
+        keyed = list(self._keyed.items())
+        unkeyed = self._unkeyed
+
+        span = index.span(tree)
+        if span is None:
+            # Not the indexed tree: an index of its own
+            index = LarkQuery.create_index(tree)
+            span = index.span(tree)
+        start, end = span
+        items, kinds = index.items, index.kinds
+        for position, scan in self._scans.items():
+            if scan.or_self and _matches(scan, tree, kinds[start]):
+                matches[position].append(tree)
+
+        for item_position in range(start+1, end):
+            kind = kinds[item_position]
+            if kind==EMPTY:
+                continue
+            item = items[item_position]
+            for attributes, routes in keyed:
+                try:
+                    candidates = routes.get(tuple(getattr(item, attribute, None) for attribute in attributes))
+                except TypeError:
+                    # Unhashable: equal to no literal
+                    continue
+                if candidates:
+                    for position, scan_kind, test in candidates:
+                        if (scan_kind is None or scan_kind==kind) and (test is None or test(item)):
+                            matches[position].append(item)
+            for position, scan_kind, test in unkeyed:
+                if (scan_kind is None or scan_kind==kind) and (test is None or test(item)):
+                    matches[position].append(item)
+        return matches
+
+def _matches(scan, item, kind):
+    if kind==EMPTY or scan.kind is not None and scan.kind!=kind:
+        return False
+    if scan.key is not None:
+        attributes, values = scan.key
+        if any(getattr(item, attribute, None)!=value for attribute, value in zip(attributes, values)):
+            return False
+    return scan.test is None or scan.test(item)
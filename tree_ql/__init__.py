@@ -1,2 +1,7 @@
 from .LarkQuery import LarkQuery
+from .LarkQuerySet import LarkQuerySet
+from .LarkCorpusExecutor import LarkCorpusExecutor
+from .tree_index import tree_index
+from .rule_reachability import rule_reachability
+from .step_profile import step_profile
 from .utils import logger
\ No newline at end of file
@@ -0,0 +1,5209 @@
+# Generated by "python -m tree_ql.build_parser" from tree_ql.lark. Do not edit
+LARK_VERSION = '0.12.0'
+GRAMMAR_HASH = 'b38923d89fc5d92fdc4646b59aeccc764e3908ff8f7030a1850ab36bae60f3d0'
+DATA = {'__type__': 'Lark',
+ 'options': {'ambiguity': 'auto',
+             'cache': False,
+             'debug': False,
+             'edit_terminals': None,
+             'g_regex_flags': 0,
+             'import_paths': [],
+             'keep_all_tokens': False,
+             'lexer': 'contextual',
+             'lexer_callbacks': {},
+             'maybe_placeholders': True,
+             'parser': 'lalr',
+             'postlex': None,
+             'priority': 'normal',
+             'propagate_positions': False,
+             'regex': False,
+             'source_path': None,
+             'start': ['start'],
+             'transformer': None,
+             'tree_class': None,
+             'use_bytes': False},
+ 'parser': {'__type__': 'ParsingFrontend',
+            'lexer_conf': {'__type__': 'LexerConf',
+                           'g_regex_flags': 0,
+                           'ignore': ['WS_INLINE'],
+                           'lexer_type': 'contextual',
+                           'terminals': [{'@': 0},
+                                         {'@': 1},
+                                         {'@': 2},
+                                         {'@': 3},
+                                         {'@': 4},
+                                         {'@': 5},
+                                         {'@': 6},
+                                         {'@': 7},
+                                         {'@': 8},
+                                         {'@': 9},
+                                         {'@': 10},
+                                         {'@': 11},
+                                         {'@': 12},
+                                         {'@': 13},
+                                         {'@': 14},
+                                         {'@': 15},
+                                         {'@': 16},
+                                         {'@': 17},
+                                         {'@': 18},
+                                         {'@': 19},
+                                         {'@': 20},
+                                         {'@': 21},
+                                         {'@': 22},
+                                         {'@': 23},
+                                         {'@': 24},
+                                         {'@': 25},
+                                         {'@': 26},
+                                         {'@': 27},
+                                         {'@': 28},
+                                         {'@': 29},
+                                         {'@': 30},
+                                         {'@': 31},
+                                         {'@': 32},
+                                         {'@': 33},
+                                         {'@': 34},
+                                         {'@': 35},
+                                         {'@': 36},
+                                         {'@': 37},
+                                         {'@': 38},
+                                         {'@': 39},
+                                         {'@': 40},
+                                         {'@': 41},
+                                         {'@': 42},
+                                         {'@': 43},
+                                         {'@': 44},
+                                         {'@': 45}],
+                           'use_bytes': False},
+            'options': {'ambiguity': 'auto',
+                        'cache': False,
+                        'debug': False,
+                        'edit_terminals': None,
+                        'g_regex_flags': 0,
+                        'import_paths': [],
+                        'keep_all_tokens': False,
+                        'lexer': 'contextual',
+                        'lexer_callbacks': {},
+                        'maybe_placeholders': True,
+                        'parser': 'lalr',
+                        'postlex': None,
+                        'priority': 'normal',
+                        'propagate_positions': False,
+                        'regex': False,
+                        'source_path': None,
+                        'start': ['start'],
+                        'transformer': None,
+                        'tree_class': None,
+                        'use_bytes': False},
+            'parser': {'end_states': {'start': 44},
+                       'start_states': {'start': 0},
+                       'states': {0: {2: (0, 1),
+                                      3: (0, 2),
+                                      5: (1, {'@': 75}),
+                                      6: (0, 3),
+                                      7: (1, {'@': 74}),
+                                      11: (0, 4),
+                                      12: (0, 5),
+                                      15: (0, 6),
+                                      16: (0, 7),
+                                      17: (0, 8),
+                                      20: (1, {'@': 74}),
+                                      25: (1, {'@': 74}),
+                                      26: (1, {'@': 74}),
+                                      34: (0, 9),
+                                      35: (0, 10),
+                                      36: (0, 11),
+                                      39: (0, 12),
+                                      40: (0, 13),
+                                      43: (0, 14),
+                                      44: (0, 15),
+                                      50: (0, 16),
+                                      51: (0, 17),
+                                      56: (0, 18),
+                                      57: (0, 19),
+                                      58: (0, 20),
+                                      59: (0, 21),
+                                      61: (0, 22),
+                                      62: (0, 23),
+                                      64: (0, 24),
+                                      65: (0, 25),
+                                      67: (0, 26),
+                                      68: (0, 27),
+                                      72: (0, 28),
+                                      73: (0, 29),
+                                      75: (0, 30),
+                                      76: (0, 31),
+                                      77: (0, 32),
+                                      78: (0, 33),
+                                      82: (0, 34),
+                                      83: (0, 35),
+                                      90: (0, 36),
+                                      91: (0, 37),
+                                      96: (0, 38),
+                                      98: (0, 39),
+                                      101: (0, 40),
+                                      102: (0, 41),
+                                      107: (0, 42),
+                                      108: (0, 43),
+                                      110: (0, 44)},
+                                  1: {45: (1, {'@': 94})},
+                                  2: {45: (1, {'@': 95})},
+                                  3: {45: (1, {'@': 89})},
+                                  4: {45: (1, {'@': 90})},
+                                  5: {45: (1, {'@': 91})},
+                                  6: {0: (1, {'@': 70}),
+                                      1: (1, {'@': 70}),
+                                      4: (1, {'@': 70}),
+                                      9: (1, {'@': 70}),
+                                      13: (1, {'@': 70}),
+                                      23: (1, {'@': 70}),
+                                      24: (1, {'@': 70}),
+                                      25: (1, {'@': 70}),
+                                      27: (1, {'@': 70}),
+                                      28: (1, {'@': 70}),
+                                      29: (1, {'@': 70}),
+                                      30: (1, {'@': 70}),
+                                      31: (1, {'@': 70}),
+                                      32: (1, {'@': 70}),
+                                      33: (1, {'@': 70}),
+                                      37: (1, {'@': 70}),
+                                      38: (1, {'@': 70}),
+                                      40: (1, {'@': 70}),
+                                      42: (1, {'@': 70}),
+                                      43: (1, {'@': 70})},
+                                  7: {45: (1, {'@': 96})},
+                                  8: {45: (1, {'@': 97})},
+                                  9: {45: (1, {'@': 93})},
+                                  10: {45: (1, {'@': 98})},
+                                  11: {45: (1, {'@': 99})},
+                                  12: {45: (1, {'@': 92})},
+                                  13: {2: (0, 1),
+                                       3: (0, 2),
+                                       5: (1, {'@': 75}),
+                                       6: (0, 3),
+                                       7: (1, {'@': 74}),
+                                       11: (0, 4),
+                                       12: (0, 5),
+                                       15: (0, 6),
+                                       16: (0, 7),
+                                       17: (0, 8),
+                                       20: (1, {'@': 74}),
+                                       25: (1, {'@': 74}),
+                                       26: (1, {'@': 74}),
+                                       34: (0, 9),
+                                       35: (0, 10),
+                                       36: (0, 11),
+                                       39: (0, 12),
+                                       44: (0, 15),
+                                       50: (0, 16),
+                                       51: (0, 17),
+                                       56: (0, 18),
+                                       57: (0, 19),
+                                       58: (0, 20),
+                                       59: (0, 45),
+                                       64: (0, 24),
+                                       67: (0, 26),
+                                       68: (0, 27),
+                                       72: (0, 28),
+                                       75: (0, 30),
+                                       76: (0, 31),
+                                       77: (0, 32),
+                                       82: (0, 34),
+                                       83: (0, 35),
+                                       96: (0, 38),
+                                       98: (0, 39),
+                                       101: (0, 40),
+                                       102: (0, 41),
+                                       108: (0, 43)},
+                                  14: {2: (0, 1),
+                                       3: (0, 2),
+                                       5: (1, {'@': 75}),
+                                       6: (0, 3),
+                                       7: (1, {'@': 74}),
+                                       11: (0, 4),
+                                       12: (0, 5),
+                                       15: (0, 6),
+                                       16: (0, 7),
+                                       17: (0, 8),
+                                       20: (1, {'@': 74}),
+                                       25: (1, {'@': 74}),
+                                       26: (1, {'@': 74}),
+                                       34: (0, 9),
+                                       35: (0, 10),
+                                       36: (0, 11),
+                                       39: (0, 12),
+                                       44: (0, 15),
+                                       50: (0, 16),
+                                       51: (0, 17),
+                                       56: (0, 18),
+                                       57: (0, 19),
+                                       58: (0, 20),
+                                       59: (0, 46),
+                                       64: (0, 24),
+                                       67: (0, 26),
+                                       68: (0, 27),
+                                       72: (0, 28),
+                                       75: (0, 30),
+                                       76: (0, 31),
+                                       77: (0, 32),
+                                       82: (0, 34),
+                                       83: (0, 35),
+                                       96: (0, 38),
+                                       98: (0, 39),
+                                       101: (0, 40),
+                                       102: (0, 41),
+                                       108: (0, 43)},
+                                  15: {0: (1, {'@': 71}),
+                                       1: (1, {'@': 71}),
+                                       4: (1, {'@': 71}),
+                                       9: (1, {'@': 71}),
+                                       13: (1, {'@': 71}),
+                                       23: (1, {'@': 71}),
+                                       24: (1, {'@': 71}),
+                                       25: (1, {'@': 71}),
+                                       27: (1, {'@': 71}),
+                                       28: (1, {'@': 71}),
+                                       29: (1, {'@': 71}),
+                                       30: (1, {'@': 71}),
+                                       31: (1, {'@': 71}),
+                                       32: (1, {'@': 71}),
+                                       33: (1, {'@': 71}),
+                                       37: (1, {'@': 71}),
+                                       38: (1, {'@': 71}),
+                                       40: (1, {'@': 71}),
+                                       42: (1, {'@': 71}),
+                                       43: (1, {'@': 71})},
+                                  16: {45: (0, 47)},
+                                  17: {7: (0, 48),
+                                       20: (0, 49),
+                                       25: (0, 50),
+                                       26: (0, 51),
+                                       63: (0, 52),
+                                       88: (0, 53),
+                                       89: (0, 54),
+                                       93: (0, 55),
+                                       94: (0, 56),
+                                       95: (0, 57),
+                                       113: (0, 58),
+                                       117: (0, 59)},
+                                  18: {0: (1, {'@': 64}),
+                                       1: (1, {'@': 64}),
+                                       4: (1, {'@': 64}),
+                                       9: (1, {'@': 64}),
+                                       13: (1, {'@': 64}),
+                                       23: (1, {'@': 64}),
+                                       24: (1, {'@': 64}),
+                                       25: (1, {'@': 64}),
+                                       27: (1, {'@': 64}),
+                                       28: (1, {'@': 64}),
+                                       29: (1, {'@': 64}),
+                                       30: (1, {'@': 64}),
+                                       31: (1, {'@': 64}),
+                                       32: (1, {'@': 64}),
+                                       33: (1, {'@': 64}),
+                                       37: (1, {'@': 64}),
+                                       38: (1, {'@': 64}),
+                                       40: (1, {'@': 64}),
+                                       42: (1, {'@': 64}),
+                                       43: (1, {'@': 64})},
+                                  19: {0: (1, {'@': 65}),
+                                       1: (1, {'@': 65}),
+                                       4: (1, {'@': 65}),
+                                       9: (1, {'@': 65}),
+                                       13: (1, {'@': 65}),
+                                       23: (1, {'@': 65}),
+                                       24: (1, {'@': 65}),
+                                       25: (1, {'@': 65}),
+                                       27: (1, {'@': 65}),
+                                       28: (1, {'@': 65}),
+                                       29: (1, {'@': 65}),
+                                       30: (1, {'@': 65}),
+                                       31: (1, {'@': 65}),
+                                       32: (1, {'@': 65}),
+                                       33: (1, {'@': 65}),
+                                       37: (1, {'@': 65}),
+                                       38: (1, {'@': 65}),
+                                       40: (1, {'@': 65}),
+                                       42: (1, {'@': 65}),
+                                       43: (1, {'@': 65})},
+                                  20: {0: (1, {'@': 63}),
+                                       1: (1, {'@': 63}),
+                                       4: (1, {'@': 63}),
+                                       9: (1, {'@': 63}),
+                                       13: (1, {'@': 63}),
+                                       23: (1, {'@': 63}),
+                                       24: (1, {'@': 63}),
+                                       25: (1, {'@': 63}),
+                                       27: (1, {'@': 63}),
+                                       28: (1, {'@': 63}),
+                                       29: (1, {'@': 63}),
+                                       30: (1, {'@': 63}),
+                                       31: (1, {'@': 63}),
+                                       32: (1, {'@': 63}),
+                                       33: (1, {'@': 63}),
+                                       37: (1, {'@': 63}),
+                                       38: (1, {'@': 63}),
+                                       40: (1, {'@': 63}),
+                                       42: (1, {'@': 63}),
+                                       43: (1, {'@': 63})},
+                                  21: {0: (1, {'@': 58}),
+                                       1: (1, {'@': 58}),
+                                       4: (1, {'@': 58}),
+                                       9: (1, {'@': 58}),
+                                       13: (1, {'@': 58}),
+                                       23: (1, {'@': 58}),
+                                       24: (1, {'@': 58}),
+                                       25: (1, {'@': 58}),
+                                       27: (1, {'@': 58}),
+                                       28: (1, {'@': 58}),
+                                       29: (1, {'@': 58}),
+                                       30: (1, {'@': 58}),
+                                       31: (1, {'@': 58}),
+                                       32: (1, {'@': 58}),
+                                       33: (1, {'@': 58}),
+                                       37: (1, {'@': 58}),
+                                       38: (1, {'@': 58}),
+                                       40: (0, 13),
+                                       42: (1, {'@': 58}),
+                                       43: (0, 14),
+                                       47: (0, 60),
+                                       73: (0, 61),
+                                       78: (0, 62),
+                                       111: (0, 63)},
+                                  22: {0: (1, {'@': 52}),
+                                       1: (1, {'@': 52}),
+                                       4: (1, {'@': 52}),
+                                       9: (1, {'@': 52}),
+                                       13: (1, {'@': 52}),
+                                       23: (1, {'@': 52}),
+                                       24: (1, {'@': 52}),
+                                       25: (1, {'@': 52}),
+                                       27: (1, {'@': 52}),
+                                       28: (1, {'@': 52}),
+                                       29: (1, {'@': 52}),
+                                       30: (1, {'@': 52}),
+                                       31: (1, {'@': 52}),
+                                       32: (1, {'@': 52}),
+                                       33: (1, {'@': 52}),
+                                       37: (1, {'@': 52}),
+                                       38: (1, {'@': 52}),
+                                       42: (1, {'@': 52})},
+                                  23: {0: (1, {'@': 51}),
+                                       1: (1, {'@': 51}),
+                                       4: (1, {'@': 51}),
+                                       9: (1, {'@': 51}),
+                                       13: (1, {'@': 51}),
+                                       23: (1, {'@': 51}),
+                                       24: (1, {'@': 51}),
+                                       25: (1, {'@': 51}),
+                                       27: (1, {'@': 51}),
+                                       28: (1, {'@': 51}),
+                                       29: (1, {'@': 51}),
+                                       30: (1, {'@': 51}),
+                                       31: (1, {'@': 51}),
+                                       32: (1, {'@': 51}),
+                                       33: (1, {'@': 51}),
+                                       37: (1, {'@': 51}),
+                                       38: (1, {'@': 51}),
+                                       42: (1, {'@': 51})},
+                                  24: {0: (1, {'@': 68}),
+                                       1: (1, {'@': 68}),
+                                       4: (1, {'@': 68}),
+                                       9: (1, {'@': 68}),
+                                       13: (1, {'@': 68}),
+                                       23: (1, {'@': 68}),
+                                       24: (1, {'@': 68}),
+                                       25: (1, {'@': 68}),
+                                       27: (1, {'@': 68}),
+                                       28: (1, {'@': 68}),
+                                       29: (1, {'@': 68}),
+                                       30: (1, {'@': 68}),
+                                       31: (1, {'@': 68}),
+                                       32: (1, {'@': 68}),
+                                       33: (1, {'@': 68}),
+                                       37: (1, {'@': 68}),
+                                       38: (1, {'@': 68}),
+                                       40: (1, {'@': 68}),
+                                       42: (1, {'@': 68}),
+                                       43: (1, {'@': 68})},
+                                  25: {0: (1, {'@': 50}),
+                                       1: (1, {'@': 50}),
+                                       4: (1, {'@': 50}),
+                                       9: (1, {'@': 50}),
+                                       13: (1, {'@': 50}),
+                                       23: (1, {'@': 50}),
+                                       24: (1, {'@': 50}),
+                                       25: (1, {'@': 50}),
+                                       27: (1, {'@': 50}),
+                                       28: (1, {'@': 50}),
+                                       29: (1, {'@': 50}),
+                                       30: (1, {'@': 50}),
+                                       31: (1, {'@': 50}),
+                                       32: (1, {'@': 50}),
+                                       33: (1, {'@': 50}),
+                                       37: (1, {'@': 50}),
+                                       38: (1, {'@': 50}),
+                                       42: (1, {'@': 50})},
+                                  26: {45: (1, {'@': 83})},
+                                  27: {45: (1, {'@': 84})},
+                                  28: {45: (1, {'@': 78})},
+                                  29: {0: (1, {'@': 54}),
+                                       1: (1, {'@': 54}),
+                                       4: (1, {'@': 54}),
+                                       9: (1, {'@': 54}),
+                                       13: (1, {'@': 54}),
+                                       23: (1, {'@': 54}),
+                                       24: (1, {'@': 54}),
+                                       25: (1, {'@': 54}),
+                                       27: (1, {'@': 54}),
+                                       28: (1, {'@': 54}),
+                                       29: (1, {'@': 54}),
+                                       30: (1, {'@': 54}),
+                                       31: (1, {'@': 54}),
+                                       32: (1, {'@': 54}),
+                                       33: (1, {'@': 54}),
+                                       37: (1, {'@': 54}),
+                                       38: (1, {'@': 54}),
+                                       40: (0, 13),
+                                       42: (1, {'@': 54}),
+                                       43: (0, 14),
+                                       47: (0, 64),
+                                       73: (0, 61),
+                                       78: (0, 62),
+                                       111: (0, 63)},
+                                  30: {7: (1, {'@': 73}), 20: (1, {'@': 73}), 25: (1, {'@': 73}), 26: (1, {'@': 73})},
+                                  31: {45: (1, {'@': 79})},
+                                  32: {45: (1, {'@': 80})},
+                                  33: {0: (1, {'@': 56}),
+                                       1: (1, {'@': 56}),
+                                       4: (1, {'@': 56}),
+                                       9: (1, {'@': 56}),
+                                       13: (1, {'@': 56}),
+                                       23: (1, {'@': 56}),
+                                       24: (1, {'@': 56}),
+                                       25: (1, {'@': 56}),
+                                       27: (1, {'@': 56}),
+                                       28: (1, {'@': 56}),
+                                       29: (1, {'@': 56}),
+                                       30: (1, {'@': 56}),
+                                       31: (1, {'@': 56}),
+                                       32: (1, {'@': 56}),
+                                       33: (1, {'@': 56}),
+                                       37: (1, {'@': 56}),
+                                       38: (1, {'@': 56}),
+                                       40: (0, 13),
+                                       42: (1, {'@': 56}),
+                                       43: (0, 14),
+                                       47: (0, 65),
+                                       73: (0, 61),
+                                       78: (0, 62),
+                                       111: (0, 63)},
+                                  34: {45: (1, {'@': 85})},
+                                  35: {45: (1, {'@': 86})},
+                                  36: {0: (1, {'@': 46}), 42: (0, 66), 48: (0, 67)},
+                                  37: {0: (1, {'@': 47})},
+                                  38: {5: (0, 68), 71: (0, 69)},
+                                  39: {45: (1, {'@': 82})},
+                                  40: {45: (1, {'@': 87})},
+                                  41: {45: (1, {'@': 88})},
+                                  42: {0: (1, {'@': 49}),
+                                       1: (1, {'@': 49}),
+                                       4: (1, {'@': 49}),
+                                       9: (1, {'@': 49}),
+                                       13: (1, {'@': 49}),
+                                       23: (1, {'@': 49}),
+                                       24: (1, {'@': 49}),
+                                       25: (1, {'@': 49}),
+                                       27: (1, {'@': 49}),
+                                       28: (1, {'@': 49}),
+                                       29: (1, {'@': 49}),
+                                       30: (1, {'@': 49}),
+                                       31: (1, {'@': 49}),
+                                       32: (1, {'@': 49}),
+                                       33: (1, {'@': 49}),
+                                       37: (1, {'@': 49}),
+                                       38: (1, {'@': 49}),
+                                       42: (1, {'@': 49})},
+                                  43: {45: (1, {'@': 81})},
+                                  44: {},
+                                  45: {0: (1, {'@': 61}),
+                                       1: (1, {'@': 61}),
+                                       4: (1, {'@': 61}),
+                                       9: (1, {'@': 61}),
+                                       13: (1, {'@': 61}),
+                                       23: (1, {'@': 61}),
+                                       24: (1, {'@': 61}),
+                                       25: (1, {'@': 61}),
+                                       27: (1, {'@': 61}),
+                                       28: (1, {'@': 61}),
+                                       29: (1, {'@': 61}),
+                                       30: (1, {'@': 61}),
+                                       31: (1, {'@': 61}),
+                                       32: (1, {'@': 61}),
+                                       33: (1, {'@': 61}),
+                                       37: (1, {'@': 61}),
+                                       38: (1, {'@': 61}),
+                                       40: (1, {'@': 61}),
+                                       42: (1, {'@': 61}),
+                                       43: (1, {'@': 61})},
+                                  46: {0: (1, {'@': 62}),
+                                       1: (1, {'@': 62}),
+                                       4: (1, {'@': 62}),
+                                       9: (1, {'@': 62}),
+                                       13: (1, {'@': 62}),
+                                       23: (1, {'@': 62}),
+                                       24: (1, {'@': 62}),
+                                       25: (1, {'@': 62}),
+                                       27: (1, {'@': 62}),
+                                       28: (1, {'@': 62}),
+                                       29: (1, {'@': 62}),
+                                       30: (1, {'@': 62}),
+                                       31: (1, {'@': 62}),
+                                       32: (1, {'@': 62}),
+                                       33: (1, {'@': 62}),
+                                       37: (1, {'@': 62}),
+                                       38: (1, {'@': 62}),
+                                       40: (1, {'@': 62}),
+                                       42: (1, {'@': 62}),
+                                       43: (1, {'@': 62})},
+                                  47: {7: (1, {'@': 72}), 20: (1, {'@': 72}), 25: (1, {'@': 72}), 26: (1, {'@': 72})},
+                                  48: {0: (1, {'@': 174}),
+                                       1: (1, {'@': 174}),
+                                       4: (1, {'@': 174}),
+                                       9: (1, {'@': 174}),
+                                       13: (1, {'@': 174}),
+                                       18: (1, {'@': 174}),
+                                       21: (1, {'@': 174}),
+                                       22: (1, {'@': 174}),
+                                       23: (1, {'@': 174}),
+                                       24: (1, {'@': 174}),
+                                       25: (1, {'@': 174}),
+                                       27: (1, {'@': 174}),
+                                       28: (1, {'@': 174}),
+                                       29: (1, {'@': 174}),
+                                       30: (1, {'@': 174}),
+                                       31: (1, {'@': 174}),
+                                       32: (1, {'@': 174}),
+                                       33: (1, {'@': 174}),
+                                       37: (1, {'@': 174}),
+                                       38: (1, {'@': 174}),
+                                       40: (1, {'@': 174}),
+                                       42: (1, {'@': 174}),
+                                       43: (1, {'@': 174})},
+                                  49: {21: (1, {'@': 146})},
+                                  50: {0: (1, {'@': 143}),
+                                       1: (1, {'@': 143}),
+                                       4: (1, {'@': 143}),
+                                       9: (1, {'@': 143}),
+                                       13: (1, {'@': 143}),
+                                       18: (1, {'@': 143}),
+                                       22: (1, {'@': 143}),
+                                       23: (1, {'@': 143}),
+                                       24: (1, {'@': 143}),
+                                       25: (1, {'@': 143}),
+                                       27: (1, {'@': 143}),
+                                       28: (1, {'@': 143}),
+                                       29: (1, {'@': 143}),
+                                       30: (1, {'@': 143}),
+                                       31: (1, {'@': 143}),
+                                       32: (1, {'@': 143}),
+                                       33: (1, {'@': 143}),
+                                       37: (1, {'@': 143}),
+                                       38: (1, {'@': 143}),
+                                       40: (1, {'@': 143}),
+                                       42: (1, {'@': 143}),
+                                       43: (1, {'@': 143})},
+                                  51: {21: (1, {'@': 147})},
+                                  52: {0: (1, {'@': 142}),
+                                       1: (1, {'@': 142}),
+                                       4: (1, {'@': 142}),
+                                       9: (1, {'@': 142}),
+                                       13: (1, {'@': 142}),
+                                       18: (1, {'@': 142}),
+                                       22: (1, {'@': 142}),
+                                       23: (1, {'@': 142}),
+                                       24: (1, {'@': 142}),
+                                       25: (1, {'@': 142}),
+                                       27: (1, {'@': 142}),
+                                       28: (1, {'@': 142}),
+                                       29: (1, {'@': 142}),
+                                       30: (1, {'@': 142}),
+                                       31: (1, {'@': 142}),
+                                       32: (1, {'@': 142}),
+                                       33: (1, {'@': 142}),
+                                       37: (1, {'@': 142}),
+                                       38: (1, {'@': 142}),
+                                       40: (1, {'@': 142}),
+                                       42: (1, {'@': 142}),
+                                       43: (1, {'@': 142})},
+                                  53: {0: (1, {'@': 138}),
+                                       1: (1, {'@': 138}),
+                                       4: (1, {'@': 138}),
+                                       9: (1, {'@': 138}),
+                                       13: (1, {'@': 138}),
+                                       18: (1, {'@': 138}),
+                                       22: (1, {'@': 138}),
+                                       23: (1, {'@': 138}),
+                                       24: (1, {'@': 138}),
+                                       25: (1, {'@': 138}),
+                                       27: (1, {'@': 138}),
+                                       28: (1, {'@': 138}),
+                                       29: (1, {'@': 138}),
+                                       30: (1, {'@': 138}),
+                                       31: (1, {'@': 138}),
+                                       32: (1, {'@': 138}),
+                                       33: (1, {'@': 138}),
+                                       37: (1, {'@': 138}),
+                                       38: (1, {'@': 138}),
+                                       40: (1, {'@': 138}),
+                                       42: (1, {'@': 138}),
+                                       43: (1, {'@': 138})},
+                                  54: {21: (0, 70)},
+                                  55: {0: (1, {'@': 139}),
+                                       1: (1, {'@': 139}),
+                                       4: (1, {'@': 139}),
+                                       9: (1, {'@': 139}),
+                                       13: (1, {'@': 139}),
+                                       18: (1, {'@': 139}),
+                                       22: (1, {'@': 139}),
+                                       23: (1, {'@': 139}),
+                                       24: (1, {'@': 139}),
+                                       25: (1, {'@': 139}),
+                                       27: (1, {'@': 139}),
+                                       28: (1, {'@': 139}),
+                                       29: (1, {'@': 139}),
+                                       30: (1, {'@': 139}),
+                                       31: (1, {'@': 139}),
+                                       32: (1, {'@': 139}),
+                                       33: (1, {'@': 139}),
+                                       37: (1, {'@': 139}),
+                                       38: (1, {'@': 139}),
+                                       40: (1, {'@': 139}),
+                                       42: (1, {'@': 139}),
+                                       43: (1, {'@': 139})},
+                                  56: {21: (0, 71)},
+                                  57: {0: (1, {'@': 67}),
+                                       1: (1, {'@': 67}),
+                                       4: (1, {'@': 67}),
+                                       9: (1, {'@': 67}),
+                                       13: (1, {'@': 67}),
+                                       18: (0, 72),
+                                       22: (0, 73),
+                                       23: (1, {'@': 67}),
+                                       24: (1, {'@': 67}),
+                                       25: (1, {'@': 67}),
+                                       27: (1, {'@': 67}),
+                                       28: (1, {'@': 67}),
+                                       29: (1, {'@': 67}),
+                                       30: (1, {'@': 67}),
+                                       31: (1, {'@': 67}),
+                                       32: (1, {'@': 67}),
+                                       33: (1, {'@': 67}),
+                                       37: (1, {'@': 67}),
+                                       38: (1, {'@': 67}),
+                                       40: (1, {'@': 67}),
+                                       42: (1, {'@': 67}),
+                                       43: (1, {'@': 67}),
+                                       46: (0, 74),
+                                       53: (0, 75),
+                                       86: (0, 76),
+                                       103: (0, 77)},
+                                  58: {0: (1, {'@': 140}),
+                                       1: (1, {'@': 140}),
+                                       4: (1, {'@': 140}),
+                                       9: (1, {'@': 140}),
+                                       13: (1, {'@': 140}),
+                                       18: (1, {'@': 140}),
+                                       22: (1, {'@': 140}),
+                                       23: (1, {'@': 140}),
+                                       24: (1, {'@': 140}),
+                                       25: (1, {'@': 140}),
+                                       27: (1, {'@': 140}),
+                                       28: (1, {'@': 140}),
+                                       29: (1, {'@': 140}),
+                                       30: (1, {'@': 140}),
+                                       31: (1, {'@': 140}),
+                                       32: (1, {'@': 140}),
+                                       33: (1, {'@': 140}),
+                                       37: (1, {'@': 140}),
+                                       38: (1, {'@': 140}),
+                                       40: (1, {'@': 140}),
+                                       42: (1, {'@': 140}),
+                                       43: (1, {'@': 140})},
+                                  59: {0: (1, {'@': 141}),
+                                       1: (1, {'@': 141}),
+                                       4: (1, {'@': 141}),
+                                       9: (1, {'@': 141}),
+                                       13: (1, {'@': 141}),
+                                       18: (1, {'@': 141}),
+                                       22: (1, {'@': 141}),
+                                       23: (1, {'@': 141}),
+                                       24: (1, {'@': 141}),
+                                       25: (1, {'@': 141}),
+                                       27: (1, {'@': 141}),
+                                       28: (1, {'@': 141}),
+                                       29: (1, {'@': 141}),
+                                       30: (1, {'@': 141}),
+                                       31: (1, {'@': 141}),
+                                       32: (1, {'@': 141}),
+                                       33: (1, {'@': 141}),
+                                       37: (1, {'@': 141}),
+                                       38: (1, {'@': 141}),
+                                       40: (1, {'@': 141}),
+                                       42: (1, {'@': 141}),
+                                       43: (1, {'@': 141})},
+                                  60: {0: (1, {'@': 57}),
+                                       1: (1, {'@': 57}),
+                                       4: (1, {'@': 57}),
+                                       9: (1, {'@': 57}),
+                                       13: (1, {'@': 57}),
+                                       23: (1, {'@': 57}),
+                                       24: (1, {'@': 57}),
+                                       25: (1, {'@': 57}),
+                                       27: (1, {'@': 57}),
+                                       28: (1, {'@': 57}),
+                                       29: (1, {'@': 57}),
+                                       30: (1, {'@': 57}),
+                                       31: (1, {'@': 57}),
+                                       32: (1, {'@': 57}),
+                                       33: (1, {'@': 57}),
+                                       37: (1, {'@': 57}),
+                                       38: (1, {'@': 57}),
+                                       40: (0, 13),
+                                       42: (1, {'@': 57}),
+                                       43: (0, 14),
+                                       73: (0, 61),
+                                       78: (0, 62),
+                                       111: (0, 78)},
+                                  61: {0: (1, {'@': 59}),
+                                       1: (1, {'@': 59}),
+                                       4: (1, {'@': 59}),
+                                       9: (1, {'@': 59}),
+                                       13: (1, {'@': 59}),
+                                       23: (1, {'@': 59}),
+                                       24: (1, {'@': 59}),
+                                       25: (1, {'@': 59}),
+                                       27: (1, {'@': 59}),
+                                       28: (1, {'@': 59}),
+                                       29: (1, {'@': 59}),
+                                       30: (1, {'@': 59}),
+                                       31: (1, {'@': 59}),
+                                       32: (1, {'@': 59}),
+                                       33: (1, {'@': 59}),
+                                       37: (1, {'@': 59}),
+                                       38: (1, {'@': 59}),
+                                       40: (1, {'@': 59}),
+                                       42: (1, {'@': 59}),
+                                       43: (1, {'@': 59})},
+                                  62: {0: (1, {'@': 60}),
+                                       1: (1, {'@': 60}),
+                                       4: (1, {'@': 60}),
+                                       9: (1, {'@': 60}),
+                                       13: (1, {'@': 60}),
+                                       23: (1, {'@': 60}),
+                                       24: (1, {'@': 60}),
+                                       25: (1, {'@': 60}),
+                                       27: (1, {'@': 60}),
+                                       28: (1, {'@': 60}),
+                                       29: (1, {'@': 60}),
+                                       30: (1, {'@': 60}),
+                                       31: (1, {'@': 60}),
+                                       32: (1, {'@': 60}),
+                                       33: (1, {'@': 60}),
+                                       37: (1, {'@': 60}),
+                                       38: (1, {'@': 60}),
+                                       40: (1, {'@': 60}),
+                                       42: (1, {'@': 60}),
+                                       43: (1, {'@': 60})},
+                                  63: {0: (1, {'@': 177}),
+                                       1: (1, {'@': 177}),
+                                       4: (1, {'@': 177}),
+                                       9: (1, {'@': 177}),
+                                       13: (1, {'@': 177}),
+                                       23: (1, {'@': 177}),
+                                       24: (1, {'@': 177}),
+                                       25: (1, {'@': 177}),
+                                       27: (1, {'@': 177}),
+                                       28: (1, {'@': 177}),
+                                       29: (1, {'@': 177}),
+                                       30: (1, {'@': 177}),
+                                       31: (1, {'@': 177}),
+                                       32: (1, {'@': 177}),
+                                       33: (1, {'@': 177}),
+                                       37: (1, {'@': 177}),
+                                       38: (1, {'@': 177}),
+                                       40: (1, {'@': 177}),
+                                       42: (1, {'@': 177}),
+                                       43: (1, {'@': 177})},
+                                  64: {0: (1, {'@': 53}),
+                                       1: (1, {'@': 53}),
+                                       4: (1, {'@': 53}),
+                                       9: (1, {'@': 53}),
+                                       13: (1, {'@': 53}),
+                                       23: (1, {'@': 53}),
+                                       24: (1, {'@': 53}),
+                                       25: (1, {'@': 53}),
+                                       27: (1, {'@': 53}),
+                                       28: (1, {'@': 53}),
+                                       29: (1, {'@': 53}),
+                                       30: (1, {'@': 53}),
+                                       31: (1, {'@': 53}),
+                                       32: (1, {'@': 53}),
+                                       33: (1, {'@': 53}),
+                                       37: (1, {'@': 53}),
+                                       38: (1, {'@': 53}),
+                                       40: (0, 13),
+                                       42: (1, {'@': 53}),
+                                       43: (0, 14),
+                                       73: (0, 61),
+                                       78: (0, 62),
+                                       111: (0, 78)},
+                                  65: {0: (1, {'@': 55}),
+                                       1: (1, {'@': 55}),
+                                       4: (1, {'@': 55}),
+                                       9: (1, {'@': 55}),
+                                       13: (1, {'@': 55}),
+                                       23: (1, {'@': 55}),
+                                       24: (1, {'@': 55}),
+                                       25: (1, {'@': 55}),
+                                       27: (1, {'@': 55}),
+                                       28: (1, {'@': 55}),
+                                       29: (1, {'@': 55}),
+                                       30: (1, {'@': 55}),
+                                       31: (1, {'@': 55}),
+                                       32: (1, {'@': 55}),
+                                       33: (1, {'@': 55}),
+                                       37: (1, {'@': 55}),
+                                       38: (1, {'@': 55}),
+                                       40: (0, 13),
+                                       42: (1, {'@': 55}),
+                                       43: (0, 14),
+                                       73: (0, 61),
+                                       78: (0, 62),
+                                       111: (0, 78)},
+                                  66: {2: (0, 1),
+                                       3: (0, 2),
+                                       5: (1, {'@': 75}),
+                                       6: (0, 3),
+                                       7: (1, {'@': 74}),
+                                       11: (0, 4),
+                                       12: (0, 5),
+                                       15: (0, 6),
+                                       16: (0, 7),
+                                       17: (0, 8),
+                                       20: (1, {'@': 74}),
+                                       25: (1, {'@': 74}),
+                                       26: (1, {'@': 74}),
+                                       34: (0, 9),
+                                       35: (0, 10),
+                                       36: (0, 11),
+                                       39: (0, 12),
+                                       40: (0, 13),
+                                       43: (0, 14),
+                                       44: (0, 15),
+                                       50: (0, 16),
+                                       51: (0, 17),
+                                       56: (0, 18),
+                                       57: (0, 19),
+                                       58: (0, 20),
+                                       59: (0, 21),
+                                       61: (0, 22),
+                                       62: (0, 23),
+                                       64: (0, 24),
+                                       65: (0, 25),
+                                       67: (0, 26),
+                                       68: (0, 27),
+                                       72: (0, 28),
+                                       73: (0, 29),
+                                       75: (0, 30),
+                                       76: (0, 31),
+                                       77: (0, 32),
+                                       78: (0, 33),
+                                       82: (0, 34),
+                                       83: (0, 35),
+                                       90: (0, 79),
+                                       96: (0, 38),
+                                       98: (0, 39),
+                                       101: (0, 40),
+                                       102: (0, 41),
+                                       107: (0, 42),
+                                       108: (0, 43)},
+                                  67: {0: (1, {'@': 48}), 42: (0, 80)},
+                                  68: {7: (0, 48), 63: (0, 81)},
+                                  69: {0: (1, {'@': 69}),
+                                       1: (1, {'@': 69}),
+                                       4: (1, {'@': 69}),
+                                       9: (1, {'@': 69}),
+                                       13: (1, {'@': 69}),
+                                       23: (1, {'@': 69}),
+                                       24: (1, {'@': 69}),
+                                       25: (1, {'@': 69}),
+                                       27: (1, {'@': 69}),
+                                       28: (1, {'@': 69}),
+                                       29: (1, {'@': 69}),
+                                       30: (1, {'@': 69}),
+                                       31: (1, {'@': 69}),
+                                       32: (1, {'@': 69}),
+                                       33: (1, {'@': 69}),
+                                       37: (1, {'@': 69}),
+                                       38: (1, {'@': 69}),
+                                       40: (1, {'@': 69}),
+                                       42: (1, {'@': 69}),
+                                       43: (1, {'@': 69})},
+                                  70: {37: (0, 82)},
+                                  71: {37: (0, 83)},
+                                  72: {0: (1, {'@': 109}),
+                                       1: (1, {'@': 109}),
+                                       4: (1, {'@': 109}),
+                                       9: (1, {'@': 109}),
+                                       13: (1, {'@': 109}),
+                                       18: (1, {'@': 109}),
+                                       22: (1, {'@': 109}),
+                                       23: (1, {'@': 109}),
+                                       24: (1, {'@': 109}),
+                                       25: (1, {'@': 109}),
+                                       27: (1, {'@': 109}),
+                                       28: (1, {'@': 109}),
+                                       29: (1, {'@': 109}),
+                                       30: (1, {'@': 109}),
+                                       31: (1, {'@': 109}),
+                                       32: (1, {'@': 109}),
+                                       33: (1, {'@': 109}),
+                                       37: (1, {'@': 109}),
+                                       38: (1, {'@': 109}),
+                                       40: (1, {'@': 109}),
+                                       42: (1, {'@': 109}),
+                                       43: (1, {'@': 109})},
+                                  73: {2: (0, 1),
+                                       3: (0, 2),
+                                       5: (0, 84),
+                                       6: (0, 3),
+                                       7: (0, 48),
+                                       8: (0, 85),
+                                       10: (0, 86),
+                                       11: (0, 4),
+                                       12: (0, 5),
+                                       14: (0, 87),
+                                       15: (0, 6),
+                                       16: (0, 7),
+                                       17: (0, 8),
+                                       19: (0, 88),
+                                       20: (1, {'@': 74}),
+                                       21: (0, 89),
+                                       23: (0, 90),
+                                       25: (1, {'@': 74}),
+                                       26: (1, {'@': 74}),
+                                       34: (0, 9),
+                                       35: (0, 10),
+                                       36: (0, 11),
+                                       39: (0, 12),
+                                       40: (0, 13),
+                                       41: (0, 91),
+                                       43: (0, 14),
+                                       44: (0, 15),
+                                       50: (0, 16),
+                                       51: (0, 17),
+                                       54: (0, 92),
+                                       56: (0, 18),
+                                       57: (0, 19),
+                                       58: (0, 20),
+                                       59: (0, 21),
+                                       61: (0, 22),
+                                       62: (0, 23),
+                                       63: (0, 93),
+                                       64: (0, 24),
+                                       65: (0, 25),
+                                       66: (0, 94),
+                                       67: (0, 26),
+                                       68: (0, 27),
+                                       69: (0, 95),
+                                       70: (0, 96),
+                                       72: (0, 28),
+                                       73: (0, 29),
+                                       74: (0, 97),
+                                       75: (0, 30),
+                                       76: (0, 31),
+                                       77: (0, 32),
+                                       78: (0, 33),
+                                       79: (0, 98),
+                                       80: (0, 99),
+                                       81: (0, 100),
+                                       82: (0, 34),
+                                       83: (0, 35),
+                                       84: (0, 101),
+                                       87: (0, 102),
+                                       90: (0, 103),
+                                       92: (0, 104),
+                                       96: (0, 38),
+                                       97: (0, 105),
+                                       98: (0, 39),
+                                       99: (0, 106),
+                                       100: (0, 107),
+                                       101: (0, 40),
+                                       102: (0, 41),
+                                       104: (0, 108),
+                                       105: (0, 109),
+                                       106: (0, 110),
+                                       107: (0, 42),
+                                       108: (0, 43),
+                                       109: (0, 111),
+                                       112: (0, 112),
+                                       114: (0, 113),
+                                       115: (0, 114),
+                                       116: (0, 115)},
+                                  74: {0: (1, {'@': 66}),
+                                       1: (1, {'@': 66}),
+                                       4: (1, {'@': 66}),
+                                       9: (1, {'@': 66}),
+                                       13: (1, {'@': 66}),
+                                       18: (0, 72),
+                                       22: (0, 73),
+                                       23: (1, {'@': 66}),
+                                       24: (1, {'@': 66}),
+                                       25: (1, {'@': 66}),
+                                       27: (1, {'@': 66}),
+                                       28: (1, {'@': 66}),
+                                       29: (1, {'@': 66}),
+                                       30: (1, {'@': 66}),
+                                       31: (1, {'@': 66}),
+                                       32: (1, {'@': 66}),
+                                       33: (1, {'@': 66}),
+                                       37: (1, {'@': 66}),
+                                       38: (1, {'@': 66}),
+                                       40: (1, {'@': 66}),
+                                       42: (1, {'@': 66}),
+                                       43: (1, {'@': 66}),
+                                       53: (0, 75),
+                                       86: (0, 76),
+                                       103: (0, 116)},
+                                  75: {0: (1, {'@': 105}),
+                                       1: (1, {'@': 105}),
+                                       4: (1, {'@': 105}),
+                                       9: (1, {'@': 105}),
+                                       13: (1, {'@': 105}),
+                                       18: (1, {'@': 105}),
+                                       22: (1, {'@': 105}),
+                                       23: (1, {'@': 105}),
+                                       24: (1, {'@': 105}),
+                                       25: (1, {'@': 105}),
+                                       27: (1, {'@': 105}),
+                                       28: (1, {'@': 105}),
+                                       29: (1, {'@': 105}),
+                                       30: (1, {'@': 105}),
+                                       31: (1, {'@': 105}),
+                                       32: (1, {'@': 105}),
+                                       33: (1, {'@': 105}),
+                                       37: (1, {'@': 105}),
+                                       38: (1, {'@': 105}),
+                                       40: (1, {'@': 105}),
+                                       42: (1, {'@': 105}),
+                                       43: (1, {'@': 105})},
+                                  76: {0: (1, {'@': 104}),
+                                       1: (1, {'@': 104}),
+                                       4: (1, {'@': 104}),
+                                       9: (1, {'@': 104}),
+                                       13: (1, {'@': 104}),
+                                       18: (1, {'@': 104}),
+                                       22: (1, {'@': 104}),
+                                       23: (1, {'@': 104}),
+                                       24: (1, {'@': 104}),
+                                       25: (1, {'@': 104}),
+                                       27: (1, {'@': 104}),
+                                       28: (1, {'@': 104}),
+                                       29: (1, {'@': 104}),
+                                       30: (1, {'@': 104}),
+                                       31: (1, {'@': 104}),
+                                       32: (1, {'@': 104}),
+                                       33: (1, {'@': 104}),
+                                       37: (1, {'@': 104}),
+                                       38: (1, {'@': 104}),
+                                       40: (1, {'@': 104}),
+                                       42: (1, {'@': 104}),
+                                       43: (1, {'@': 104})},
+                                  77: {0: (1, {'@': 179}),
+                                       1: (1, {'@': 179}),
+                                       4: (1, {'@': 179}),
+                                       9: (1, {'@': 179}),
+                                       13: (1, {'@': 179}),
+                                       18: (1, {'@': 179}),
+                                       22: (1, {'@': 179}),
+                                       23: (1, {'@': 179}),
+                                       24: (1, {'@': 179}),
+                                       25: (1, {'@': 179}),
+                                       27: (1, {'@': 179}),
+                                       28: (1, {'@': 179}),
+                                       29: (1, {'@': 179}),
+                                       30: (1, {'@': 179}),
+                                       31: (1, {'@': 179}),
+                                       32: (1, {'@': 179}),
+                                       33: (1, {'@': 179}),
+                                       37: (1, {'@': 179}),
+                                       38: (1, {'@': 179}),
+                                       40: (1, {'@': 179}),
+                                       42: (1, {'@': 179}),
+                                       43: (1, {'@': 179})},
+                                  78: {0: (1, {'@': 178}),
+                                       1: (1, {'@': 178}),
+                                       4: (1, {'@': 178}),
+                                       9: (1, {'@': 178}),
+                                       13: (1, {'@': 178}),
+                                       23: (1, {'@': 178}),
+                                       24: (1, {'@': 178}),
+                                       25: (1, {'@': 178}),
+                                       27: (1, {'@': 178}),
+                                       28: (1, {'@': 178}),
+                                       29: (1, {'@': 178}),
+                                       30: (1, {'@': 178}),
+                                       31: (1, {'@': 178}),
+                                       32: (1, {'@': 178}),
+                                       33: (1, {'@': 178}),
+                                       37: (1, {'@': 178}),
+                                       38: (1, {'@': 178}),
+                                       40: (1, {'@': 178}),
+                                       42: (1, {'@': 178}),
+                                       43: (1, {'@': 178})},
+                                  79: {0: (1, {'@': 175}), 42: (1, {'@': 175})},
+                                  80: {2: (0, 1),
+                                       3: (0, 2),
+                                       5: (1, {'@': 75}),
+                                       6: (0, 3),
+                                       7: (1, {'@': 74}),
+                                       11: (0, 4),
+                                       12: (0, 5),
+                                       15: (0, 6),
+                                       16: (0, 7),
+                                       17: (0, 8),
+                                       20: (1, {'@': 74}),
+                                       25: (1, {'@': 74}),
+                                       26: (1, {'@': 74}),
+                                       34: (0, 9),
+                                       35: (0, 10),
+                                       36: (0, 11),
+                                       39: (0, 12),
+                                       40: (0, 13),
+                                       43: (0, 14),
+                                       44: (0, 15),
+                                       50: (0, 16),
+                                       51: (0, 17),
+                                       56: (0, 18),
+                                       57: (0, 19),
+                                       58: (0, 20),
+                                       59: (0, 21),
+                                       61: (0, 22),
+                                       62: (0, 23),
+                                       64: (0, 24),
+                                       65: (0, 25),
+                                       67: (0, 26),
+                                       68: (0, 27),
+                                       72: (0, 28),
+                                       73: (0, 29),
+                                       75: (0, 30),
+                                       76: (0, 31),
+                                       77: (0, 32),
+                                       78: (0, 33),
+                                       82: (0, 34),
+                                       83: (0, 35),
+                                       90: (0, 117),
+                                       96: (0, 38),
+                                       98: (0, 39),
+                                       101: (0, 40),
+                                       102: (0, 41),
+                                       107: (0, 42),
+                                       108: (0, 43)},
+                                  81: {0: (1, {'@': 77}),
+                                       1: (1, {'@': 77}),
+                                       4: (1, {'@': 77}),
+                                       9: (1, {'@': 77}),
+                                       13: (1, {'@': 77}),
+                                       18: (0, 72),
+                                       22: (0, 73),
+                                       23: (1, {'@': 77}),
+                                       24: (1, {'@': 77}),
+                                       25: (1, {'@': 77}),
+                                       27: (1, {'@': 77}),
+                                       28: (1, {'@': 77}),
+                                       29: (1, {'@': 77}),
+                                       30: (1, {'@': 77}),
+                                       31: (1, {'@': 77}),
+                                       32: (1, {'@': 77}),
+                                       33: (1, {'@': 77}),
+                                       37: (1, {'@': 77}),
+                                       38: (1, {'@': 77}),
+                                       40: (1, {'@': 77}),
+                                       42: (1, {'@': 77}),
+                                       43: (1, {'@': 77}),
+                                       46: (0, 118),
+                                       53: (0, 75),
+                                       86: (0, 76),
+                                       103: (0, 77)},
+                                  82: {0: (1, {'@': 144}),
+                                       1: (1, {'@': 144}),
+                                       4: (1, {'@': 144}),
+                                       9: (1, {'@': 144}),
+                                       13: (1, {'@': 144}),
+                                       18: (1, {'@': 144}),
+                                       22: (1, {'@': 144}),
+                                       23: (1, {'@': 144}),
+                                       24: (1, {'@': 144}),
+                                       25: (1, {'@': 144}),
+                                       27: (1, {'@': 144}),
+                                       28: (1, {'@': 144}),
+                                       29: (1, {'@': 144}),
+                                       30: (1, {'@': 144}),
+                                       31: (1, {'@': 144}),
+                                       32: (1, {'@': 144}),
+                                       33: (1, {'@': 144}),
+                                       37: (1, {'@': 144}),
+                                       38: (1, {'@': 144}),
+                                       40: (1, {'@': 144}),
+                                       42: (1, {'@': 144}),
+                                       43: (1, {'@': 144})},
+                                  83: {0: (1, {'@': 145}),
+                                       1: (1, {'@': 145}),
+                                       4: (1, {'@': 145}),
+                                       9: (1, {'@': 145}),
+                                       13: (1, {'@': 145}),
+                                       18: (1, {'@': 145}),
+                                       22: (1, {'@': 145}),
+                                       23: (1, {'@': 145}),
+                                       24: (1, {'@': 145}),
+                                       25: (1, {'@': 145}),
+                                       27: (1, {'@': 145}),
+                                       28: (1, {'@': 145}),
+                                       29: (1, {'@': 145}),
+                                       30: (1, {'@': 145}),
+                                       31: (1, {'@': 145}),
+                                       32: (1, {'@': 145}),
+                                       33: (1, {'@': 145}),
+                                       37: (1, {'@': 145}),
+                                       38: (1, {'@': 145}),
+                                       40: (1, {'@': 145}),
+                                       42: (1, {'@': 145}),
+                                       43: (1, {'@': 145})},
+                                  84: {7: (0, 48), 63: (0, 119)},
+                                  85: {8: (0, 120), 19: (0, 121), 38: (1, {'@': 167})},
+                                  86: {1: (1, {'@': 173}),
+                                       4: (1, {'@': 173}),
+                                       9: (1, {'@': 173}),
+                                       13: (1, {'@': 173}),
+                                       18: (1, {'@': 173}),
+                                       22: (1, {'@': 173}),
+                                       23: (1, {'@': 173}),
+                                       24: (1, {'@': 173}),
+                                       25: (1, {'@': 173}),
+                                       27: (1, {'@': 173}),
+                                       28: (1, {'@': 173}),
+                                       29: (1, {'@': 173}),
+                                       30: (1, {'@': 173}),
+                                       31: (1, {'@': 173}),
+                                       32: (1, {'@': 173}),
+                                       33: (1, {'@': 173}),
+                                       37: (1, {'@': 173}),
+                                       38: (1, {'@': 173}),
+                                       42: (1, {'@': 173})},
+                                  87: {7: (0, 48), 63: (0, 122)},
+                                  88: {1: (1, {'@': 171}),
+                                       4: (1, {'@': 171}),
+                                       8: (0, 123),
+                                       13: (1, {'@': 171}),
+                                       18: (1, {'@': 171}),
+                                       22: (1, {'@': 171}),
+                                       23: (1, {'@': 171}),
+                                       24: (1, {'@': 171}),
+                                       25: (1, {'@': 171}),
+                                       27: (1, {'@': 171}),
+                                       28: (1, {'@': 171}),
+                                       29: (1, {'@': 171}),
+                                       30: (1, {'@': 171}),
+                                       31: (1, {'@': 171}),
+                                       32: (1, {'@': 171}),
+                                       33: (1, {'@': 171}),
+                                       38: (1, {'@': 171}),
+                                       42: (1, {'@': 171})},
+                                  89: {2: (0, 1),
+                                       3: (0, 2),
+                                       5: (0, 84),
+                                       6: (0, 3),
+                                       7: (0, 48),
+                                       10: (0, 86),
+                                       11: (0, 4),
+                                       12: (0, 5),
+                                       14: (0, 87),
+                                       15: (0, 6),
+                                       16: (0, 7),
+                                       17: (0, 8),
+                                       19: (0, 124),
+                                       20: (1, {'@': 74}),
+                                       21: (0, 89),
+                                       23: (0, 90),
+                                       25: (1, {'@': 74}),
+                                       26: (1, {'@': 74}),
+                                       34: (0, 9),
+                                       35: (0, 10),
+                                       36: (0, 11),
+                                       39: (0, 12),
+                                       40: (0, 13),
+                                       41: (0, 91),
+                                       43: (0, 14),
+                                       44: (0, 15),
+                                       50: (0, 16),
+                                       51: (0, 17),
+                                       54: (0, 92),
+                                       56: (0, 18),
+                                       57: (0, 19),
+                                       58: (0, 20),
+                                       59: (0, 21),
+                                       61: (0, 22),
+                                       62: (0, 23),
+                                       63: (0, 93),
+                                       64: (0, 24),
+                                       65: (0, 25),
+                                       66: (0, 94),
+                                       67: (0, 26),
+                                       68: (0, 27),
+                                       69: (0, 95),
+                                       70: (0, 96),
+                                       72: (0, 28),
+                                       73: (0, 29),
+                                       74: (0, 97),
+                                       75: (0, 30),
+                                       76: (0, 31),
+                                       77: (0, 32),
+                                       78: (0, 33),
+                                       79: (0, 98),
+                                       80: (0, 125),
+                                       81: (0, 100),
+                                       82: (0, 34),
+                                       83: (0, 35),
+                                       84: (0, 101),
+                                       87: (0, 102),
+                                       90: (0, 103),
+                                       92: (0, 104),
+                                       96: (0, 38),
+                                       97: (0, 105),
+                                       98: (0, 39),
+                                       99: (0, 106),
+                                       100: (0, 107),
+                                       101: (0, 40),
+                                       102: (0, 41),
+                                       105: (0, 109),
+                                       106: (0, 110),
+                                       107: (0, 42),
+                                       108: (0, 43),
+                                       112: (0, 112),
+                                       114: (0, 113),
+                                       115: (0, 114),
+                                       116: (0, 115)},
+                                  90: {2: (0, 1),
+                                       3: (0, 2),
+                                       5: (0, 84),
+                                       6: (0, 3),
+                                       7: (0, 48),
+                                       10: (0, 86),
+                                       11: (0, 4),
+                                       12: (0, 5),
+                                       14: (0, 87),
+                                       15: (0, 6),
+                                       16: (0, 7),
+                                       17: (0, 8),
+                                       19: (0, 124),
+                                       20: (1, {'@': 74}),
+                                       21: (0, 89),
+                                       23: (0, 90),
+                                       25: (1, {'@': 74}),
+                                       26: (1, {'@': 74}),
+                                       34: (0, 9),
+                                       35: (0, 10),
+                                       36: (0, 11),
+                                       39: (0, 12),
+                                       40: (0, 13),
+                                       41: (0, 91),
+                                       43: (0, 14),
+                                       44: (0, 15),
+                                       50: (0, 16),
+                                       51: (0, 17),
+                                       54: (0, 92),
+                                       56: (0, 18),
+                                       57: (0, 19),
+                                       58: (0, 20),
+                                       59: (0, 21),
+                                       61: (0, 22),
+                                       62: (0, 23),
+                                       63: (0, 93),
+                                       64: (0, 24),
+                                       65: (0, 25),
+                                       67: (0, 26),
+                                       68: (0, 27),
+                                       70: (0, 96),
+                                       72: (0, 28),
+                                       73: (0, 29),
+                                       74: (0, 97),
+                                       75: (0, 30),
+                                       76: (0, 31),
+                                       77: (0, 32),
+                                       78: (0, 33),
+                                       81: (0, 100),
+                                       82: (0, 34),
+                                       83: (0, 35),
+                                       84: (0, 101),
+                                       87: (0, 102),
+                                       90: (0, 103),
+                                       96: (0, 38),
+                                       98: (0, 39),
+                                       99: (0, 106),
+                                       100: (0, 107),
+                                       101: (0, 40),
+                                       102: (0, 41),
+                                       105: (0, 109),
+                                       107: (0, 42),
+                                       108: (0, 43),
+                                       112: (0, 112),
+                                       114: (0, 126),
+                                       115: (0, 114),
+                                       116: (0, 115)},
+                                  91: {1: (1, {'@': 172}),
+                                       4: (1, {'@': 172}),
+                                       9: (1, {'@': 172}),
+                                       13: (1, {'@': 172}),
+                                       18: (1, {'@': 172}),
+                                       22: (1, {'@': 172}),
+                                       23: (1, {'@': 172}),
+                                       24: (1, {'@': 172}),
+                                       25: (1, {'@': 172}),
+                                       27: (1, {'@': 172}),
+                                       28: (1, {'@': 172}),
+                                       29: (1, {'@': 172}),
+                                       30: (1, {'@': 172}),
+                                       31: (1, {'@': 172}),
+                                       32: (1, {'@': 172}),
+                                       33: (1, {'@': 172}),
+                                       37: (1, {'@': 172}),
+                                       38: (1, {'@': 172}),
+                                       42: (1, {'@': 172})},
+                                  92: {1: (1, {'@': 150}),
+                                       4: (1, {'@': 150}),
+                                       9: (1, {'@': 150}),
+                                       13: (1, {'@': 150}),
+                                       18: (1, {'@': 150}),
+                                       22: (1, {'@': 150}),
+                                       23: (1, {'@': 150}),
+                                       24: (1, {'@': 150}),
+                                       25: (1, {'@': 150}),
+                                       27: (1, {'@': 150}),
+                                       28: (1, {'@': 150}),
+                                       29: (1, {'@': 150}),
+                                       30: (1, {'@': 150}),
+                                       31: (1, {'@': 150}),
+                                       32: (1, {'@': 150}),
+                                       33: (1, {'@': 150}),
+                                       37: (1, {'@': 150}),
+                                       38: (1, {'@': 150}),
+                                       42: (1, {'@': 150})},
+                                  93: {21: (0, 127)},
+                                  94: {1: (0, 128),
+                                       4: (1, {'@': 120}),
+                                       9: (1, {'@': 120}),
+                                       23: (0, 129),
+                                       27: (1, {'@': 120}),
+                                       28: (1, {'@': 120}),
+                                       29: (1, {'@': 120}),
+                                       30: (1, {'@': 120}),
+                                       31: (1, {'@': 120}),
+                                       32: (1, {'@': 120}),
+                                       33: (1, {'@': 120}),
+                                       37: (1, {'@': 120}),
+                                       38: (1, {'@': 120}),
+                                       49: (0, 130)},
+                                  95: {4: (0, 131),
+                                       9: (1, {'@': 112}),
+                                       33: (1, {'@': 112}),
+                                       37: (1, {'@': 112}),
+                                       38: (1, {'@': 112})},
+                                  96: {1: (1, {'@': 152}),
+                                       4: (1, {'@': 152}),
+                                       9: (1, {'@': 152}),
+                                       13: (1, {'@': 152}),
+                                       18: (1, {'@': 152}),
+                                       22: (1, {'@': 152}),
+                                       23: (1, {'@': 152}),
+                                       24: (1, {'@': 152}),
+                                       25: (1, {'@': 152}),
+                                       27: (1, {'@': 152}),
+                                       28: (1, {'@': 152}),
+                                       29: (1, {'@': 152}),
+                                       30: (1, {'@': 152}),
+                                       31: (1, {'@': 152}),
+                                       32: (1, {'@': 152}),
+                                       33: (1, {'@': 152}),
+                                       37: (1, {'@': 152}),
+                                       38: (1, {'@': 152}),
+                                       42: (1, {'@': 152})},
+                                  97: {1: (1, {'@': 170}),
+                                       4: (1, {'@': 170}),
+                                       9: (1, {'@': 170}),
+                                       13: (1, {'@': 170}),
+                                       18: (1, {'@': 170}),
+                                       22: (1, {'@': 170}),
+                                       23: (1, {'@': 170}),
+                                       24: (1, {'@': 170}),
+                                       25: (1, {'@': 170}),
+                                       27: (1, {'@': 170}),
+                                       28: (1, {'@': 170}),
+                                       29: (1, {'@': 170}),
+                                       30: (1, {'@': 170}),
+                                       31: (1, {'@': 170}),
+                                       32: (1, {'@': 170}),
+                                       33: (1, {'@': 170}),
+                                       37: (1, {'@': 170}),
+                                       38: (1, {'@': 170}),
+                                       42: (1, {'@': 170})},
+                                  98: {4: (1, {'@': 114}),
+                                       9: (1, {'@': 114}),
+                                       27: (0, 132),
+                                       32: (0, 133),
+                                       33: (1, {'@': 114}),
+                                       37: (1, {'@': 114}),
+                                       38: (1, {'@': 114}),
+                                       52: (0, 134)},
+                                  99: {38: (1, {'@': 108})},
+                                  100: {1: (1, {'@': 101}),
+                                        4: (1, {'@': 101}),
+                                        9: (1, {'@': 101}),
+                                        13: (1, {'@': 101}),
+                                        18: (0, 72),
+                                        22: (0, 73),
+                                        23: (1, {'@': 101}),
+                                        24: (1, {'@': 101}),
+                                        25: (1, {'@': 101}),
+                                        27: (1, {'@': 101}),
+                                        28: (1, {'@': 101}),
+                                        29: (1, {'@': 101}),
+                                        30: (1, {'@': 101}),
+                                        31: (1, {'@': 101}),
+                                        32: (1, {'@': 101}),
+                                        33: (1, {'@': 101}),
+                                        37: (1, {'@': 101}),
+                                        38: (1, {'@': 101}),
+                                        42: (1, {'@': 101}),
+                                        53: (0, 75),
+                                        86: (0, 76),
+                                        103: (0, 135)},
+                                  101: {1: (1, {'@': 151}),
+                                        4: (1, {'@': 151}),
+                                        9: (1, {'@': 151}),
+                                        13: (1, {'@': 151}),
+                                        18: (1, {'@': 151}),
+                                        22: (1, {'@': 151}),
+                                        23: (1, {'@': 151}),
+                                        24: (1, {'@': 151}),
+                                        25: (1, {'@': 151}),
+                                        27: (1, {'@': 151}),
+                                        28: (1, {'@': 151}),
+                                        29: (1, {'@': 151}),
+                                        30: (1, {'@': 151}),
+                                        31: (1, {'@': 151}),
+                                        32: (1, {'@': 151}),
+                                        33: (1, {'@': 151}),
+                                        37: (1, {'@': 151}),
+                                        38: (1, {'@': 151}),
+                                        42: (1, {'@': 151})},
+                                  102: {1: (1, {'@': 169}),
+                                        4: (1, {'@': 169}),
+                                        9: (1, {'@': 169}),
+                                        13: (1, {'@': 169}),
+                                        18: (1, {'@': 169}),
+                                        22: (1, {'@': 169}),
+                                        23: (1, {'@': 169}),
+                                        24: (1, {'@': 169}),
+                                        25: (1, {'@': 169}),
+                                        27: (1, {'@': 169}),
+                                        28: (1, {'@': 169}),
+                                        29: (1, {'@': 169}),
+                                        30: (1, {'@': 169}),
+                                        31: (1, {'@': 169}),
+                                        32: (1, {'@': 169}),
+                                        33: (1, {'@': 169}),
+                                        37: (1, {'@': 169}),
+                                        38: (1, {'@': 169}),
+                                        42: (1, {'@': 169})},
+                                  103: {1: (1, {'@': 100}),
+                                        4: (1, {'@': 100}),
+                                        9: (1, {'@': 100}),
+                                        13: (1, {'@': 100}),
+                                        23: (1, {'@': 100}),
+                                        24: (1, {'@': 100}),
+                                        25: (1, {'@': 100}),
+                                        27: (1, {'@': 100}),
+                                        28: (1, {'@': 100}),
+                                        29: (1, {'@': 100}),
+                                        30: (1, {'@': 100}),
+                                        31: (1, {'@': 100}),
+                                        32: (1, {'@': 100}),
+                                        33: (1, {'@': 100}),
+                                        37: (1, {'@': 100}),
+                                        38: (1, {'@': 100}),
+                                        42: (1, {'@': 100})},
+                                  104: {1: (1, {'@': 126}),
+                                        4: (1, {'@': 126}),
+                                        9: (1, {'@': 126}),
+                                        13: (0, 136),
+                                        23: (1, {'@': 126}),
+                                        24: (0, 137),
+                                        25: (0, 138),
+                                        27: (1, {'@': 126}),
+                                        28: (1, {'@': 126}),
+                                        29: (1, {'@': 126}),
+                                        30: (1, {'@': 126}),
+                                        31: (1, {'@': 126}),
+                                        32: (1, {'@': 126}),
+                                        33: (1, {'@': 126}),
+                                        37: (1, {'@': 126}),
+                                        38: (1, {'@': 126}),
+                                        55: (0, 139)},
+                                  105: {9: (1, {'@': 110}), 33: (0, 140), 37: (1, {'@': 110}), 38: (1, {'@': 110})},
+                                  106: {1: (1, {'@': 149}),
+                                        4: (1, {'@': 149}),
+                                        9: (1, {'@': 149}),
+                                        13: (1, {'@': 149}),
+                                        18: (1, {'@': 149}),
+                                        22: (1, {'@': 149}),
+                                        23: (1, {'@': 149}),
+                                        24: (1, {'@': 149}),
+                                        25: (1, {'@': 149}),
+                                        27: (1, {'@': 149}),
+                                        28: (1, {'@': 149}),
+                                        29: (1, {'@': 149}),
+                                        30: (1, {'@': 149}),
+                                        31: (1, {'@': 149}),
+                                        32: (1, {'@': 149}),
+                                        33: (1, {'@': 149}),
+                                        37: (1, {'@': 149}),
+                                        38: (1, {'@': 149}),
+                                        42: (1, {'@': 149})},
+                                  107: {1: (1, {'@': 137}),
+                                        4: (1, {'@': 137}),
+                                        9: (1, {'@': 137}),
+                                        13: (1, {'@': 137}),
+                                        23: (1, {'@': 137}),
+                                        24: (1, {'@': 137}),
+                                        25: (1, {'@': 137}),
+                                        27: (1, {'@': 137}),
+                                        28: (1, {'@': 137}),
+                                        29: (1, {'@': 137}),
+                                        30: (1, {'@': 137}),
+                                        31: (1, {'@': 137}),
+                                        32: (1, {'@': 137}),
+                                        33: (1, {'@': 137}),
+                                        37: (1, {'@': 137}),
+                                        38: (1, {'@': 137}),
+                                        42: (1, {'@': 137})},
+                                  108: {38: (0, 141)},
+                                  109: {1: (1, {'@': 102}),
+                                        4: (1, {'@': 102}),
+                                        9: (1, {'@': 102}),
+                                        13: (1, {'@': 102}),
+                                        18: (1, {'@': 102}),
+                                        22: (1, {'@': 102}),
+                                        23: (1, {'@': 102}),
+                                        24: (1, {'@': 102}),
+                                        25: (1, {'@': 102}),
+                                        27: (1, {'@': 102}),
+                                        28: (1, {'@': 102}),
+                                        29: (1, {'@': 102}),
+                                        30: (1, {'@': 102}),
+                                        31: (1, {'@': 102}),
+                                        32: (1, {'@': 102}),
+                                        33: (1, {'@': 102}),
+                                        37: (1, {'@': 102}),
+                                        38: (1, {'@': 102}),
+                                        42: (1, {'@': 102})},
+                                  110: {4: (1, {'@': 116}),
+                                        9: (1, {'@': 116}),
+                                        27: (1, {'@': 116}),
+                                        28: (0, 142),
+                                        29: (0, 143),
+                                        30: (0, 144),
+                                        31: (0, 145),
+                                        32: (1, {'@': 116}),
+                                        33: (1, {'@': 116}),
+                                        37: (1, {'@': 116}),
+                                        38: (1, {'@': 116}),
+                                        60: (0, 146)},
+                                  111: {38: (0, 147)},
+                                  112: {1: (1, {'@': 168}),
+                                        4: (1, {'@': 168}),
+                                        9: (1, {'@': 168}),
+                                        13: (1, {'@': 168}),
+                                        18: (1, {'@': 168}),
+                                        22: (1, {'@': 168}),
+                                        23: (1, {'@': 168}),
+                                        24: (1, {'@': 168}),
+                                        25: (1, {'@': 168}),
+                                        27: (1, {'@': 168}),
+                                        28: (1, {'@': 168}),
+                                        29: (1, {'@': 168}),
+                                        30: (1, {'@': 168}),
+                                        31: (1, {'@': 168}),
+                                        32: (1, {'@': 168}),
+                                        33: (1, {'@': 168}),
+                                        37: (1, {'@': 168}),
+                                        38: (1, {'@': 168}),
+                                        42: (1, {'@': 168})},
+                                  113: {1: (1, {'@': 130}),
+                                        4: (1, {'@': 130}),
+                                        9: (1, {'@': 130}),
+                                        13: (1, {'@': 130}),
+                                        23: (1, {'@': 130}),
+                                        24: (1, {'@': 130}),
+                                        25: (1, {'@': 130}),
+                                        27: (1, {'@': 130}),
+                                        28: (1, {'@': 130}),
+                                        29: (1, {'@': 130}),
+                                        30: (1, {'@': 130}),
+                                        31: (1, {'@': 130}),
+                                        32: (1, {'@': 130}),
+                                        33: (1, {'@': 130}),
+                                        37: (1, {'@': 130}),
+                                        38: (1, {'@': 130})},
+                                  114: {1: (1, {'@': 134}),
+                                        4: (1, {'@': 134}),
+                                        9: (1, {'@': 134}),
+                                        13: (1, {'@': 134}),
+                                        23: (1, {'@': 134}),
+                                        24: (1, {'@': 134}),
+                                        25: (1, {'@': 134}),
+                                        27: (1, {'@': 134}),
+                                        28: (1, {'@': 134}),
+                                        29: (1, {'@': 134}),
+                                        30: (1, {'@': 134}),
+                                        31: (1, {'@': 134}),
+                                        32: (1, {'@': 134}),
+                                        33: (1, {'@': 134}),
+                                        37: (1, {'@': 134}),
+                                        38: (1, {'@': 134}),
+                                        42: (0, 148)},
+                                  115: {1: (1, {'@': 148}),
+                                        4: (1, {'@': 148}),
+                                        9: (1, {'@': 148}),
+                                        13: (1, {'@': 148}),
+                                        18: (1, {'@': 148}),
+                                        22: (1, {'@': 148}),
+                                        23: (1, {'@': 148}),
+                                        24: (1, {'@': 148}),
+                                        25: (1, {'@': 148}),
+                                        27: (1, {'@': 148}),
+                                        28: (1, {'@': 148}),
+                                        29: (1, {'@': 148}),
+                                        30: (1, {'@': 148}),
+                                        31: (1, {'@': 148}),
+                                        32: (1, {'@': 148}),
+                                        33: (1, {'@': 148}),
+                                        37: (1, {'@': 148}),
+                                        38: (1, {'@': 148}),
+                                        42: (1, {'@': 148})},
+                                  116: {0: (1, {'@': 180}),
+                                        1: (1, {'@': 180}),
+                                        4: (1, {'@': 180}),
+                                        9: (1, {'@': 180}),
+                                        13: (1, {'@': 180}),
+                                        18: (1, {'@': 180}),
+                                        22: (1, {'@': 180}),
+                                        23: (1, {'@': 180}),
+                                        24: (1, {'@': 180}),
+                                        25: (1, {'@': 180}),
+                                        27: (1, {'@': 180}),
+                                        28: (1, {'@': 180}),
+                                        29: (1, {'@': 180}),
+                                        30: (1, {'@': 180}),
+                                        31: (1, {'@': 180}),
+                                        32: (1, {'@': 180}),
+                                        33: (1, {'@': 180}),
+                                        37: (1, {'@': 180}),
+                                        38: (1, {'@': 180}),
+                                        40: (1, {'@': 180}),
+                                        42: (1, {'@': 180}),
+                                        43: (1, {'@': 180})},
+                                  117: {0: (1, {'@': 176}), 42: (1, {'@': 176})},
+                                  118: {0: (1, {'@': 76}),
+                                        1: (1, {'@': 76}),
+                                        4: (1, {'@': 76}),
+                                        9: (1, {'@': 76}),
+                                        13: (1, {'@': 76}),
+                                        18: (0, 72),
+                                        22: (0, 73),
+                                        23: (1, {'@': 76}),
+                                        24: (1, {'@': 76}),
+                                        25: (1, {'@': 76}),
+                                        27: (1, {'@': 76}),
+                                        28: (1, {'@': 76}),
+                                        29: (1, {'@': 76}),
+                                        30: (1, {'@': 76}),
+                                        31: (1, {'@': 76}),
+                                        32: (1, {'@': 76}),
+                                        33: (1, {'@': 76}),
+                                        37: (1, {'@': 76}),
+                                        38: (1, {'@': 76}),
+                                        40: (1, {'@': 76}),
+                                        42: (1, {'@': 76}),
+                                        43: (1, {'@': 76}),
+                                        53: (0, 75),
+                                        86: (0, 76),
+                                        103: (0, 116)},
+                                  119: {1: (1, {'@': 155}),
+                                        4: (1, {'@': 155}),
+                                        9: (1, {'@': 155}),
+                                        13: (1, {'@': 155}),
+                                        18: (1, {'@': 155}),
+                                        22: (1, {'@': 155}),
+                                        23: (1, {'@': 155}),
+                                        24: (1, {'@': 155}),
+                                        25: (1, {'@': 155}),
+                                        27: (1, {'@': 155}),
+                                        28: (1, {'@': 155}),
+                                        29: (1, {'@': 155}),
+                                        30: (1, {'@': 155}),
+                                        31: (1, {'@': 155}),
+                                        32: (1, {'@': 155}),
+                                        33: (1, {'@': 155}),
+                                        37: (1, {'@': 155}),
+                                        38: (1, {'@': 155}),
+                                        42: (1, {'@': 155})},
+                                  120: {19: (0, 149)},
+                                  121: {8: (0, 150), 38: (1, {'@': 165})},
+                                  122: {1: (1, {'@': 153}),
+                                        4: (1, {'@': 153}),
+                                        9: (1, {'@': 153}),
+                                        13: (1, {'@': 153}),
+                                        18: (1, {'@': 153}),
+                                        22: (1, {'@': 153}),
+                                        23: (1, {'@': 153}),
+                                        24: (1, {'@': 153}),
+                                        25: (1, {'@': 153}),
+                                        27: (1, {'@': 153}),
+                                        28: (1, {'@': 153}),
+                                        29: (1, {'@': 153}),
+                                        30: (1, {'@': 153}),
+                                        31: (1, {'@': 153}),
+                                        32: (1, {'@': 153}),
+                                        33: (1, {'@': 153}),
+                                        37: (1, {'@': 153}),
+                                        38: (1, {'@': 153}),
+                                        42: (1, {'@': 153})},
+                                  123: {8: (0, 151), 19: (0, 152), 38: (1, {'@': 163})},
+                                  124: {1: (1, {'@': 171}),
+                                        4: (1, {'@': 171}),
+                                        9: (1, {'@': 171}),
+                                        13: (1, {'@': 171}),
+                                        18: (1, {'@': 171}),
+                                        22: (1, {'@': 171}),
+                                        23: (1, {'@': 171}),
+                                        24: (1, {'@': 171}),
+                                        25: (1, {'@': 171}),
+                                        27: (1, {'@': 171}),
+                                        28: (1, {'@': 171}),
+                                        29: (1, {'@': 171}),
+                                        30: (1, {'@': 171}),
+                                        31: (1, {'@': 171}),
+                                        32: (1, {'@': 171}),
+                                        33: (1, {'@': 171}),
+                                        37: (1, {'@': 171}),
+                                        38: (1, {'@': 171}),
+                                        42: (1, {'@': 171})},
+                                  125: {37: (0, 153)},
+                                  126: {1: (1, {'@': 135}),
+                                        4: (1, {'@': 135}),
+                                        9: (1, {'@': 135}),
+                                        13: (1, {'@': 135}),
+                                        23: (1, {'@': 135}),
+                                        24: (1, {'@': 135}),
+                                        25: (1, {'@': 135}),
+                                        27: (1, {'@': 135}),
+                                        28: (1, {'@': 135}),
+                                        29: (1, {'@': 135}),
+                                        30: (1, {'@': 135}),
+                                        31: (1, {'@': 135}),
+                                        32: (1, {'@': 135}),
+                                        33: (1, {'@': 135}),
+                                        37: (1, {'@': 135}),
+                                        38: (1, {'@': 135})},
+                                  127: {2: (0, 1),
+                                        3: (0, 2),
+                                        5: (0, 84),
+                                        6: (0, 3),
+                                        7: (0, 48),
+                                        10: (0, 86),
+                                        11: (0, 4),
+                                        12: (0, 5),
+                                        14: (0, 87),
+                                        15: (0, 6),
+                                        16: (0, 7),
+                                        17: (0, 8),
+                                        19: (0, 124),
+                                        20: (1, {'@': 74}),
+                                        21: (0, 89),
+                                        23: (0, 90),
+                                        25: (1, {'@': 74}),
+                                        26: (1, {'@': 74}),
+                                        34: (0, 9),
+                                        35: (0, 10),
+                                        36: (0, 11),
+                                        37: (0, 154),
+                                        39: (0, 12),
+                                        40: (0, 13),
+                                        41: (0, 91),
+                                        43: (0, 14),
+                                        44: (0, 15),
+                                        50: (0, 16),
+                                        51: (0, 17),
+                                        54: (0, 92),
+                                        56: (0, 18),
+                                        57: (0, 19),
+                                        58: (0, 20),
+                                        59: (0, 21),
+                                        61: (0, 22),
+                                        62: (0, 23),
+                                        63: (0, 93),
+                                        64: (0, 24),
+                                        65: (0, 25),
+                                        66: (0, 94),
+                                        67: (0, 26),
+                                        68: (0, 27),
+                                        69: (0, 95),
+                                        70: (0, 96),
+                                        72: (0, 28),
+                                        73: (0, 29),
+                                        74: (0, 97),
+                                        75: (0, 30),
+                                        76: (0, 31),
+                                        77: (0, 32),
+                                        78: (0, 33),
+                                        79: (0, 98),
+                                        80: (0, 155),
+                                        81: (0, 100),
+                                        82: (0, 34),
+                                        83: (0, 35),
+                                        84: (0, 101),
+                                        85: (0, 156),
+                                        87: (0, 102),
+                                        90: (0, 103),
+                                        92: (0, 104),
+                                        96: (0, 38),
+                                        97: (0, 105),
+                                        98: (0, 39),
+                                        99: (0, 106),
+                                        100: (0, 107),
+                                        101: (0, 40),
+                                        102: (0, 41),
+                                        105: (0, 109),
+                                        106: (0, 110),
+                                        107: (0, 42),
+                                        108: (0, 43),
+                                        112: (0, 112),
+                                        114: (0, 113),
+                                        115: (0, 114),
+                                        116: (0, 115)},
+                                  128: {2: (1, {'@': 127}),
+                                        3: (1, {'@': 127}),
+                                        5: (1, {'@': 127}),
+                                        6: (1, {'@': 127}),
+                                        7: (1, {'@': 127}),
+                                        10: (1, {'@': 127}),
+                                        11: (1, {'@': 127}),
+                                        12: (1, {'@': 127}),
+                                        14: (1, {'@': 127}),
+                                        15: (1, {'@': 127}),
+                                        16: (1, {'@': 127}),
+                                        17: (1, {'@': 127}),
+                                        19: (1, {'@': 127}),
+                                        20: (1, {'@': 127}),
+                                        21: (1, {'@': 127}),
+                                        23: (1, {'@': 127}),
+                                        25: (1, {'@': 127}),
+                                        26: (1, {'@': 127}),
+                                        34: (1, {'@': 127}),
+                                        35: (1, {'@': 127}),
+                                        36: (1, {'@': 127}),
+                                        39: (1, {'@': 127}),
+                                        40: (1, {'@': 127}),
+                                        41: (1, {'@': 127}),
+                                        43: (1, {'@': 127}),
+                                        44: (1, {'@': 127})},
+                                  129: {2: (1, {'@': 128}),
+                                        3: (1, {'@': 128}),
+                                        5: (1, {'@': 128}),
+                                        6: (1, {'@': 128}),
+                                        7: (1, {'@': 128}),
+                                        10: (1, {'@': 128}),
+                                        11: (1, {'@': 128}),
+                                        12: (1, {'@': 128}),
+                                        14: (1, {'@': 128}),
+                                        15: (1, {'@': 128}),
+                                        16: (1, {'@': 128}),
+                                        17: (1, {'@': 128}),
+                                        19: (1, {'@': 128}),
+                                        20: (1, {'@': 128}),
+                                        21: (1, {'@': 128}),
+                                        23: (1, {'@': 128}),
+                                        25: (1, {'@': 128}),
+                                        26: (1, {'@': 128}),
+                                        34: (1, {'@': 128}),
+                                        35: (1, {'@': 128}),
+                                        36: (1, {'@': 128}),
+                                        39: (1, {'@': 128}),
+                                        40: (1, {'@': 128}),
+                                        41: (1, {'@': 128}),
+                                        43: (1, {'@': 128}),
+                                        44: (1, {'@': 128})},
+                                  130: {2: (0, 1),
+                                        3: (0, 2),
+                                        5: (0, 84),
+                                        6: (0, 3),
+                                        7: (0, 48),
+                                        10: (0, 86),
+                                        11: (0, 4),
+                                        12: (0, 5),
+                                        14: (0, 87),
+                                        15: (0, 6),
+                                        16: (0, 7),
+                                        17: (0, 8),
+                                        19: (0, 124),
+                                        20: (1, {'@': 74}),
+                                        21: (0, 89),
+                                        23: (0, 90),
+                                        25: (1, {'@': 74}),
+                                        26: (1, {'@': 74}),
+                                        34: (0, 9),
+                                        35: (0, 10),
+                                        36: (0, 11),
+                                        39: (0, 12),
+                                        40: (0, 13),
+                                        41: (0, 91),
+                                        43: (0, 14),
+                                        44: (0, 15),
+                                        50: (0, 16),
+                                        51: (0, 17),
+                                        54: (0, 92),
+                                        56: (0, 18),
+                                        57: (0, 19),
+                                        58: (0, 20),
+                                        59: (0, 21),
+                                        61: (0, 22),
+                                        62: (0, 23),
+                                        63: (0, 93),
+                                        64: (0, 24),
+                                        65: (0, 25),
+                                        67: (0, 26),
+                                        68: (0, 27),
+                                        70: (0, 96),
+                                        72: (0, 28),
+                                        73: (0, 29),
+                                        74: (0, 97),
+                                        75: (0, 30),
+                                        76: (0, 31),
+                                        77: (0, 32),
+                                        78: (0, 33),
+                                        81: (0, 100),
+                                        82: (0, 34),
+                                        83: (0, 35),
+                                        84: (0, 101),
+                                        87: (0, 102),
+                                        90: (0, 103),
+                                        92: (0, 157),
+                                        96: (0, 38),
+                                        98: (0, 39),
+                                        99: (0, 106),
+                                        100: (0, 107),
+                                        101: (0, 40),
+                                        102: (0, 41),
+                                        105: (0, 109),
+                                        107: (0, 42),
+                                        108: (0, 43),
+                                        112: (0, 112),
+                                        114: (0, 113),
+                                        115: (0, 114),
+                                        116: (0, 115)},
+                                  131: {2: (0, 1),
+                                        3: (0, 2),
+                                        5: (0, 84),
+                                        6: (0, 3),
+                                        7: (0, 48),
+                                        10: (0, 86),
+                                        11: (0, 4),
+                                        12: (0, 5),
+                                        14: (0, 87),
+                                        15: (0, 6),
+                                        16: (0, 7),
+                                        17: (0, 8),
+                                        19: (0, 124),
+                                        20: (1, {'@': 74}),
+                                        21: (0, 89),
+                                        23: (0, 90),
+                                        25: (1, {'@': 74}),
+                                        26: (1, {'@': 74}),
+                                        34: (0, 9),
+                                        35: (0, 10),
+                                        36: (0, 11),
+                                        39: (0, 12),
+                                        40: (0, 13),
+                                        41: (0, 91),
+                                        43: (0, 14),
+                                        44: (0, 15),
+                                        50: (0, 16),
+                                        51: (0, 17),
+                                        54: (0, 92),
+                                        56: (0, 18),
+                                        57: (0, 19),
+                                        58: (0, 20),
+                                        59: (0, 21),
+                                        61: (0, 22),
+                                        62: (0, 23),
+                                        63: (0, 93),
+                                        64: (0, 24),
+                                        65: (0, 25),
+                                        66: (0, 94),
+                                        67: (0, 26),
+                                        68: (0, 27),
+                                        70: (0, 96),
+                                        72: (0, 28),
+                                        73: (0, 29),
+                                        74: (0, 97),
+                                        75: (0, 30),
+                                        76: (0, 31),
+                                        77: (0, 32),
+                                        78: (0, 33),
+                                        79: (0, 158),
+                                        81: (0, 100),
+                                        82: (0, 34),
+                                        83: (0, 35),
+                                        84: (0, 101),
+                                        87: (0, 102),
+                                        90: (0, 103),
+                                        92: (0, 104),
+                                        96: (0, 38),
+                                        98: (0, 39),
+                                        99: (0, 106),
+                                        100: (0, 107),
+                                        101: (0, 40),
+                                        102: (0, 41),
+                                        105: (0, 109),
+                                        106: (0, 110),
+                                        107: (0, 42),
+                                        108: (0, 43),
+                                        112: (0, 112),
+                                        114: (0, 113),
+                                        115: (0, 114),
+                                        116: (0, 115)},
+                                  132: {2: (1, {'@': 117}),
+                                        3: (1, {'@': 117}),
+                                        5: (1, {'@': 117}),
+                                        6: (1, {'@': 117}),
+                                        7: (1, {'@': 117}),
+                                        10: (1, {'@': 117}),
+                                        11: (1, {'@': 117}),
+                                        12: (1, {'@': 117}),
+                                        14: (1, {'@': 117}),
+                                        15: (1, {'@': 117}),
+                                        16: (1, {'@': 117}),
+                                        17: (1, {'@': 117}),
+                                        19: (1, {'@': 117}),
+                                        20: (1, {'@': 117}),
+                                        21: (1, {'@': 117}),
+                                        23: (1, {'@': 117}),
+                                        25: (1, {'@': 117}),
+                                        26: (1, {'@': 117}),
+                                        34: (1, {'@': 117}),
+                                        35: (1, {'@': 117}),
+                                        36: (1, {'@': 117}),
+                                        39: (1, {'@': 117}),
+                                        40: (1, {'@': 117}),
+                                        41: (1, {'@': 117}),
+                                        43: (1, {'@': 117}),
+                                        44: (1, {'@': 117})},
+                                  133: {2: (1, {'@': 118}),
+                                        3: (1, {'@': 118}),
+                                        5: (1, {'@': 118}),
+                                        6: (1, {'@': 118}),
+                                        7: (1, {'@': 118}),
+                                        10: (1, {'@': 118}),
+                                        11: (1, {'@': 118}),
+                                        12: (1, {'@': 118}),
+                                        14: (1, {'@': 118}),
+                                        15: (1, {'@': 118}),
+                                        16: (1, {'@': 118}),
+                                        17: (1, {'@': 118}),
+                                        19: (1, {'@': 118}),
+                                        20: (1, {'@': 118}),
+                                        21: (1, {'@': 118}),
+                                        23: (1, {'@': 118}),
+                                        25: (1, {'@': 118}),
+                                        26: (1, {'@': 118}),
+                                        34: (1, {'@': 118}),
+                                        35: (1, {'@': 118}),
+                                        36: (1, {'@': 118}),
+                                        39: (1, {'@': 118}),
+                                        40: (1, {'@': 118}),
+                                        41: (1, {'@': 118}),
+                                        43: (1, {'@': 118}),
+                                        44: (1, {'@': 118})},
+                                  134: {2: (0, 1),
+                                        3: (0, 2),
+                                        5: (0, 84),
+                                        6: (0, 3),
+                                        7: (0, 48),
+                                        10: (0, 86),
+                                        11: (0, 4),
+                                        12: (0, 5),
+                                        14: (0, 87),
+                                        15: (0, 6),
+                                        16: (0, 7),
+                                        17: (0, 8),
+                                        19: (0, 124),
+                                        20: (1, {'@': 74}),
+                                        21: (0, 89),
+                                        23: (0, 90),
+                                        25: (1, {'@': 74}),
+                                        26: (1, {'@': 74}),
+                                        34: (0, 9),
+                                        35: (0, 10),
+                                        36: (0, 11),
+                                        39: (0, 12),
+                                        40: (0, 13),
+                                        41: (0, 91),
+                                        43: (0, 14),
+                                        44: (0, 15),
+                                        50: (0, 16),
+                                        51: (0, 17),
+                                        54: (0, 92),
+                                        56: (0, 18),
+                                        57: (0, 19),
+                                        58: (0, 20),
+                                        59: (0, 21),
+                                        61: (0, 22),
+                                        62: (0, 23),
+                                        63: (0, 93),
+                                        64: (0, 24),
+                                        65: (0, 25),
+                                        66: (0, 94),
+                                        67: (0, 26),
+                                        68: (0, 27),
+                                        70: (0, 96),
+                                        72: (0, 28),
+                                        73: (0, 29),
+                                        74: (0, 97),
+                                        75: (0, 30),
+                                        76: (0, 31),
+                                        77: (0, 32),
+                                        78: (0, 33),
+                                        81: (0, 100),
+                                        82: (0, 34),
+                                        83: (0, 35),
+                                        84: (0, 101),
+                                        87: (0, 102),
+                                        90: (0, 103),
+                                        92: (0, 104),
+                                        96: (0, 38),
+                                        98: (0, 39),
+                                        99: (0, 106),
+                                        100: (0, 107),
+                                        101: (0, 40),
+                                        102: (0, 41),
+                                        105: (0, 109),
+                                        106: (0, 159),
+                                        107: (0, 42),
+                                        108: (0, 43),
+                                        112: (0, 112),
+                                        114: (0, 113),
+                                        115: (0, 114),
+                                        116: (0, 115)},
+                                  135: {1: (1, {'@': 103}),
+                                        4: (1, {'@': 103}),
+                                        9: (1, {'@': 103}),
+                                        13: (1, {'@': 103}),
+                                        18: (1, {'@': 103}),
+                                        22: (1, {'@': 103}),
+                                        23: (1, {'@': 103}),
+                                        24: (1, {'@': 103}),
+                                        25: (1, {'@': 103}),
+                                        27: (1, {'@': 103}),
+                                        28: (1, {'@': 103}),
+                                        29: (1, {'@': 103}),
+                                        30: (1, {'@': 103}),
+                                        31: (1, {'@': 103}),
+                                        32: (1, {'@': 103}),
+                                        33: (1, {'@': 103}),
+                                        37: (1, {'@': 103}),
+                                        38: (1, {'@': 103}),
+                                        42: (1, {'@': 103})},
+                                  136: {2: (1, {'@': 132}),
+                                        3: (1, {'@': 132}),
+                                        5: (1, {'@': 132}),
+                                        6: (1, {'@': 132}),
+                                        7: (1, {'@': 132}),
+                                        10: (1, {'@': 132}),
+                                        11: (1, {'@': 132}),
+                                        12: (1, {'@': 132}),
+                                        14: (1, {'@': 132}),
+                                        15: (1, {'@': 132}),
+                                        16: (1, {'@': 132}),
+                                        17: (1, {'@': 132}),
+                                        19: (1, {'@': 132}),
+                                        20: (1, {'@': 132}),
+                                        21: (1, {'@': 132}),
+                                        23: (1, {'@': 132}),
+                                        25: (1, {'@': 132}),
+                                        26: (1, {'@': 132}),
+                                        34: (1, {'@': 132}),
+                                        35: (1, {'@': 132}),
+                                        36: (1, {'@': 132}),
+                                        39: (1, {'@': 132}),
+                                        40: (1, {'@': 132}),
+                                        41: (1, {'@': 132}),
+                                        43: (1, {'@': 132}),
+                                        44: (1, {'@': 132})},
+                                  137: {2: (1, {'@': 133}),
+                                        3: (1, {'@': 133}),
+                                        5: (1, {'@': 133}),
+                                        6: (1, {'@': 133}),
+                                        7: (1, {'@': 133}),
+                                        10: (1, {'@': 133}),
+                                        11: (1, {'@': 133}),
+                                        12: (1, {'@': 133}),
+                                        14: (1, {'@': 133}),
+                                        15: (1, {'@': 133}),
+                                        16: (1, {'@': 133}),
+                                        17: (1, {'@': 133}),
+                                        19: (1, {'@': 133}),
+                                        20: (1, {'@': 133}),
+                                        21: (1, {'@': 133}),
+                                        23: (1, {'@': 133}),
+                                        25: (1, {'@': 133}),
+                                        26: (1, {'@': 133}),
+                                        34: (1, {'@': 133}),
+                                        35: (1, {'@': 133}),
+                                        36: (1, {'@': 133}),
+                                        39: (1, {'@': 133}),
+                                        40: (1, {'@': 133}),
+                                        41: (1, {'@': 133}),
+                                        43: (1, {'@': 133}),
+                                        44: (1, {'@': 133})},
+                                  138: {2: (1, {'@': 131}),
+                                        3: (1, {'@': 131}),
+                                        5: (1, {'@': 131}),
+                                        6: (1, {'@': 131}),
+                                        7: (1, {'@': 131}),
+                                        10: (1, {'@': 131}),
+                                        11: (1, {'@': 131}),
+                                        12: (1, {'@': 131}),
+                                        14: (1, {'@': 131}),
+                                        15: (1, {'@': 131}),
+                                        16: (1, {'@': 131}),
+                                        17: (1, {'@': 131}),
+                                        19: (1, {'@': 131}),
+                                        20: (1, {'@': 131}),
+                                        21: (1, {'@': 131}),
+                                        23: (1, {'@': 131}),
+                                        25: (1, {'@': 131}),
+                                        26: (1, {'@': 131}),
+                                        34: (1, {'@': 131}),
+                                        35: (1, {'@': 131}),
+                                        36: (1, {'@': 131}),
+                                        39: (1, {'@': 131}),
+                                        40: (1, {'@': 131}),
+                                        41: (1, {'@': 131}),
+                                        43: (1, {'@': 131}),
+                                        44: (1, {'@': 131})},
+                                  139: {2: (0, 1),
+                                        3: (0, 2),
+                                        5: (0, 84),
+                                        6: (0, 3),
+                                        7: (0, 48),
+                                        10: (0, 86),
+                                        11: (0, 4),
+                                        12: (0, 5),
+                                        14: (0, 87),
+                                        15: (0, 6),
+                                        16: (0, 7),
+                                        17: (0, 8),
+                                        19: (0, 124),
+                                        20: (1, {'@': 74}),
+                                        21: (0, 89),
+                                        23: (0, 90),
+                                        25: (1, {'@': 74}),
+                                        26: (1, {'@': 74}),
+                                        34: (0, 9),
+                                        35: (0, 10),
+                                        36: (0, 11),
+                                        39: (0, 12),
+                                        40: (0, 13),
+                                        41: (0, 91),
+                                        43: (0, 14),
+                                        44: (0, 15),
+                                        50: (0, 16),
+                                        51: (0, 17),
+                                        54: (0, 92),
+                                        56: (0, 18),
+                                        57: (0, 19),
+                                        58: (0, 20),
+                                        59: (0, 21),
+                                        61: (0, 22),
+                                        62: (0, 23),
+                                        63: (0, 93),
+                                        64: (0, 24),
+                                        65: (0, 25),
+                                        67: (0, 26),
+                                        68: (0, 27),
+                                        70: (0, 96),
+                                        72: (0, 28),
+                                        73: (0, 29),
+                                        74: (0, 97),
+                                        75: (0, 30),
+                                        76: (0, 31),
+                                        77: (0, 32),
+                                        78: (0, 33),
+                                        81: (0, 100),
+                                        82: (0, 34),
+                                        83: (0, 35),
+                                        84: (0, 101),
+                                        87: (0, 102),
+                                        90: (0, 103),
+                                        96: (0, 38),
+                                        98: (0, 39),
+                                        99: (0, 106),
+                                        100: (0, 107),
+                                        101: (0, 40),
+                                        102: (0, 41),
+                                        105: (0, 109),
+                                        107: (0, 42),
+                                        108: (0, 43),
+                                        112: (0, 112),
+                                        114: (0, 160),
+                                        115: (0, 114),
+                                        116: (0, 115)},
+                                  140: {2: (0, 1),
+                                        3: (0, 2),
+                                        5: (0, 84),
+                                        6: (0, 3),
+                                        7: (0, 48),
+                                        10: (0, 86),
+                                        11: (0, 4),
+                                        12: (0, 5),
+                                        14: (0, 87),
+                                        15: (0, 6),
+                                        16: (0, 7),
+                                        17: (0, 8),
+                                        19: (0, 124),
+                                        20: (1, {'@': 74}),
+                                        21: (0, 89),
+                                        23: (0, 90),
+                                        25: (1, {'@': 74}),
+                                        26: (1, {'@': 74}),
+                                        34: (0, 9),
+                                        35: (0, 10),
+                                        36: (0, 11),
+                                        39: (0, 12),
+                                        40: (0, 13),
+                                        41: (0, 91),
+                                        43: (0, 14),
+                                        44: (0, 15),
+                                        50: (0, 16),
+                                        51: (0, 17),
+                                        54: (0, 92),
+                                        56: (0, 18),
+                                        57: (0, 19),
+                                        58: (0, 20),
+                                        59: (0, 21),
+                                        61: (0, 22),
+                                        62: (0, 23),
+                                        63: (0, 93),
+                                        64: (0, 24),
+                                        65: (0, 25),
+                                        66: (0, 94),
+                                        67: (0, 26),
+                                        68: (0, 27),
+                                        69: (0, 161),
+                                        70: (0, 96),
+                                        72: (0, 28),
+                                        73: (0, 29),
+                                        74: (0, 97),
+                                        75: (0, 30),
+                                        76: (0, 31),
+                                        77: (0, 32),
+                                        78: (0, 33),
+                                        79: (0, 98),
+                                        81: (0, 100),
+                                        82: (0, 34),
+                                        83: (0, 35),
+                                        84: (0, 101),
+                                        87: (0, 102),
+                                        90: (0, 103),
+                                        92: (0, 104),
+                                        96: (0, 38),
+                                        98: (0, 39),
+                                        99: (0, 106),
+                                        100: (0, 107),
+                                        101: (0, 40),
+                                        102: (0, 41),
+                                        105: (0, 109),
+                                        106: (0, 110),
+                                        107: (0, 42),
+                                        108: (0, 43),
+                                        112: (0, 112),
+                                        114: (0, 113),
+                                        115: (0, 114),
+                                        116: (0, 115)},
+                                  141: {0: (1, {'@': 106}),
+                                        1: (1, {'@': 106}),
+                                        4: (1, {'@': 106}),
+                                        9: (1, {'@': 106}),
+                                        13: (1, {'@': 106}),
+                                        18: (1, {'@': 106}),
+                                        22: (1, {'@': 106}),
+                                        23: (1, {'@': 106}),
+                                        24: (1, {'@': 106}),
+                                        25: (1, {'@': 106}),
+                                        27: (1, {'@': 106}),
+                                        28: (1, {'@': 106}),
+                                        29: (1, {'@': 106}),
+                                        30: (1, {'@': 106}),
+                                        31: (1, {'@': 106}),
+                                        32: (1, {'@': 106}),
+                                        33: (1, {'@': 106}),
+                                        37: (1, {'@': 106}),
+                                        38: (1, {'@': 106}),
+                                        40: (1, {'@': 106}),
+                                        42: (1, {'@': 106}),
+                                        43: (1, {'@': 106})},
+                                  142: {2: (1, {'@': 122}),
+                                        3: (1, {'@': 122}),
+                                        5: (1, {'@': 122}),
+                                        6: (1, {'@': 122}),
+                                        7: (1, {'@': 122}),
+                                        10: (1, {'@': 122}),
+                                        11: (1, {'@': 122}),
+                                        12: (1, {'@': 122}),
+                                        14: (1, {'@': 122}),
+                                        15: (1, {'@': 122}),
+                                        16: (1, {'@': 122}),
+                                        17: (1, {'@': 122}),
+                                        19: (1, {'@': 122}),
+                                        20: (1, {'@': 122}),
+                                        21: (1, {'@': 122}),
+                                        23: (1, {'@': 122}),
+                                        25: (1, {'@': 122}),
+                                        26: (1, {'@': 122}),
+                                        34: (1, {'@': 122}),
+                                        35: (1, {'@': 122}),
+                                        36: (1, {'@': 122}),
+                                        39: (1, {'@': 122}),
+                                        40: (1, {'@': 122}),
+                                        41: (1, {'@': 122}),
+                                        43: (1, {'@': 122}),
+                                        44: (1, {'@': 122})},
+                                  143: {2: (1, {'@': 124}),
+                                        3: (1, {'@': 124}),
+                                        5: (1, {'@': 124}),
+                                        6: (1, {'@': 124}),
+                                        7: (1, {'@': 124}),
+                                        10: (1, {'@': 124}),
+                                        11: (1, {'@': 124}),
+                                        12: (1, {'@': 124}),
+                                        14: (1, {'@': 124}),
+                                        15: (1, {'@': 124}),
+                                        16: (1, {'@': 124}),
+                                        17: (1, {'@': 124}),
+                                        19: (1, {'@': 124}),
+                                        20: (1, {'@': 124}),
+                                        21: (1, {'@': 124}),
+                                        23: (1, {'@': 124}),
+                                        25: (1, {'@': 124}),
+                                        26: (1, {'@': 124}),
+                                        34: (1, {'@': 124}),
+                                        35: (1, {'@': 124}),
+                                        36: (1, {'@': 124}),
+                                        39: (1, {'@': 124}),
+                                        40: (1, {'@': 124}),
+                                        41: (1, {'@': 124}),
+                                        43: (1, {'@': 124}),
+                                        44: (1, {'@': 124})},
+                                  144: {2: (1, {'@': 121}),
+                                        3: (1, {'@': 121}),
+                                        5: (1, {'@': 121}),
+                                        6: (1, {'@': 121}),
+                                        7: (1, {'@': 121}),
+                                        10: (1, {'@': 121}),
+                                        11: (1, {'@': 121}),
+                                        12: (1, {'@': 121}),
+                                        14: (1, {'@': 121}),
+                                        15: (1, {'@': 121}),
+                                        16: (1, {'@': 121}),
+                                        17: (1, {'@': 121}),
+                                        19: (1, {'@': 121}),
+                                        20: (1, {'@': 121}),
+                                        21: (1, {'@': 121}),
+                                        23: (1, {'@': 121}),
+                                        25: (1, {'@': 121}),
+                                        26: (1, {'@': 121}),
+                                        34: (1, {'@': 121}),
+                                        35: (1, {'@': 121}),
+                                        36: (1, {'@': 121}),
+                                        39: (1, {'@': 121}),
+                                        40: (1, {'@': 121}),
+                                        41: (1, {'@': 121}),
+                                        43: (1, {'@': 121}),
+                                        44: (1, {'@': 121})},
+                                  145: {2: (1, {'@': 123}),
+                                        3: (1, {'@': 123}),
+                                        5: (1, {'@': 123}),
+                                        6: (1, {'@': 123}),
+                                        7: (1, {'@': 123}),
+                                        10: (1, {'@': 123}),
+                                        11: (1, {'@': 123}),
+                                        12: (1, {'@': 123}),
+                                        14: (1, {'@': 123}),
+                                        15: (1, {'@': 123}),
+                                        16: (1, {'@': 123}),
+                                        17: (1, {'@': 123}),
+                                        19: (1, {'@': 123}),
+                                        20: (1, {'@': 123}),
+                                        21: (1, {'@': 123}),
+                                        23: (1, {'@': 123}),
+                                        25: (1, {'@': 123}),
+                                        26: (1, {'@': 123}),
+                                        34: (1, {'@': 123}),
+                                        35: (1, {'@': 123}),
+                                        36: (1, {'@': 123}),
+                                        39: (1, {'@': 123}),
+                                        40: (1, {'@': 123}),
+                                        41: (1, {'@': 123}),
+                                        43: (1, {'@': 123}),
+                                        44: (1, {'@': 123})},
+                                  146: {2: (0, 1),
+                                        3: (0, 2),
+                                        5: (0, 84),
+                                        6: (0, 3),
+                                        7: (0, 48),
+                                        10: (0, 86),
+                                        11: (0, 4),
+                                        12: (0, 5),
+                                        14: (0, 87),
+                                        15: (0, 6),
+                                        16: (0, 7),
+                                        17: (0, 8),
+                                        19: (0, 124),
+                                        20: (1, {'@': 74}),
+                                        21: (0, 89),
+                                        23: (0, 90),
+                                        25: (1, {'@': 74}),
+                                        26: (1, {'@': 74}),
+                                        34: (0, 9),
+                                        35: (0, 10),
+                                        36: (0, 11),
+                                        39: (0, 12),
+                                        40: (0, 13),
+                                        41: (0, 91),
+                                        43: (0, 14),
+                                        44: (0, 15),
+                                        50: (0, 16),
+                                        51: (0, 17),
+                                        54: (0, 92),
+                                        56: (0, 18),
+                                        57: (0, 19),
+                                        58: (0, 20),
+                                        59: (0, 21),
+                                        61: (0, 22),
+                                        62: (0, 23),
+                                        63: (0, 93),
+                                        64: (0, 24),
+                                        65: (0, 25),
+                                        66: (0, 162),
+                                        67: (0, 26),
+                                        68: (0, 27),
+                                        70: (0, 96),
+                                        72: (0, 28),
+                                        73: (0, 29),
+                                        74: (0, 97),
+                                        75: (0, 30),
+                                        76: (0, 31),
+                                        77: (0, 32),
+                                        78: (0, 33),
+                                        81: (0, 100),
+                                        82: (0, 34),
+                                        83: (0, 35),
+                                        84: (0, 101),
+                                        87: (0, 102),
+                                        90: (0, 103),
+                                        92: (0, 104),
+                                        96: (0, 38),
+                                        98: (0, 39),
+                                        99: (0, 106),
+                                        100: (0, 107),
+                                        101: (0, 40),
+                                        102: (0, 41),
+                                        105: (0, 109),
+                                        107: (0, 42),
+                                        108: (0, 43),
+                                        112: (0, 112),
+                                        114: (0, 113),
+                                        115: (0, 114),
+                                        116: (0, 115)},
+                                  147: {0: (1, {'@': 107}),
+                                        1: (1, {'@': 107}),
+                                        4: (1, {'@': 107}),
+                                        9: (1, {'@': 107}),
+                                        13: (1, {'@': 107}),
+                                        18: (1, {'@': 107}),
+                                        22: (1, {'@': 107}),
+                                        23: (1, {'@': 107}),
+                                        24: (1, {'@': 107}),
+                                        25: (1, {'@': 107}),
+                                        27: (1, {'@': 107}),
+                                        28: (1, {'@': 107}),
+                                        29: (1, {'@': 107}),
+                                        30: (1, {'@': 107}),
+                                        31: (1, {'@': 107}),
+                                        32: (1, {'@': 107}),
+                                        33: (1, {'@': 107}),
+                                        37: (1, {'@': 107}),
+                                        38: (1, {'@': 107}),
+                                        40: (1, {'@': 107}),
+                                        42: (1, {'@': 107}),
+                                        43: (1, {'@': 107})},
+                                  148: {2: (0, 1),
+                                        3: (0, 2),
+                                        5: (0, 84),
+                                        6: (0, 3),
+                                        7: (0, 48),
+                                        10: (0, 86),
+                                        11: (0, 4),
+                                        12: (0, 5),
+                                        14: (0, 87),
+                                        15: (0, 6),
+                                        16: (0, 7),
+                                        17: (0, 8),
+                                        19: (0, 124),
+                                        20: (1, {'@': 74}),
+                                        21: (0, 89),
+                                        25: (1, {'@': 74}),
+                                        26: (1, {'@': 74}),
+                                        34: (0, 9),
+                                        35: (0, 10),
+                                        36: (0, 11),
+                                        39: (0, 12),
+                                        40: (0, 13),
+                                        41: (0, 91),
+                                        43: (0, 14),
+                                        44: (0, 15),
+                                        50: (0, 16),
+                                        51: (0, 17),
+                                        54: (0, 92),
+                                        56: (0, 18),
+                                        57: (0, 19),
+                                        58: (0, 20),
+                                        59: (0, 21),
+                                        61: (0, 22),
+                                        62: (0, 23),
+                                        63: (0, 93),
+                                        64: (0, 24),
+                                        65: (0, 25),
+                                        67: (0, 26),
+                                        68: (0, 27),
+                                        70: (0, 96),
+                                        72: (0, 28),
+                                        73: (0, 29),
+                                        74: (0, 97),
+                                        75: (0, 30),
+                                        76: (0, 31),
+                                        77: (0, 32),
+                                        78: (0, 33),
+                                        81: (0, 100),
+                                        82: (0, 34),
+                                        83: (0, 35),
+                                        84: (0, 101),
+                                        87: (0, 102),
+                                        90: (0, 103),
+                                        96: (0, 38),
+                                        98: (0, 39),
+                                        99: (0, 106),
+                                        100: (0, 163),
+                                        101: (0, 40),
+                                        102: (0, 41),
+                                        105: (0, 109),
+                                        107: (0, 42),
+                                        108: (0, 43),
+                                        112: (0, 112),
+                                        116: (0, 115)},
+                                  149: {38: (1, {'@': 166})},
+                                  150: {19: (0, 164)},
+                                  151: {19: (0, 165)},
+                                  152: {8: (0, 166), 38: (1, {'@': 161})},
+                                  153: {1: (1, {'@': 154}),
+                                        4: (1, {'@': 154}),
+                                        9: (1, {'@': 154}),
+                                        13: (1, {'@': 154}),
+                                        18: (1, {'@': 154}),
+                                        22: (1, {'@': 154}),
+                                        23: (1, {'@': 154}),
+                                        24: (1, {'@': 154}),
+                                        25: (1, {'@': 154}),
+                                        27: (1, {'@': 154}),
+                                        28: (1, {'@': 154}),
+                                        29: (1, {'@': 154}),
+                                        30: (1, {'@': 154}),
+                                        31: (1, {'@': 154}),
+                                        32: (1, {'@': 154}),
+                                        33: (1, {'@': 154}),
+                                        37: (1, {'@': 154}),
+                                        38: (1, {'@': 154}),
+                                        42: (1, {'@': 154})},
+                                  154: {1: (1, {'@': 157}),
+                                        4: (1, {'@': 157}),
+                                        9: (1, {'@': 157}),
+                                        13: (1, {'@': 157}),
+                                        18: (1, {'@': 157}),
+                                        22: (1, {'@': 157}),
+                                        23: (1, {'@': 157}),
+                                        24: (1, {'@': 157}),
+                                        25: (1, {'@': 157}),
+                                        27: (1, {'@': 157}),
+                                        28: (1, {'@': 157}),
+                                        29: (1, {'@': 157}),
+                                        30: (1, {'@': 157}),
+                                        31: (1, {'@': 157}),
+                                        32: (1, {'@': 157}),
+                                        33: (1, {'@': 157}),
+                                        37: (1, {'@': 157}),
+                                        38: (1, {'@': 157}),
+                                        42: (1, {'@': 157})},
+                                  155: {9: (1, {'@': 159}), 37: (1, {'@': 159})},
+                                  156: {9: (0, 167), 37: (0, 168)},
+                                  157: {1: (1, {'@': 125}),
+                                        4: (1, {'@': 125}),
+                                        9: (1, {'@': 125}),
+                                        13: (0, 136),
+                                        23: (1, {'@': 125}),
+                                        24: (0, 137),
+                                        25: (0, 138),
+                                        27: (1, {'@': 125}),
+                                        28: (1, {'@': 125}),
+                                        29: (1, {'@': 125}),
+                                        30: (1, {'@': 125}),
+                                        31: (1, {'@': 125}),
+                                        32: (1, {'@': 125}),
+                                        33: (1, {'@': 125}),
+                                        37: (1, {'@': 125}),
+                                        38: (1, {'@': 125}),
+                                        55: (0, 139)},
+                                  158: {4: (1, {'@': 113}),
+                                        9: (1, {'@': 113}),
+                                        27: (0, 132),
+                                        32: (0, 133),
+                                        33: (1, {'@': 113}),
+                                        37: (1, {'@': 113}),
+                                        38: (1, {'@': 113}),
+                                        52: (0, 134)},
+                                  159: {4: (1, {'@': 115}),
+                                        9: (1, {'@': 115}),
+                                        27: (1, {'@': 115}),
+                                        28: (0, 142),
+                                        29: (0, 143),
+                                        30: (0, 144),
+                                        31: (0, 145),
+                                        32: (1, {'@': 115}),
+                                        33: (1, {'@': 115}),
+                                        37: (1, {'@': 115}),
+                                        38: (1, {'@': 115}),
+                                        60: (0, 146)},
+                                  160: {1: (1, {'@': 129}),
+                                        4: (1, {'@': 129}),
+                                        9: (1, {'@': 129}),
+                                        13: (1, {'@': 129}),
+                                        23: (1, {'@': 129}),
+                                        24: (1, {'@': 129}),
+                                        25: (1, {'@': 129}),
+                                        27: (1, {'@': 129}),
+                                        28: (1, {'@': 129}),
+                                        29: (1, {'@': 129}),
+                                        30: (1, {'@': 129}),
+                                        31: (1, {'@': 129}),
+                                        32: (1, {'@': 129}),
+                                        33: (1, {'@': 129}),
+                                        37: (1, {'@': 129}),
+                                        38: (1, {'@': 129})},
+                                  161: {4: (0, 131),
+                                        9: (1, {'@': 111}),
+                                        33: (1, {'@': 111}),
+                                        37: (1, {'@': 111}),
+                                        38: (1, {'@': 111})},
+                                  162: {1: (0, 128),
+                                        4: (1, {'@': 119}),
+                                        9: (1, {'@': 119}),
+                                        23: (0, 129),
+                                        27: (1, {'@': 119}),
+                                        28: (1, {'@': 119}),
+                                        29: (1, {'@': 119}),
+                                        30: (1, {'@': 119}),
+                                        31: (1, {'@': 119}),
+                                        32: (1, {'@': 119}),
+                                        33: (1, {'@': 119}),
+                                        37: (1, {'@': 119}),
+                                        38: (1, {'@': 119}),
+                                        49: (0, 130)},
+                                  163: {1: (1, {'@': 136}),
+                                        4: (1, {'@': 136}),
+                                        9: (1, {'@': 136}),
+                                        13: (1, {'@': 136}),
+                                        23: (1, {'@': 136}),
+                                        24: (1, {'@': 136}),
+                                        25: (1, {'@': 136}),
+                                        27: (1, {'@': 136}),
+                                        28: (1, {'@': 136}),
+                                        29: (1, {'@': 136}),
+                                        30: (1, {'@': 136}),
+                                        31: (1, {'@': 136}),
+                                        32: (1, {'@': 136}),
+                                        33: (1, {'@': 136}),
+                                        37: (1, {'@': 136}),
+                                        38: (1, {'@': 136}),
+                                        42: (1, {'@': 136})},
+                                  164: {38: (1, {'@': 164})},
+                                  165: {38: (1, {'@': 162})},
+                                  166: {19: (0, 169)},
+                                  167: {2: (0, 1),
+                                        3: (0, 2),
+                                        5: (0, 84),
+                                        6: (0, 3),
+                                        7: (0, 48),
+                                        10: (0, 86),
+                                        11: (0, 4),
+                                        12: (0, 5),
+                                        14: (0, 87),
+                                        15: (0, 6),
+                                        16: (0, 7),
+                                        17: (0, 8),
+                                        19: (0, 124),
+                                        20: (1, {'@': 74}),
+                                        21: (0, 89),
+                                        23: (0, 90),
+                                        25: (1, {'@': 74}),
+                                        26: (1, {'@': 74}),
+                                        34: (0, 9),
+                                        35: (0, 10),
+                                        36: (0, 11),
+                                        39: (0, 12),
+                                        40: (0, 13),
+                                        41: (0, 91),
+                                        43: (0, 14),
+                                        44: (0, 15),
+                                        50: (0, 16),
+                                        51: (0, 17),
+                                        54: (0, 92),
+                                        56: (0, 18),
+                                        57: (0, 19),
+                                        58: (0, 20),
+                                        59: (0, 21),
+                                        61: (0, 22),
+                                        62: (0, 23),
+                                        63: (0, 93),
+                                        64: (0, 24),
+                                        65: (0, 25),
+                                        66: (0, 94),
+                                        67: (0, 26),
+                                        68: (0, 27),
+                                        69: (0, 95),
+                                        70: (0, 96),
+                                        72: (0, 28),
+                                        73: (0, 29),
+                                        74: (0, 97),
+                                        75: (0, 30),
+                                        76: (0, 31),
+                                        77: (0, 32),
+                                        78: (0, 33),
+                                        79: (0, 98),
+                                        80: (0, 170),
+                                        81: (0, 100),
+                                        82: (0, 34),
+                                        83: (0, 35),
+                                        84: (0, 101),
+                                        87: (0, 102),
+                                        90: (0, 103),
+                                        92: (0, 104),
+                                        96: (0, 38),
+                                        97: (0, 105),
+                                        98: (0, 39),
+                                        99: (0, 106),
+                                        100: (0, 107),
+                                        101: (0, 40),
+                                        102: (0, 41),
+                                        105: (0, 109),
+                                        106: (0, 110),
+                                        107: (0, 42),
+                                        108: (0, 43),
+                                        112: (0, 112),
+                                        114: (0, 113),
+                                        115: (0, 114),
+                                        116: (0, 115)},
+                                  168: {1: (1, {'@': 156}),
+                                        4: (1, {'@': 156}),
+                                        9: (1, {'@': 156}),
+                                        13: (1, {'@': 156}),
+                                        18: (1, {'@': 156}),
+                                        22: (1, {'@': 156}),
+                                        23: (1, {'@': 156}),
+                                        24: (1, {'@': 156}),
+                                        25: (1, {'@': 156}),
+                                        27: (1, {'@': 156}),
+                                        28: (1, {'@': 156}),
+                                        29: (1, {'@': 156}),
+                                        30: (1, {'@': 156}),
+                                        31: (1, {'@': 156}),
+                                        32: (1, {'@': 156}),
+                                        33: (1, {'@': 156}),
+                                        37: (1, {'@': 156}),
+                                        38: (1, {'@': 156}),
+                                        42: (1, {'@': 156})},
+                                  169: {38: (1, {'@': 160})},
+                                  170: {9: (1, {'@': 158}), 37: (1, {'@': 158})}},
+                       'tokens': {0: '$END',
+                                  1: 'ADD_OP',
+                                  2: 'ANCESTOR',
+                                  3: 'ANCESTOR_OR_SELF',
+                                  4: 'AND',
+                                  5: 'AT',
+                                  6: 'CHILD',
+                                  7: 'CNAME',
+                                  8: 'COLON',
+                                  9: 'COMMA',
+                                  10: 'DECIMAL_LITERAL',
+                                  11: 'DESCENDANT',
+                                  12: 'DESCENDANT_OR_SELF',
+                                  13: 'DIV_OP',
+                                  14: 'DOLLAR',
+                                  15: 'DOT',
+                                  16: 'FOLLOWING',
+                                  17: 'FOLLOWING_SIBLING',
+                                  18: 'INDEX_PREDICATE_TAG',
+                                  19: 'INTEGER_LITERAL',
+                                  20: 'LEAF',
+                                  21: 'LPAR',
+                                  22: 'LSQB',
+                                  23: 'MINUS_OP',
+                                  24: 'MOD_OP',
+                                  25: 'MUL_OP',
+                                  26: 'NODE',
+                                  27: 'OP_EQUAL',
+                                  28: 'OP_GREATER_THAN',
+                                  29: 'OP_GREATER_THAN_EQUAL',
+                                  30: 'OP_LESS_THAN',
+                                  31: 'OP_LESS_THAN_EQUAL',
+                                  32: 'OP_NOT_EQUAL',
+                                  33: 'OR',
+                                  34: 'PARENT',
+                                  35: 'PRECEDING',
+                                  36: 'PRECEDING_SIBLING',
+                                  37: 'RPAR',
+                                  38: 'RSQB',
+                                  39: 'SELF',
+                                  40: 'SLASH',
+                                  41: 'STRING_LITERAL',
+                                  42: 'VBAR',
+                                  43: '__ANON_0',
+                                  44: '__ANON_1',
+                                  45: '__ANON_2',
+                                  46: '___raw_path_step_star_2',
+                                  47: '___root_location_path_star_1',
+                                  48: '__location_union_plus_0',
+                                  49: '_additive_op',
+                                  50: '_axis_name',
+                                  51: '_axisspecifier',
+                                  52: '_equality_op',
+                                  53: '_expr_predicate',
+                                  54: '_literal',
+                                  55: '_multiply_op',
+                                  56: '_raw_abbreviated_step',
+                                  57: '_raw_attribute_step',
+                                  58: '_raw_path_step',
+                                  59: '_raw_step',
+                                  60: '_relational_op',
+                                  61: '_root_descendent_path',
+                                  62: '_root_location_path',
+                                  63: '_tname',
+                                  64: 'abbreviatedstep',
+                                  65: 'absolutelocation_path',
+                                  66: 'additive_expr',
+                                  67: 'ancestor_axis_specifier',
+                                  68: 'ancestor_or_self',
+                                  69: 'and_expr',
+                                  70: 'attribute_accessor',
+                                  71: 'attribute_step',
+                                  72: 'child_axis_specifier',
+                                  73: 'child_step',
+                                  74: 'decimal_literal',
+                                  75: 'default_axis_specifier',
+                                  76: 'descendant_axis_specifier',
+                                  77: 'descendant_or_self',
+                                  78: 'descendent_step',
+                                  79: 'equality_expr',
+                                  80: 'expr',
+                                  81: 'filter_expr',
+                                  82: 'following_axis_specifier',
+                                  83: 'following_sibling',
+                                  84: 'functioncall',
+                                  85: 'functioncall_list',
+                                  86: 'index_predicate',
+                                  87: 'integer_literal',
+                                  88: 'kind_test',
+                                  89: 'leaf_node_test',
+                                  90: 'location_path',
+                                  91: 'location_union',
+                                  92: 'multiply_expr',
+                                  93: 'name_test',
+                                  94: 'node_node_test',
+                                  95: 'node_test',
+                                  96: 'null_axis_specifier',
+                                  97: 'or_expr',
+                                  98: 'parent_axis_specifier',
+                                  99: 'parenthesized_expr',
+                                  100: 'path_expr',
+                                  101: 'preceding_axis_specifier',
+                                  102: 'preceding_sibling',
+                                  103: 'predicate',
+                                  104: 'predicate_expr',
+                                  105: 'primary_expr',
+                                  106: 'relational_expr',
+                                  107: 'relativelocation_path',
+                                  108: 'self_axis_specifier',
+                                  109: 'slice_expr',
+                                  110: 'start',
+                                  111: 'step',
+                                  112: 'string_literal',
+                                  113: 'tname_test',
+                                  114: 'unary_expr',
+                                  115: 'union_expr',
+                                  116: 'varref',
+                                  117: 'wildcard_name_test'}},
+            'parser_conf': {'__type__': 'ParserConf',
+                            'parser_type': 'lalr',
+                            'rules': [{'@': 46},
+                                      {'@': 47},
+                                      {'@': 48},
+                                      {'@': 49},
+                                      {'@': 50},
+                                      {'@': 51},
+                                      {'@': 52},
+                                      {'@': 53},
+                                      {'@': 54},
+                                      {'@': 55},
+                                      {'@': 56},
+                                      {'@': 57},
+                                      {'@': 58},
+                                      {'@': 59},
+                                      {'@': 60},
+                                      {'@': 61},
+                                      {'@': 62},
+                                      {'@': 63},
+                                      {'@': 64},
+                                      {'@': 65},
+                                      {'@': 66},
+                                      {'@': 67},
+                                      {'@': 68},
+                                      {'@': 69},
+                                      {'@': 70},
+                                      {'@': 71},
+                                      {'@': 72},
+                                      {'@': 73},
+                                      {'@': 74},
+                                      {'@': 75},
+                                      {'@': 76},
+                                      {'@': 77},
+                                      {'@': 78},
+                                      {'@': 79},
+                                      {'@': 80},
+                                      {'@': 81},
+                                      {'@': 82},
+                                      {'@': 83},
+                                      {'@': 84},
+                                      {'@': 85},
+                                      {'@': 86},
+                                      {'@': 87},
+                                      {'@': 88},
+                                      {'@': 89},
+                                      {'@': 90},
+                                      {'@': 91},
+                                      {'@': 92},
+                                      {'@': 93},
+                                      {'@': 94},
+                                      {'@': 95},
+                                      {'@': 96},
+                                      {'@': 97},
+                                      {'@': 98},
+                                      {'@': 99},
+                                      {'@': 100},
+                                      {'@': 101},
+                                      {'@': 102},
+                                      {'@': 103},
+                                      {'@': 104},
+                                      {'@': 105},
+                                      {'@': 106},
+                                      {'@': 107},
+                                      {'@': 108},
+                                      {'@': 109},
+                                      {'@': 110},
+                                      {'@': 111},
+                                      {'@': 112},
+                                      {'@': 113},
+                                      {'@': 114},
+                                      {'@': 115},
+                                      {'@': 116},
+                                      {'@': 117},
+                                      {'@': 118},
+                                      {'@': 119},
+                                      {'@': 120},
+                                      {'@': 121},
+                                      {'@': 122},
+                                      {'@': 123},
+                                      {'@': 124},
+                                      {'@': 125},
+                                      {'@': 126},
+                                      {'@': 127},
+                                      {'@': 128},
+                                      {'@': 129},
+                                      {'@': 130},
+                                      {'@': 131},
+                                      {'@': 132},
+                                      {'@': 133},
+                                      {'@': 134},
+                                      {'@': 135},
+                                      {'@': 136},
+                                      {'@': 137},
+                                      {'@': 138},
+                                      {'@': 139},
+                                      {'@': 140},
+                                      {'@': 141},
+                                      {'@': 142},
+                                      {'@': 143},
+                                      {'@': 144},
+                                      {'@': 145},
+                                      {'@': 146},
+                                      {'@': 147},
+                                      {'@': 148},
+                                      {'@': 149},
+                                      {'@': 150},
+                                      {'@': 151},
+                                      {'@': 152},
+                                      {'@': 153},
+                                      {'@': 154},
+                                      {'@': 155},
+                                      {'@': 156},
+                                      {'@': 157},
+                                      {'@': 158},
+                                      {'@': 159},
+                                      {'@': 160},
+                                      {'@': 161},
+                                      {'@': 162},
+                                      {'@': 163},
+                                      {'@': 164},
+                                      {'@': 165},
+                                      {'@': 166},
+                                      {'@': 167},
+                                      {'@': 168},
+                                      {'@': 169},
+                                      {'@': 170},
+                                      {'@': 171},
+                                      {'@': 172},
+                                      {'@': 173},
+                                      {'@': 174},
+                                      {'@': 175},
+                                      {'@': 176},
+                                      {'@': 177},
+                                      {'@': 178},
+                                      {'@': 179},
+                                      {'@': 180}],
+                            'start': ['start']}},
+ 'rules': [{'@': 46},
+           {'@': 47},
+           {'@': 48},
+           {'@': 49},
+           {'@': 50},
+           {'@': 51},
+           {'@': 52},
+           {'@': 53},
+           {'@': 54},
+           {'@': 55},
+           {'@': 56},
+           {'@': 57},
+           {'@': 58},
+           {'@': 59},
+           {'@': 60},
+           {'@': 61},
+           {'@': 62},
+           {'@': 63},
+           {'@': 64},
+           {'@': 65},
+           {'@': 66},
+           {'@': 67},
+           {'@': 68},
+           {'@': 69},
+           {'@': 70},
+           {'@': 71},
+           {'@': 72},
+           {'@': 73},
+           {'@': 74},
+           {'@': 75},
+           {'@': 76},
+           {'@': 77},
+           {'@': 78},
+           {'@': 79},
+           {'@': 80},
+           {'@': 81},
+           {'@': 82},
+           {'@': 83},
+           {'@': 84},
+           {'@': 85},
+           {'@': 86},
+           {'@': 87},
+           {'@': 88},
+           {'@': 89},
+           {'@': 90},
+           {'@': 91},
+           {'@': 92},
+           {'@': 93},
+           {'@': 94},
+           {'@': 95},
+           {'@': 96},
+           {'@': 97},
+           {'@': 98},
+           {'@': 99},
+           {'@': 100},
+           {'@': 101},
+           {'@': 102},
+           {'@': 103},
+           {'@': 104},
+           {'@': 105},
+           {'@': 106},
+           {'@': 107},
+           {'@': 108},
+           {'@': 109},
+           {'@': 110},
+           {'@': 111},
+           {'@': 112},
+           {'@': 113},
+           {'@': 114},
+           {'@': 115},
+           {'@': 116},
+           {'@': 117},
+           {'@': 118},
+           {'@': 119},
+           {'@': 120},
+           {'@': 121},
+           {'@': 122},
+           {'@': 123},
+           {'@': 124},
+           {'@': 125},
+           {'@': 126},
+           {'@': 127},
+           {'@': 128},
+           {'@': 129},
+           {'@': 130},
+           {'@': 131},
+           {'@': 132},
+           {'@': 133},
+           {'@': 134},
+           {'@': 135},
+           {'@': 136},
+           {'@': 137},
+           {'@': 138},
+           {'@': 139},
+           {'@': 140},
+           {'@': 141},
+           {'@': 142},
+           {'@': 143},
+           {'@': 144},
+           {'@': 145},
+           {'@': 146},
+           {'@': 147},
+           {'@': 148},
+           {'@': 149},
+           {'@': 150},
+           {'@': 151},
+           {'@': 152},
+           {'@': 153},
+           {'@': 154},
+           {'@': 155},
+           {'@': 156},
+           {'@': 157},
+           {'@': 158},
+           {'@': 159},
+           {'@': 160},
+           {'@': 161},
+           {'@': 162},
+           {'@': 163},
+           {'@': 164},
+           {'@': 165},
+           {'@': 166},
+           {'@': 167},
+           {'@': 168},
+           {'@': 169},
+           {'@': 170},
+           {'@': 171},
+           {'@': 172},
+           {'@': 173},
+           {'@': 174},
+           {'@': 175},
+           {'@': 176},
+           {'@': 177},
+           {'@': 178},
+           {'@': 179},
+           {'@': 180}]}
+MEMO = {0: {'__type__': 'TerminalDef',
+     'name': 'CNAME',
+     'pattern': {'__type__': 'PatternRE',
+                 '_width': [1, 18446744073709551616],
+                 'flags': [],
+                 'value': '(?:(?:[A-Z]|[a-z])|_)(?:(?:(?:[A-Z]|[a-z])|[0-9]|_))*'},
+     'priority': 1},
+ 1: {'__type__': 'TerminalDef',
+     'name': 'WS_INLINE',
+     'pattern': {'__type__': 'PatternRE', '_width': [1, 18446744073709551616], 'flags': [], 'value': '(?:(?:\\ |\t))+'},
+     'priority': 1},
+ 2: {'__type__': 'TerminalDef',
+     'name': 'DESCENDANT_OR_SELF',
+     'pattern': {'__type__': 'PatternStr', 'flags': [], 'value': 'descendant-or-self'},
+     'priority': 2},
+ 3: {'__type__': 'TerminalDef',
+     'name': 'ANCESTOR_OR_SELF',
+     'pattern': {'__type__': 'PatternStr', 'flags': [], 'value': 'ancestor-or-self'},
+     'priority': 2},
+ 4: {'__type__': 'TerminalDef',
+     'name': 'FOLLOWING_SIBLING',
+     'pattern': {'__type__': 'PatternStr', 'flags': [], 'value': 'following-sibling'},
+     'priority': 2},
+ 5: {'__type__': 'TerminalDef',
+     'name': 'PRECEDING_SIBLING',
+     'pattern': {'__type__': 'PatternStr', 'flags': [], 'value': 'preceding-sibling'},
+     'priority': 2},
+ 6: {'__type__': 'TerminalDef',
+     'name': 'INDEX_PREDICATE_TAG',
+     'pattern': {'__type__': 'PatternRE',
+                 '_width': [3, 18446744073709551616],
+                 'flags': [],
+                 'value': '\\[(?:(?:(?:\\+|\\-))?)?(?:[0-9])+\\]'},
+     'priority': 2},
+ 7: {'__type__': 'TerminalDef',
+     'name': 'INTEGER_LITERAL',
+     'pattern': {'__type__': 'PatternRE',
+                 '_width': [1, 18446744073709551616],
+                 'flags': [],
+                 'value': '(?:(?:(?:\\+|\\-))?)?(?:[0-9])+'},
+     'priority': 1},
+ 8: {'__type__': 'TerminalDef',
+     'name': 'STRING_LITERAL',
+     'pattern': {'__type__': 'PatternRE',
+                 '_width': [2, 18446744073709551616],
+                 'flags': [],
+                 'value': '(?:"[^"]*"|"[^"]*")'},
+     'priority': 1},
+ 9: {'__type__': 'TerminalDef',
+     'name': 'DECIMAL_LITERAL',
+     'pattern': {'__type__': 'PatternRE',
+                 '_width': [2, 18446744073709551616],
+                 'flags': [],
+                 'value': '(?:(?:(?:\\+|\\-))?)?(?:(?:[0-9])+\\.(?:(?:[0-9])+)?|\\.(?:[0-9])+)'},
+     'priority': 1},
+ 10: {'__type__': 'TerminalDef',
+      'name': 'OP_EQUAL',
+      'pattern': {'__type__': 'PatternStr', 'flags': [], 'value': '=='},
+      'priority': 1},
+ 11: {'__type__': 'TerminalDef',
+      'name': 'OP_NOT_EQUAL',
+      'pattern': {'__type__': 'PatternStr', 'flags': [], 'value': '!='},
+      'priority': 1},
+ 12: {'__type__': 'TerminalDef',
+      'name': 'OP_LESS_THAN',
+      'pattern': {'__type__': 'PatternStr', 'flags': [], 'value': '<'},
+      'priority': 1},
+ 13: {'__type__': 'TerminalDef',
+      'name': 'OP_GREATER_THAN',
+      'pattern': {'__type__': 'PatternStr', 'flags': [], 'value': '>'},
+      'priority': 1},
+ 14: {'__type__': 'TerminalDef',
+      'name': 'OP_LESS_THAN_EQUAL',
+      'pattern': {'__type__': 'PatternStr', 'flags': [], 'value': '<='},
+      'priority': 1},
+ 15: {'__type__': 'TerminalDef',
+      'name': 'OP_GREATER_THAN_EQUAL',
+      'pattern': {'__type__': 'PatternStr', 'flags': [], 'value': '>='},
+      'priority': 1},
+ 16: {'__type__': 'TerminalDef',
+      'name': 'ADD_OP',
+      'pattern': {'__type__': 'PatternStr', 'flags': [], 'value': '+'},
+      'priority': 1},
+ 17: {'__type__': 'TerminalDef',
+      'name': 'MINUS_OP',
+      'pattern': {'__type__': 'PatternStr', 'flags': [], 'value': '-'},
+      'priority': 1},
+ 18: {'__type__': 'TerminalDef',
+      'name': 'MUL_OP',
+      'pattern': {'__type__': 'PatternStr', 'flags': [], 'value': '*'},
+      'priority': 1},
+ 19: {'__type__': 'TerminalDef',
+      'name': 'DIV_OP',
+      'pattern': {'__type__': 'PatternStr', 'flags': [], 'value': 'div'},
+      'priority': 1},
+ 20: {'__type__': 'TerminalDef',
+      'name': 'MOD_OP',
+      'pattern': {'__type__': 'PatternStr', 'flags': [], 'value': 'mod'},
+      'priority': 1},
+ 21: {'__type__': 'TerminalDef',
+      'name': 'VBAR',
+      'pattern': {'__type__': 'PatternStr', 'flags': [], 'value': '|'},
+      'priority': 1},
+ 22: {'__type__': 'TerminalDef',
+      'name': 'SLASH',
+      'pattern': {'__type__': 'PatternStr', 'flags': [], 'value': '/'},
+      'priority': 1},
+ 23: {'__type__': 'TerminalDef',
+      'name': '__ANON_0',
+      'pattern': {'__type__': 'PatternStr', 'flags': [], 'value': '//'},
+      'priority': 1},
+ 24: {'__type__': 'TerminalDef',
+      'name': 'DOT',
+      'pattern': {'__type__': 'PatternStr', 'flags': [], 'value': '.'},
+      'priority': 1},
+ 25: {'__type__': 'TerminalDef',
+      'name': '__ANON_1',
+      'pattern': {'__type__': 'PatternStr', 'flags': [], 'value': '..'},
+      'priority': 1},
+ 26: {'__type__': 'TerminalDef',
+      'name': '__ANON_2',
+      'pattern': {'__type__': 'PatternStr', 'flags': [], 'value': '::'},
+      'priority': 1},
+ 27: {'__type__': 'TerminalDef',
+      'name': 'AT',
+      'pattern': {'__type__': 'PatternStr', 'flags': [], 'value': '@'},
+      'priority': 1},
+ 28: {'__type__': 'TerminalDef',
+      'name': 'CHILD',
+      'pattern': {'__type__': 'PatternStr', 'flags': [], 'value': 'child'},
+      'priority': 1},
+ 29: {'__type__': 'TerminalDef',
+      'name': 'DESCENDANT',
+      'pattern': {'__type__': 'PatternStr', 'flags': [], 'value': 'descendant'},
+      'priority': 1},
+ 30: {'__type__': 'TerminalDef',
+      'name': 'SELF',
+      'pattern': {'__type__': 'PatternStr', 'flags': [], 'value': 'self'},
+      'priority': 1},
+ 31: {'__type__': 'TerminalDef',
+      'name': 'PARENT',
+      'pattern': {'__type__': 'PatternStr', 'flags': [], 'value': 'parent'},
+      'priority': 1},
+ 32: {'__type__': 'TerminalDef',
+      'name': 'ANCESTOR',
+      'pattern': {'__type__': 'PatternStr', 'flags': [], 'value': 'ancestor'},
+      'priority': 1},
+ 33: {'__type__': 'TerminalDef',
+      'name': 'FOLLOWING',
+      'pattern': {'__type__': 'PatternStr', 'flags': [], 'value': 'following'},
+      'priority': 1},
+ 34: {'__type__': 'TerminalDef',
+      'name': 'PRECEDING',
+      'pattern': {'__type__': 'PatternStr', 'flags': [], 'value': 'preceding'},
+      'priority': 1},
+ 35: {'__type__': 'TerminalDef',
+      'name': 'LSQB',
+      'pattern': {'__type__': 'PatternStr', 'flags': [], 'value': '['},
+      'priority': 1},
+ 36: {'__type__': 'TerminalDef',
+      'name': 'RSQB',
+      'pattern': {'__type__': 'PatternStr', 'flags': [], 'value': ']'},
+      'priority': 1},
+ 37: {'__type__': 'TerminalDef',
+      'name': 'OR',
+      'pattern': {'__type__': 'PatternStr', 'flags': [], 'value': 'or'},
+      'priority': 1},
+ 38: {'__type__': 'TerminalDef',
+      'name': 'AND',
+      'pattern': {'__type__': 'PatternStr', 'flags': [], 'value': 'and'},
+      'priority': 1},
+ 39: {'__type__': 'TerminalDef',
+      'name': 'LPAR',
+      'pattern': {'__type__': 'PatternStr', 'flags': [], 'value': '('},
+      'priority': 1},
+ 40: {'__type__': 'TerminalDef',
+      'name': 'RPAR',
+      'pattern': {'__type__': 'PatternStr', 'flags': [], 'value': ')'},
+      'priority': 1},
+ 41: {'__type__': 'TerminalDef',
+      'name': 'LEAF',
+      'pattern': {'__type__': 'PatternStr', 'flags': [], 'value': 'leaf'},
+      'priority': 1},
+ 42: {'__type__': 'TerminalDef',
+      'name': 'NODE',
+      'pattern': {'__type__': 'PatternStr', 'flags': [], 'value': 'node'},
+      'priority': 1},
+ 43: {'__type__': 'TerminalDef',
+      'name': 'DOLLAR',
+      'pattern': {'__type__': 'PatternStr', 'flags': [], 'value': '$'},
+      'priority': 1},
+ 44: {'__type__': 'TerminalDef',
+      'name': 'COMMA',
+      'pattern': {'__type__': 'PatternStr', 'flags': [], 'value': ','},
+      'priority': 1},
+ 45: {'__type__': 'TerminalDef',
+      'name': 'COLON',
+      'pattern': {'__type__': 'PatternStr', 'flags': [], 'value': ':'},
+      'priority': 1},
+ 46: {'__type__': 'Rule',
+      'alias': None,
+      'expansion': [{'__type__': 'NonTerminal', 'name': 'location_path'}],
+      'options': {'__type__': 'RuleOptions',
+                  'empty_indices': (),
+                  'expand1': False,
+                  'keep_all_tokens': False,
+                  'priority': None,
+                  'template_source': None},
+      'order': 0,
+      'origin': {'__type__': 'NonTerminal', 'name': 'start'}},
+ 47: {'__type__': 'Rule',
+      'alias': None,
+      'expansion': [{'__type__': 'NonTerminal', 'name': 'location_union'}],
+      'options': {'__type__': 'RuleOptions',
+                  'empty_indices': (),
+                  'expand1': False,
+                  'keep_all_tokens': False,
+                  'priority': None,
+                  'template_source': None},
+      'order': 1,
+      'origin': {'__type__': 'NonTerminal', 'name': 'start'}},
+ 48: {'__type__': 'Rule',
+      'alias': 'union_expr',
+      'expansion': [{'__type__': 'NonTerminal', 'name': 'location_path'},
+                    {'__type__': 'NonTerminal', 'name': '__location_union_plus_0'}],
+      'options': {'__type__': 'RuleOptions',
+                  'empty_indices': (),
+                  'expand1': False,
+                  'keep_all_tokens': False,
+                  'priority': None,
+                  'template_source': None},
+      'order': 0,
+      'origin': {'__type__': 'NonTerminal', 'name': 'location_union'}},
+ 49: {'__type__': 'Rule',
+      'alias': None,
+      'expansion': [{'__type__': 'NonTerminal', 'name': 'relativelocation_path'}],
+      'options': {'__type__': 'RuleOptions',
+                  'empty_indices': (),
+                  'expand1': True,
+                  'keep_all_tokens': False,
+                  'priority': None,
+                  'template_source': None},
+      'order': 0,
+      'origin': {'__type__': 'NonTerminal', 'name': 'location_path'}},
+ 50: {'__type__': 'Rule',
+      'alias': None,
+      'expansion': [{'__type__': 'NonTerminal', 'name': 'absolutelocation_path'}],
+      'options': {'__type__': 'RuleOptions',
+                  'empty_indices': (),
+                  'expand1': True,
+                  'keep_all_tokens': False,
+                  'priority': None,
+                  'template_source': None},
+      'order': 1,
+      'origin': {'__type__': 'NonTerminal', 'name': 'location_path'}},
+ 51: {'__type__': 'Rule',
+      'alias': None,
+      'expansion': [{'__type__': 'NonTerminal', 'name': '_root_location_path'}],
+      'options': {'__type__': 'RuleOptions',
+                  'empty_indices': (),
+                  'expand1': False,
+                  'keep_all_tokens': False,
+                  'priority': None,
+                  'template_source': None},
+      'order': 0,
+      'origin': {'__type__': 'NonTerminal', 'name': 'absolutelocation_path'}},
+ 52: {'__type__': 'Rule',
+      'alias': None,
+      'expansion': [{'__type__': 'NonTerminal', 'name': '_root_descendent_path'}],
+      'options': {'__type__': 'RuleOptions',
+                  'empty_indices': (),
+                  'expand1': False,
+                  'keep_all_tokens': False,
+                  'priority': None,
+                  'template_source': None},
+      'order': 1,
+      'origin': {'__type__': 'NonTerminal', 'name': 'absolutelocation_path'}},
+ 53: {'__type__': 'Rule',
+      'alias': None,
+      'expansion': [{'__type__': 'NonTerminal', 'name': 'child_step'},
+                    {'__type__': 'NonTerminal', 'name': '___root_location_path_star_1'}],
+      'options': {'__type__': 'RuleOptions',
+                  'empty_indices': (),
+                  'expand1': False,
+                  'keep_all_tokens': False,
+                  'priority': None,
+                  'template_source': None},
+      'order': 0,
+      'origin': {'__type__': 'NonTerminal', 'name': '_root_location_path'}},
+ 54: {'__type__': 'Rule',
+      'alias': None,
+      'expansion': [{'__type__': 'NonTerminal', 'name': 'child_step'}],
+      'options': {'__type__': 'RuleOptions',
+                  'empty_indices': (),
+                  'expand1': False,
+                  'keep_all_tokens': False,
+                  'priority': None,
+                  'template_source': None},
+      'order': 1,
+      'origin': {'__type__': 'NonTerminal', 'name': '_root_location_path'}},
+ 55: {'__type__': 'Rule',
+      'alias': None,
+      'expansion': [{'__type__': 'NonTerminal', 'name': 'descendent_step'},
+                    {'__type__': 'NonTerminal', 'name': '___root_location_path_star_1'}],
+      'options': {'__type__': 'RuleOptions',
+                  'empty_indices': (),
+                  'expand1': False,
+                  'keep_all_tokens': False,
+                  'priority': None,
+                  'template_source': None},
+      'order': 0,
+      'origin': {'__type__': 'NonTerminal', 'name': '_root_descendent_path'}},
+ 56: {'__type__': 'Rule',
+      'alias': None,
+      'expansion': [{'__type__': 'NonTerminal', 'name': 'descendent_step'}],
+      'options': {'__type__': 'RuleOptions',
+                  'empty_indices': (),
+                  'expand1': False,
+                  'keep_all_tokens': False,
+                  'priority': None,
+                  'template_source': None},
+      'order': 1,
+      'origin': {'__type__': 'NonTerminal', 'name': '_root_descendent_path'}},
+ 57: {'__type__': 'Rule',
+      'alias': None,
+      'expansion': [{'__type__': 'NonTerminal', 'name': '_raw_step'},
+                    {'__type__': 'NonTerminal', 'name': '___root_location_path_star_1'}],
+      'options': {'__type__': 'RuleOptions',
+                  'empty_indices': (),
+                  'expand1': True,
+                  'keep_all_tokens': False,
+                  'priority': None,
+                  'template_source': None},
+      'order': 0,
+      'origin': {'__type__': 'NonTerminal', 'name': 'relativelocation_path'}},
+ 58: {'__type__': 'Rule',
+      'alias': None,
+      'expansion': [{'__type__': 'NonTerminal', 'name': '_raw_step'}],
+      'options': {'__type__': 'RuleOptions',
+                  'empty_indices': (),
+                  'expand1': True,
+                  'keep_all_tokens': False,
+                  'priority': None,
+                  'template_source': None},
+      'order': 1,
+      'origin': {'__type__': 'NonTerminal', 'name': 'relativelocation_path'}},
+ 59: {'__type__': 'Rule',
+      'alias': None,
+      'expansion': [{'__type__': 'NonTerminal', 'name': 'child_step'}],
+      'options': {'__type__': 'RuleOptions',
+                  'empty_indices': (),
+                  'expand1': True,
+                  'keep_all_tokens': False,
+                  'priority': None,
+                  'template_source': None},
+      'order': 0,
+      'origin': {'__type__': 'NonTerminal', 'name': 'step'}},
+ 60: {'__type__': 'Rule',
+      'alias': None,
+      'expansion': [{'__type__': 'NonTerminal', 'name': 'descendent_step'}],
+      'options': {'__type__': 'RuleOptions',
+                  'empty_indices': (),
+                  'expand1': True,
+                  'keep_all_tokens': False,
+                  'priority': None,
+                  'template_source': None},
+      'order': 1,
+      'origin': {'__type__': 'NonTerminal', 'name': 'step'}},
+ 61: {'__type__': 'Rule',
+      'alias': None,
+      'expansion': [{'__type__': 'Terminal', 'filter_out': True, 'name': 'SLASH'},
+                    {'__type__': 'NonTerminal', 'name': '_raw_step'}],
+      'options': {'__type__': 'RuleOptions',
+                  'empty_indices': (),
+                  'expand1': False,
+                  'keep_all_tokens': False,
+                  'priority': None,
+                  'template_source': None},
+      'order': 0,
+      'origin': {'__type__': 'NonTerminal', 'name': 'child_step'}},
+ 62: {'__type__': 'Rule',
+      'alias': None,
+      'expansion': [{'__type__': 'Terminal', 'filter_out': True, 'name': '__ANON_0'},
+                    {'__type__': 'NonTerminal', 'name': '_raw_step'}],
+      'options': {'__type__': 'RuleOptions',
+                  'empty_indices': (),
+                  'expand1': False,
+                  'keep_all_tokens': False,
+                  'priority': None,
+                  'template_source': None},
+      'order': 0,
+      'origin': {'__type__': 'NonTerminal', 'name': 'descendent_step'}},
+ 63: {'__type__': 'Rule',
+      'alias': None,
+      'expansion': [{'__type__': 'NonTerminal', 'name': '_raw_path_step'}],
+      'options': {'__type__': 'RuleOptions',
+                  'empty_indices': (),
+                  'expand1': False,
+                  'keep_all_tokens': False,
+                  'priority': None,
+                  'template_source': None},
+      'order': 0,
+      'origin': {'__type__': 'NonTerminal', 'name': '_raw_step'}},
+ 64: {'__type__': 'Rule',
+      'alias': None,
+      'expansion': [{'__type__': 'NonTerminal', 'name': '_raw_abbreviated_step'}],
+      'options': {'__type__': 'RuleOptions',
+                  'empty_indices': (),
+                  'expand1': False,
+                  'keep_all_tokens': False,
+                  'priority': None,
+                  'template_source': None},
+      'order': 1,
+      'origin': {'__type__': 'NonTerminal', 'name': '_raw_step'}},
+ 65: {'__type__': 'Rule',
+      'alias': None,
+      'expansion': [{'__type__': 'NonTerminal', 'name': '_raw_attribute_step'}],
+      'options': {'__type__': 'RuleOptions',
+                  'empty_indices': (),
+                  'expand1': False,
+                  'keep_all_tokens': False,
+                  'priority': None,
+                  'template_source': None},
+      'order': 2,
+      'origin': {'__type__': 'NonTerminal', 'name': '_raw_step'}},
+ 66: {'__type__': 'Rule',
+      'alias': None,
+      'expansion': [{'__type__': 'NonTerminal', 'name': '_axisspecifier'},
+                    {'__type__': 'NonTerminal', 'name': 'node_test'},
+                    {'__type__': 'NonTerminal', 'name': '___raw_path_step_star_2'}],
+      'options': {'__type__': 'RuleOptions',
+                  'empty_indices': (),
+                  'expand1': False,
+                  'keep_all_tokens': False,
+                  'priority': None,
+                  'template_source': None},
+      'order': 0,
+      'origin': {'__type__': 'NonTerminal', 'name': '_raw_path_step'}},
+ 67: {'__type__': 'Rule',
+      'alias': None,
+      'expansion': [{'__type__': 'NonTerminal', 'name': '_axisspecifier'},
+                    {'__type__': 'NonTerminal', 'name': 'node_test'}],
+      'options': {'__type__': 'RuleOptions',
+                  'empty_indices': (),
+                  'expand1': False,
+                  'keep_all_tokens': False,
+                  'priority': None,
+                  'template_source': None},
+      'order': 1,
+      'origin': {'__type__': 'NonTerminal', 'name': '_raw_path_step'}},
+ 68: {'__type__': 'Rule',
+      'alias': None,
+      'expansion': [{'__type__': 'NonTerminal', 'name': 'abbreviatedstep'}],
+      'options': {'__type__': 'RuleOptions',
+                  'empty_indices': (),
+                  'expand1': False,
+                  'keep_all_tokens': False,
+                  'priority': None,
+                  'template_source': None},
+      'order': 0,
+      'origin': {'__type__': 'NonTerminal', 'name': '_raw_abbreviated_step'}},
+ 69: {'__type__': 'Rule',
+      'alias': None,
+      'expansion': [{'__type__': 'NonTerminal', 'name': 'null_axis_specifier'},
+                    {'__type__': 'NonTerminal', 'name': 'attribute_step'}],
+      'options': {'__type__': 'RuleOptions',
+                  'empty_indices': (),
+                  'expand1': False,
+                  'keep_all_tokens': False,
+                  'priority': None,
+                  'template_source': None},
+      'order': 0,
+      'origin': {'__type__': 'NonTerminal', 'name': '_raw_attribute_step'}},
+ 70: {'__type__': 'Rule',
+      'alias': 'self_axis_specifier',
+      'expansion': [{'__type__': 'Terminal', 'filter_out': True, 'name': 'DOT'}],
+      'options': {'__type__': 'RuleOptions',
+                  'empty_indices': (),
+                  'expand1': False,
+                  'keep_all_tokens': False,
+                  'priority': None,
+                  'template_source': None},
+      'order': 0,
+      'origin': {'__type__': 'NonTerminal', 'name': 'abbreviatedstep'}},
+ 71: {'__type__': 'Rule',
+      'alias': 'parent_axis_specifier',
+      'expansion': [{'__type__': 'Terminal', 'filter_out': True, 'name': '__ANON_1'}],
+      'options': {'__type__': 'RuleOptions',
+                  'empty_indices': (),
+                  'expand1': False,
+                  'keep_all_tokens': False,
+                  'priority': None,
+                  'template_source': None},
+      'order': 1,
+      'origin': {'__type__': 'NonTerminal', 'name': 'abbreviatedstep'}},
+ 72: {'__type__': 'Rule',
+      'alias': None,
+      'expansion': [{'__type__': 'NonTerminal', 'name': '_axis_name'},
+                    {'__type__': 'Terminal', 'filter_out': True, 'name': '__ANON_2'}],
+      'options': {'__type__': 'RuleOptions',
+                  'empty_indices': (),
+                  'expand1': False,
+                  'keep_all_tokens': False,
+                  'priority': None,
+                  'template_source': None},
+      'order': 0,
+      'origin': {'__type__': 'NonTerminal', 'name': '_axisspecifier'}},
+ 73: {'__type__': 'Rule',
+      'alias': None,
+      'expansion': [{'__type__': 'NonTerminal', 'name': 'default_axis_specifier'}],
+      'options': {'__type__': 'RuleOptions',
+                  'empty_indices': (),
+                  'expand1': False,
+                  'keep_all_tokens': False,
+                  'priority': None,
+                  'template_source': None},
+      'order': 1,
+      'origin': {'__type__': 'NonTerminal', 'name': '_axisspecifier'}},
+ 74: {'__type__': 'Rule',
+      'alias': None,
+      'expansion': [],
+      'options': {'__type__': 'RuleOptions',
+                  'empty_indices': (),
+                  'expand1': False,
+                  'keep_all_tokens': False,
+                  'priority': None,
+                  'template_source': None},
+      'order': 0,
+      'origin': {'__type__': 'NonTerminal', 'name': 'default_axis_specifier'}},
+ 75: {'__type__': 'Rule',
+      'alias': None,
+      'expansion': [],
+      'options': {'__type__': 'RuleOptions',
+                  'empty_indices': (),
+                  'expand1': False,
+                  'keep_all_tokens': False,
+                  'priority': None,
+                  'template_source': None},
+      'order': 0,
+      'origin': {'__type__': 'NonTerminal', 'name': 'null_axis_specifier'}},
+ 76: {'__type__': 'Rule',
+      'alias': None,
+      'expansion': [{'__type__': 'Terminal', 'filter_out': True, 'name': 'AT'},
+                    {'__type__': 'NonTerminal', 'name': '_tname'},
+                    {'__type__': 'NonTerminal', 'name': '___raw_path_step_star_2'}],
+      'options': {'__type__': 'RuleOptions',
+                  'empty_indices': (),
+                  'expand1': False,
+                  'keep_all_tokens': False,
+                  'priority': None,
+                  'template_source': None},
+      'order': 0,
+      'origin': {'__type__': 'NonTerminal', 'name': 'attribute_step'}},
+ 77: {'__type__': 'Rule',
+      'alias': None,
+      'expansion': [{'__type__': 'Terminal', 'filter_out': True, 'name': 'AT'},
+                    {'__type__': 'NonTerminal', 'name': '_tname'}],
+      'options': {'__type__': 'RuleOptions',
+                  'empty_indices': (),
+                  'expand1': False,
+                  'keep_all_tokens': False,
+                  'priority': None,
+                  'template_source': None},
+      'order': 1,
+      'origin': {'__type__': 'NonTerminal', 'name': 'attribute_step'}},
+ 78: {'__type__': 'Rule',
+      'alias': None,
+      'expansion': [{'__type__': 'NonTerminal', 'name': 'child_axis_specifier'}],
+      'options': {'__type__': 'RuleOptions',
+                  'empty_indices': (),
+                  'expand1': False,
+                  'keep_all_tokens': False,
+                  'priority': None,
+                  'template_source': None},
+      'order': 0,
+      'origin': {'__type__': 'NonTerminal', 'name': '_axis_name'}},
+ 79: {'__type__': 'Rule',
+      'alias': None,
+      'expansion': [{'__type__': 'NonTerminal', 'name': 'descendant_axis_specifier'}],
+      'options': {'__type__': 'RuleOptions',
+                  'empty_indices': (),
+                  'expand1': False,
+                  'keep_all_tokens': False,
+                  'priority': None,
+                  'template_source': None},
+      'order': 1,
+      'origin': {'__type__': 'NonTerminal', 'name': '_axis_name'}},
+ 80: {'__type__': 'Rule',
+      'alias': None,
+      'expansion': [{'__type__': 'NonTerminal', 'name': 'descendant_or_self'}],
+      'options': {'__type__': 'RuleOptions',
+                  'empty_indices': (),
+                  'expand1': False,
+                  'keep_all_tokens': False,
+                  'priority': None,
+                  'template_source': None},
+      'order': 2,
+      'origin': {'__type__': 'NonTerminal', 'name': '_axis_name'}},
+ 81: {'__type__': 'Rule',
+      'alias': None,
+      'expansion': [{'__type__': 'NonTerminal', 'name': 'self_axis_specifier'}],
+      'options': {'__type__': 'RuleOptions',
+                  'empty_indices': (),
+                  'expand1': False,
+                  'keep_all_tokens': False,
+                  'priority': None,
+                  'template_source': None},
+      'order': 3,
+      'origin': {'__type__': 'NonTerminal', 'name': '_axis_name'}},
+ 82: {'__type__': 'Rule',
+      'alias': None,
+      'expansion': [{'__type__': 'NonTerminal', 'name': 'parent_axis_specifier'}],
+      'options': {'__type__': 'RuleOptions',
+                  'empty_indices': (),
+                  'expand1': False,
+                  'keep_all_tokens': False,
+                  'priority': None,
+                  'template_source': None},
+      'order': 4,
+      'origin': {'__type__': 'NonTerminal', 'name': '_axis_name'}},
+ 83: {'__type__': 'Rule',
+      'alias': None,
+      'expansion': [{'__type__': 'NonTerminal', 'name': 'ancestor_axis_specifier'}],
+      'options': {'__type__': 'RuleOptions',
+                  'empty_indices': (),
+                  'expand1': False,
+                  'keep_all_tokens': False,
+                  'priority': None,
+                  'template_source': None},
+      'order': 5,
+      'origin': {'__type__': 'NonTerminal', 'name': '_axis_name'}},
+ 84: {'__type__': 'Rule',
+      'alias': None,
+      'expansion': [{'__type__': 'NonTerminal', 'name': 'ancestor_or_self'}],
+      'options': {'__type__': 'RuleOptions',
+                  'empty_indices': (),
+                  'expand1': False,
+                  'keep_all_tokens': False,
+                  'priority': None,
+                  'template_source': None},
+      'order': 6,
+      'origin': {'__type__': 'NonTerminal', 'name': '_axis_name'}},
+ 85: {'__type__': 'Rule',
+      'alias': None,
+      'expansion': [{'__type__': 'NonTerminal', 'name': 'following_axis_specifier'}],
+      'options': {'__type__': 'RuleOptions',
+                  'empty_indices': (),
+                  'expand1': False,
+                  'keep_all_tokens': False,
+                  'priority': None,
+                  'template_source': None},
+      'order': 7,
+      'origin': {'__type__': 'NonTerminal', 'name': '_axis_name'}},
+ 86: {'__type__': 'Rule',
+      'alias': None,
+      'expansion': [{'__type__': 'NonTerminal', 'name': 'following_sibling'}],
+      'options': {'__type__': 'RuleOptions',
+                  'empty_indices': (),
+                  'expand1': False,
+                  'keep_all_tokens': False,
+                  'priority': None,
+                  'template_source': None},
+      'order': 8,
+      'origin': {'__type__': 'NonTerminal', 'name': '_axis_name'}},
+ 87: {'__type__': 'Rule',
+      'alias': None,
+      'expansion': [{'__type__': 'NonTerminal', 'name': 'preceding_axis_specifier'}],
+      'options': {'__type__': 'RuleOptions',
+                  'empty_indices': (),
+                  'expand1': False,
+                  'keep_all_tokens': False,
+                  'priority': None,
+                  'template_source': None},
+      'order': 9,
+      'origin': {'__type__': 'NonTerminal', 'name': '_axis_name'}},
+ 88: {'__type__': 'Rule',
+      'alias': None,
+      'expansion': [{'__type__': 'NonTerminal', 'name': 'preceding_sibling'}],
+      'options': {'__type__': 'RuleOptions',
+                  'empty_indices': (),
+                  'expand1': False,
+                  'keep_all_tokens': False,
+                  'priority': None,
+                  'template_source': None},
+      'order': 10,
+      'origin': {'__type__': 'NonTerminal', 'name': '_axis_name'}},
+ 89: {'__type__': 'Rule',
+      'alias': None,
+      'expansion': [{'__type__': 'Terminal', 'filter_out': True, 'name': 'CHILD'}],
+      'options': {'__type__': 'RuleOptions',
+                  'empty_indices': (),
+                  'expand1': False,
+                  'keep_all_tokens': False,
+                  'priority': None,
+                  'template_source': None},
+      'order': 0,
+      'origin': {'__type__': 'NonTerminal', 'name': 'child_axis_specifier'}},
+ 90: {'__type__': 'Rule',
+      'alias': None,
+      'expansion': [{'__type__': 'Terminal', 'filter_out': True, 'name': 'DESCENDANT'}],
+      'options': {'__type__': 'RuleOptions',
+                  'empty_indices': (),
+                  'expand1': False,
+                  'keep_all_tokens': False,
+                  'priority': None,
+                  'template_source': None},
+      'order': 0,
+      'origin': {'__type__': 'NonTerminal', 'name': 'descendant_axis_specifier'}},
+ 91: {'__type__': 'Rule',
+      'alias': None,
+      'expansion': [{'__type__': 'Terminal', 'filter_out': False, 'name': 'DESCENDANT_OR_SELF'}],
+      'options': {'__type__': 'RuleOptions',
+                  'empty_indices': (),
+                  'expand1': False,
+                  'keep_all_tokens': False,
+                  'priority': None,
+                  'template_source': None},
+      'order': 0,
+      'origin': {'__type__': 'NonTerminal', 'name': 'descendant_or_self'}},
+ 92: {'__type__': 'Rule',
+      'alias': None,
+      'expansion': [{'__type__': 'Terminal', 'filter_out': True, 'name': 'SELF'}],
+      'options': {'__type__': 'RuleOptions',
+                  'empty_indices': (),
+                  'expand1': False,
+                  'keep_all_tokens': False,
+                  'priority': None,
+                  'template_source': None},
+      'order': 0,
+      'origin': {'__type__': 'NonTerminal', 'name': 'self_axis_specifier'}},
+ 93: {'__type__': 'Rule',
+      'alias': None,
+      'expansion': [{'__type__': 'Terminal', 'filter_out': True, 'name': 'PARENT'}],
+      'options': {'__type__': 'RuleOptions',
+                  'empty_indices': (),
+                  'expand1': False,
+                  'keep_all_tokens': False,
+                  'priority': None,
+                  'template_source': None},
+      'order': 0,
+      'origin': {'__type__': 'NonTerminal', 'name': 'parent_axis_specifier'}},
+ 94: {'__type__': 'Rule',
+      'alias': None,
+      'expansion': [{'__type__': 'Terminal', 'filter_out': True, 'name': 'ANCESTOR'}],
+      'options': {'__type__': 'RuleOptions',
+                  'empty_indices': (),
+                  'expand1': False,
+                  'keep_all_tokens': False,
+                  'priority': None,
+                  'template_source': None},
+      'order': 0,
+      'origin': {'__type__': 'NonTerminal', 'name': 'ancestor_axis_specifier'}},
+ 95: {'__type__': 'Rule',
+      'alias': None,
+      'expansion': [{'__type__': 'Terminal', 'filter_out': False, 'name': 'ANCESTOR_OR_SELF'}],
+      'options': {'__type__': 'RuleOptions',
+                  'empty_indices': (),
+                  'expand1': False,
+                  'keep_all_tokens': False,
+                  'priority': None,
+                  'template_source': None},
+      'order': 0,
+      'origin': {'__type__': 'NonTerminal', 'name': 'ancestor_or_self'}},
+ 96: {'__type__': 'Rule',
+      'alias': None,
+      'expansion': [{'__type__': 'Terminal', 'filter_out': True, 'name': 'FOLLOWING'}],
+      'options': {'__type__': 'RuleOptions',
+                  'empty_indices': (),
+                  'expand1': False,
+                  'keep_all_tokens': False,
+                  'priority': None,
+                  'template_source': None},
+      'order': 0,
+      'origin': {'__type__': 'NonTerminal', 'name': 'following_axis_specifier'}},
+ 97: {'__type__': 'Rule',
+      'alias': None,
+      'expansion': [{'__type__': 'Terminal', 'filter_out': False, 'name': 'FOLLOWING_SIBLING'}],
+      'options': {'__type__': 'RuleOptions',
+                  'empty_indices': (),
+                  'expand1': False,
+                  'keep_all_tokens': False,
+                  'priority': None,
+                  'template_source': None},
+      'order': 0,
+      'origin': {'__type__': 'NonTerminal', 'name': 'following_sibling'}},
+ 98: {'__type__': 'Rule',
+      'alias': None,
+      'expansion': [{'__type__': 'Terminal', 'filter_out': True, 'name': 'PRECEDING'}],
+      'options': {'__type__': 'RuleOptions',
+                  'empty_indices': (),
+                  'expand1': False,
+                  'keep_all_tokens': False,
+                  'priority': None,
+                  'template_source': None},
+      'order': 0,
+      'origin': {'__type__': 'NonTerminal', 'name': 'preceding_axis_specifier'}},
+ 99: {'__type__': 'Rule',
+      'alias': None,
+      'expansion': [{'__type__': 'Terminal', 'filter_out': False, 'name': 'PRECEDING_SIBLING'}],
+      'options': {'__type__': 'RuleOptions',
+                  'empty_indices': (),
+                  'expand1': False,
+                  'keep_all_tokens': False,
+                  'priority': None,
+                  'template_source': None},
+      'order': 0,
+      'origin': {'__type__': 'NonTerminal', 'name': 'preceding_sibling'}},
+ 100: {'__type__': 'Rule',
+       'alias': None,
+       'expansion': [{'__type__': 'NonTerminal', 'name': 'location_path'}],
+       'options': {'__type__': 'RuleOptions',
+                   'empty_indices': (),
+                   'expand1': True,
+                   'keep_all_tokens': False,
+                   'priority': None,
+                   'template_source': None},
+       'order': 0,
+       'origin': {'__type__': 'NonTerminal', 'name': 'path_expr'}},
+ 101: {'__type__': 'Rule',
+       'alias': None,
+       'expansion': [{'__type__': 'NonTerminal', 'name': 'filter_expr'}],
+       'options': {'__type__': 'RuleOptions',
+                   'empty_indices': (),
+                   'expand1': True,
+                   'keep_all_tokens': False,
+                   'priority': None,
+                   'template_source': None},
+       'order': 1,
+       'origin': {'__type__': 'NonTerminal', 'name': 'path_expr'}},
+ 102: {'__type__': 'Rule',
+       'alias': None,
+       'expansion': [{'__type__': 'NonTerminal', 'name': 'primary_expr'}],
+       'options': {'__type__': 'RuleOptions',
+                   'empty_indices': (),
+                   'expand1': True,
+                   'keep_all_tokens': False,
+                   'priority': None,
+                   'template_source': None},
+       'order': 0,
+       'origin': {'__type__': 'NonTerminal', 'name': 'filter_expr'}},
+ 103: {'__type__': 'Rule',
+       'alias': None,
+       'expansion': [{'__type__': 'NonTerminal', 'name': 'filter_expr'},
+                     {'__type__': 'NonTerminal', 'name': 'predicate'}],
+       'options': {'__type__': 'RuleOptions',
+                   'empty_indices': (),
+                   'expand1': True,
+                   'keep_all_tokens': False,
+                   'priority': None,
+                   'template_source': None},
+       'order': 1,
+       'origin': {'__type__': 'NonTerminal', 'name': 'filter_expr'}},
+ 104: {'__type__': 'Rule',
+       'alias': None,
+       'expansion': [{'__type__': 'NonTerminal', 'name': 'index_predicate'}],
+       'options': {'__type__': 'RuleOptions',
+                   'empty_indices': (),
+                   'expand1': True,
+                   'keep_all_tokens': False,
+                   'priority': None,
+                   'template_source': None},
+       'order': 0,
+       'origin': {'__type__': 'NonTerminal', 'name': 'predicate'}},
+ 105: {'__type__': 'Rule',
+       'alias': None,
+       'expansion': [{'__type__': 'NonTerminal', 'name': '_expr_predicate'}],
+       'options': {'__type__': 'RuleOptions',
+                   'empty_indices': (),
+                   'expand1': True,
+                   'keep_all_tokens': False,
+                   'priority': None,
+                   'template_source': None},
+       'order': 1,
+       'origin': {'__type__': 'NonTerminal', 'name': 'predicate'}},
+ 106: {'__type__': 'Rule',
+       'alias': None,
+       'expansion': [{'__type__': 'Terminal', 'filter_out': True, 'name': 'LSQB'},
+                     {'__type__': 'NonTerminal', 'name': 'predicate_expr'},
+                     {'__type__': 'Terminal', 'filter_out': True, 'name': 'RSQB'}],
+       'options': {'__type__': 'RuleOptions',
+                   'empty_indices': (),
+                   'expand1': False,
+                   'keep_all_tokens': False,
+                   'priority': None,
+                   'template_source': None},
+       'order': 0,
+       'origin': {'__type__': 'NonTerminal', 'name': '_expr_predicate'}},
+ 107: {'__type__': 'Rule',
+       'alias': None,
+       'expansion': [{'__type__': 'Terminal', 'filter_out': True, 'name': 'LSQB'},
+                     {'__type__': 'NonTerminal', 'name': 'slice_expr'},
+                     {'__type__': 'Terminal', 'filter_out': True, 'name': 'RSQB'}],
+       'options': {'__type__': 'RuleOptions',
+                   'empty_indices': (),
+                   'expand1': False,
+                   'keep_all_tokens': False,
+                   'priority': None,
+                   'template_source': None},
+       'order': 1,
+       'origin': {'__type__': 'NonTerminal', 'name': '_expr_predicate'}},
+ 108: {'__type__': 'Rule',
+       'alias': None,
+       'expansion': [{'__type__': 'NonTerminal', 'name': 'expr'}],
+       'options': {'__type__': 'RuleOptions',
+                   'empty_indices': (),
+                   'expand1': False,
+                   'keep_all_tokens': False,
+                   'priority': None,
+                   'template_source': None},
+       'order': 0,
+       'origin': {'__type__': 'NonTerminal', 'name': 'predicate_expr'}},
+ 109: {'__type__': 'Rule',
+       'alias': None,
+       'expansion': [{'__type__': 'Terminal', 'filter_out': False, 'name': 'INDEX_PREDICATE_TAG'}],
+       'options': {'__type__': 'RuleOptions',
+                   'empty_indices': (),
+                   'expand1': False,
+                   'keep_all_tokens': False,
+                   'priority': None,
+                   'template_source': None},
+       'order': 0,
+       'origin': {'__type__': 'NonTerminal', 'name': 'index_predicate'}},
+ 110: {'__type__': 'Rule',
+       'alias': None,
+       'expansion': [{'__type__': 'NonTerminal', 'name': 'or_expr'}],
+       'options': {'__type__': 'RuleOptions',
+                   'empty_indices': (),
+                   'expand1': True,
+                   'keep_all_tokens': False,
+                   'priority': None,
+                   'template_source': None},
+       'order': 0,
+       'origin': {'__type__': 'NonTerminal', 'name': 'expr'}},
+ 111: {'__type__': 'Rule',
+       'alias': None,
+       'expansion': [{'__type__': 'NonTerminal', 'name': 'or_expr'},
+                     {'__type__': 'Terminal', 'filter_out': True, 'name': 'OR'},
+                     {'__type__': 'NonTerminal', 'name': 'and_expr'}],
+       'options': {'__type__': 'RuleOptions',
+                   'empty_indices': (),
+                   'expand1': True,
+                   'keep_all_tokens': False,
+                   'priority': None,
+                   'template_source': None},
+       'order': 0,
+       'origin': {'__type__': 'NonTerminal', 'name': 'or_expr'}},
+ 112: {'__type__': 'Rule',
+       'alias': None,
+       'expansion': [{'__type__': 'NonTerminal', 'name': 'and_expr'}],
+       'options': {'__type__': 'RuleOptions',
+                   'empty_indices': (),
+                   'expand1': True,
+                   'keep_all_tokens': False,
+                   'priority': None,
+                   'template_source': None},
+       'order': 1,
+       'origin': {'__type__': 'NonTerminal', 'name': 'or_expr'}},
+ 113: {'__type__': 'Rule',
+       'alias': None,
+       'expansion': [{'__type__': 'NonTerminal', 'name': 'and_expr'},
+                     {'__type__': 'Terminal', 'filter_out': True, 'name': 'AND'},
+                     {'__type__': 'NonTerminal', 'name': 'equality_expr'}],
+       'options': {'__type__': 'RuleOptions',
+                   'empty_indices': (),
+                   'expand1': True,
+                   'keep_all_tokens': False,
+                   'priority': None,
+                   'template_source': None},
+       'order': 0,
+       'origin': {'__type__': 'NonTerminal', 'name': 'and_expr'}},
+ 114: {'__type__': 'Rule',
+       'alias': None,
+       'expansion': [{'__type__': 'NonTerminal', 'name': 'equality_expr'}],
+       'options': {'__type__': 'RuleOptions',
+                   'empty_indices': (),
+                   'expand1': True,
+                   'keep_all_tokens': False,
+                   'priority': None,
+                   'template_source': None},
+       'order': 1,
+       'origin': {'__type__': 'NonTerminal', 'name': 'and_expr'}},
+ 115: {'__type__': 'Rule',
+       'alias': None,
+       'expansion': [{'__type__': 'NonTerminal', 'name': 'equality_expr'},
+                     {'__type__': 'NonTerminal', 'name': '_equality_op'},
+                     {'__type__': 'NonTerminal', 'name': 'relational_expr'}],
+       'options': {'__type__': 'RuleOptions',
+                   'empty_indices': (),
+                   'expand1': True,
+                   'keep_all_tokens': False,
+                   'priority': None,
+                   'template_source': None},
+       'order': 0,
+       'origin': {'__type__': 'NonTerminal', 'name': 'equality_expr'}},
+ 116: {'__type__': 'Rule',
+       'alias': None,
+       'expansion': [{'__type__': 'NonTerminal', 'name': 'relational_expr'}],
+       'options': {'__type__': 'RuleOptions',
+                   'empty_indices': (),
+                   'expand1': True,
+                   'keep_all_tokens': False,
+                   'priority': None,
+                   'template_source': None},
+       'order': 1,
+       'origin': {'__type__': 'NonTerminal', 'name': 'equality_expr'}},
+ 117: {'__type__': 'Rule',
+       'alias': None,
+       'expansion': [{'__type__': 'Terminal', 'filter_out': False, 'name': 'OP_EQUAL'}],
+       'options': {'__type__': 'RuleOptions',
+                   'empty_indices': (),
+                   'expand1': False,
+                   'keep_all_tokens': False,
+                   'priority': None,
+                   'template_source': None},
+       'order': 0,
+       'origin': {'__type__': 'NonTerminal', 'name': '_equality_op'}},
+ 118: {'__type__': 'Rule',
+       'alias': None,
+       'expansion': [{'__type__': 'Terminal', 'filter_out': False, 'name': 'OP_NOT_EQUAL'}],
+       'options': {'__type__': 'RuleOptions',
+                   'empty_indices': (),
+                   'expand1': False,
+                   'keep_all_tokens': False,
+                   'priority': None,
+                   'template_source': None},
+       'order': 1,
+       'origin': {'__type__': 'NonTerminal', 'name': '_equality_op'}},
+ 119: {'__type__': 'Rule',
+       'alias': None,
+       'expansion': [{'__type__': 'NonTerminal', 'name': 'relational_expr'},
+                     {'__type__': 'NonTerminal', 'name': '_relational_op'},
+                     {'__type__': 'NonTerminal', 'name': 'additive_expr'}],
+       'options': {'__type__': 'RuleOptions',
+                   'empty_indices': (),
+                   'expand1': True,
+                   'keep_all_tokens': False,
+                   'priority': None,
+                   'template_source': None},
+       'order': 0,
+       'origin': {'__type__': 'NonTerminal', 'name': 'relational_expr'}},
+ 120: {'__type__': 'Rule',
+       'alias': None,
+       'expansion': [{'__type__': 'NonTerminal', 'name': 'additive_expr'}],
+       'options': {'__type__': 'RuleOptions',
+                   'empty_indices': (),
+                   'expand1': True,
+                   'keep_all_tokens': False,
+                   'priority': None,
+                   'template_source': None},
+       'order': 1,
+       'origin': {'__type__': 'NonTerminal', 'name': 'relational_expr'}},
+ 121: {'__type__': 'Rule',
+       'alias': None,
+       'expansion': [{'__type__': 'Terminal', 'filter_out': False, 'name': 'OP_LESS_THAN'}],
+       'options': {'__type__': 'RuleOptions',
+                   'empty_indices': (),
+                   'expand1': False,
+                   'keep_all_tokens': False,
+                   'priority': None,
+                   'template_source': None},
+       'order': 0,
+       'origin': {'__type__': 'NonTerminal', 'name': '_relational_op'}},
+ 122: {'__type__': 'Rule',
+       'alias': None,
+       'expansion': [{'__type__': 'Terminal', 'filter_out': False, 'name': 'OP_GREATER_THAN'}],
+       'options': {'__type__': 'RuleOptions',
+                   'empty_indices': (),
+                   'expand1': False,
+                   'keep_all_tokens': False,
+                   'priority': None,
+                   'template_source': None},
+       'order': 1,
+       'origin': {'__type__': 'NonTerminal', 'name': '_relational_op'}},
+ 123: {'__type__': 'Rule',
+       'alias': None,
+       'expansion': [{'__type__': 'Terminal', 'filter_out': False, 'name': 'OP_LESS_THAN_EQUAL'}],
+       'options': {'__type__': 'RuleOptions',
+                   'empty_indices': (),
+                   'expand1': False,
+                   'keep_all_tokens': False,
+                   'priority': None,
+                   'template_source': None},
+       'order': 2,
+       'origin': {'__type__': 'NonTerminal', 'name': '_relational_op'}},
+ 124: {'__type__': 'Rule',
+       'alias': None,
+       'expansion': [{'__type__': 'Terminal', 'filter_out': False, 'name': 'OP_GREATER_THAN_EQUAL'}],
+       'options': {'__type__': 'RuleOptions',
+                   'empty_indices': (),
+                   'expand1': False,
+                   'keep_all_tokens': False,
+                   'priority': None,
+                   'template_source': None},
+       'order': 3,
+       'origin': {'__type__': 'NonTerminal', 'name': '_relational_op'}},
+ 125: {'__type__': 'Rule',
+       'alias': None,
+       'expansion': [{'__type__': 'NonTerminal', 'name': 'additive_expr'},
+                     {'__type__': 'NonTerminal', 'name': '_additive_op'},
+                     {'__type__': 'NonTerminal', 'name': 'multiply_expr'}],
+       'options': {'__type__': 'RuleOptions',
+                   'empty_indices': (),
+                   'expand1': True,
+                   'keep_all_tokens': False,
+                   'priority': None,
+                   'template_source': None},
+       'order': 0,
+       'origin': {'__type__': 'NonTerminal', 'name': 'additive_expr'}},
+ 126: {'__type__': 'Rule',
+       'alias': None,
+       'expansion': [{'__type__': 'NonTerminal', 'name': 'multiply_expr'}],
+       'options': {'__type__': 'RuleOptions',
+                   'empty_indices': (),
+                   'expand1': True,
+                   'keep_all_tokens': False,
+                   'priority': None,
+                   'template_source': None},
+       'order': 1,
+       'origin': {'__type__': 'NonTerminal', 'name': 'additive_expr'}},
+ 127: {'__type__': 'Rule',
+       'alias': None,
+       'expansion': [{'__type__': 'Terminal', 'filter_out': False, 'name': 'ADD_OP'}],
+       'options': {'__type__': 'RuleOptions',
+                   'empty_indices': (),
+                   'expand1': False,
+                   'keep_all_tokens': False,
+                   'priority': None,
+                   'template_source': None},
+       'order': 0,
+       'origin': {'__type__': 'NonTerminal', 'name': '_additive_op'}},
+ 128: {'__type__': 'Rule',
+       'alias': None,
+       'expansion': [{'__type__': 'Terminal', 'filter_out': False, 'name': 'MINUS_OP'}],
+       'options': {'__type__': 'RuleOptions',
+                   'empty_indices': (),
+                   'expand1': False,
+                   'keep_all_tokens': False,
+                   'priority': None,
+                   'template_source': None},
+       'order': 1,
+       'origin': {'__type__': 'NonTerminal', 'name': '_additive_op'}},
+ 129: {'__type__': 'Rule',
+       'alias': None,
+       'expansion': [{'__type__': 'NonTerminal', 'name': 'multiply_expr'},
+                     {'__type__': 'NonTerminal', 'name': '_multiply_op'},
+                     {'__type__': 'NonTerminal', 'name': 'unary_expr'}],
+       'options': {'__type__': 'RuleOptions',
+                   'empty_indices': (),
+                   'expand1': True,
+                   'keep_all_tokens': False,
+                   'priority': None,
+                   'template_source': None},
+       'order': 0,
+       'origin': {'__type__': 'NonTerminal', 'name': 'multiply_expr'}},
+ 130: {'__type__': 'Rule',
+       'alias': None,
+       'expansion': [{'__type__': 'NonTerminal', 'name': 'unary_expr'}],
+       'options': {'__type__': 'RuleOptions',
+                   'empty_indices': (),
+                   'expand1': True,
+                   'keep_all_tokens': False,
+                   'priority': None,
+                   'template_source': None},
+       'order': 1,
+       'origin': {'__type__': 'NonTerminal', 'name': 'multiply_expr'}},
+ 131: {'__type__': 'Rule',
+       'alias': None,
+       'expansion': [{'__type__': 'Terminal', 'filter_out': False, 'name': 'MUL_OP'}],
+       'options': {'__type__': 'RuleOptions',
+                   'empty_indices': (),
+                   'expand1': False,
+                   'keep_all_tokens': False,
+                   'priority': None,
+                   'template_source': None},
+       'order': 0,
+       'origin': {'__type__': 'NonTerminal', 'name': '_multiply_op'}},
+ 132: {'__type__': 'Rule',
+       'alias': None,
+       'expansion': [{'__type__': 'Terminal', 'filter_out': False, 'name': 'DIV_OP'}],
+       'options': {'__type__': 'RuleOptions',
+                   'empty_indices': (),
+                   'expand1': False,
+                   'keep_all_tokens': False,
+                   'priority': None,
+                   'template_source': None},
+       'order': 1,
+       'origin': {'__type__': 'NonTerminal', 'name': '_multiply_op'}},
+ 133: {'__type__': 'Rule',
+       'alias': None,
+       'expansion': [{'__type__': 'Terminal', 'filter_out': False, 'name': 'MOD_OP'}],
+       'options': {'__type__': 'RuleOptions',
+                   'empty_indices': (),
+                   'expand1': False,
+                   'keep_all_tokens': False,
+                   'priority': None,
+                   'template_source': None},
+       'order': 2,
+       'origin': {'__type__': 'NonTerminal', 'name': '_multiply_op'}},
+ 134: {'__type__': 'Rule',
+       'alias': None,
+       'expansion': [{'__type__': 'NonTerminal', 'name': 'union_expr'}],
+       'options': {'__type__': 'RuleOptions',
+                   'empty_indices': (),
+                   'expand1': True,
+                   'keep_all_tokens': False,
+                   'priority': None,
+                   'template_source': None},
+       'order': 0,
+       'origin': {'__type__': 'NonTerminal', 'name': 'unary_expr'}},
+ 135: {'__type__': 'Rule',
+       'alias': 'unary_expr',
+       'expansion': [{'__type__': 'Terminal', 'filter_out': True, 'name': 'MINUS_OP'},
+                     {'__type__': 'NonTerminal', 'name': 'unary_expr'}],
+       'options': {'__type__': 'RuleOptions',
+                   'empty_indices': (),
+                   'expand1': True,
+                   'keep_all_tokens': False,
+                   'priority': None,
+                   'template_source': None},
+       'order': 1,
+       'origin': {'__type__': 'NonTerminal', 'name': 'unary_expr'}},
+ 136: {'__type__': 'Rule',
+       'alias': None,
+       'expansion': [{'__type__': 'NonTerminal', 'name': 'union_expr'},
+                     {'__type__': 'Terminal', 'filter_out': True, 'name': 'VBAR'},
+                     {'__type__': 'NonTerminal', 'name': 'path_expr'}],
+       'options': {'__type__': 'RuleOptions',
+                   'empty_indices': (),
+                   'expand1': True,
+                   'keep_all_tokens': False,
+                   'priority': None,
+                   'template_source': None},
+       'order': 0,
+       'origin': {'__type__': 'NonTerminal', 'name': 'union_expr'}},
+ 137: {'__type__': 'Rule',
+       'alias': None,
+       'expansion': [{'__type__': 'NonTerminal', 'name': 'path_expr'}],
+       'options': {'__type__': 'RuleOptions',
+                   'empty_indices': (),
+                   'expand1': True,
+                   'keep_all_tokens': False,
+                   'priority': None,
+                   'template_source': None},
+       'order': 1,
+       'origin': {'__type__': 'NonTerminal', 'name': 'union_expr'}},
+ 138: {'__type__': 'Rule',
+       'alias': None,
+       'expansion': [{'__type__': 'NonTerminal', 'name': 'kind_test'}],
+       'options': {'__type__': 'RuleOptions',
+                   'empty_indices': (),
+                   'expand1': True,
+                   'keep_all_tokens': False,
+                   'priority': None,
+                   'template_source': None},
+       'order': 0,
+       'origin': {'__type__': 'NonTerminal', 'name': 'node_test'}},
+ 139: {'__type__': 'Rule',
+       'alias': None,
+       'expansion': [{'__type__': 'NonTerminal', 'name': 'name_test'}],
+       'options': {'__type__': 'RuleOptions',
+                   'empty_indices': (),
+                   'expand1': True,
+                   'keep_all_tokens': False,
+                   'priority': None,
+                   'template_source': None},
+       'order': 1,
+       'origin': {'__type__': 'NonTerminal', 'name': 'node_test'}},
+ 140: {'__type__': 'Rule',
+       'alias': None,
+       'expansion': [{'__type__': 'NonTerminal', 'name': 'tname_test'}],
+       'options': {'__type__': 'RuleOptions',
+                   'empty_indices': (),
+                   'expand1': True,
+                   'keep_all_tokens': False,
+                   'priority': None,
+                   'template_source': None},
+       'order': 0,
+       'origin': {'__type__': 'NonTerminal', 'name': 'name_test'}},
+ 141: {'__type__': 'Rule',
+       'alias': None,
+       'expansion': [{'__type__': 'NonTerminal', 'name': 'wildcard_name_test'}],
+       'options': {'__type__': 'RuleOptions',
+                   'empty_indices': (),
+                   'expand1': True,
+                   'keep_all_tokens': False,
+                   'priority': None,
+                   'template_source': None},
+       'order': 1,
+       'origin': {'__type__': 'NonTerminal', 'name': 'name_test'}},
+ 142: {'__type__': 'Rule',
+       'alias': None,
+       'expansion': [{'__type__': 'NonTerminal', 'name': '_tname'}],
+       'options': {'__type__': 'RuleOptions',
+                   'empty_indices': (),
+                   'expand1': False,
+                   'keep_all_tokens': False,
+                   'priority': None,
+                   'template_source': None},
+       'order': 0,
+       'origin': {'__type__': 'NonTerminal', 'name': 'tname_test'}},
+ 143: {'__type__': 'Rule',
+       'alias': None,
+       'expansion': [{'__type__': 'Terminal', 'filter_out': True, 'name': 'MUL_OP'}],
+       'options': {'__type__': 'RuleOptions',
+                   'empty_indices': (),
+                   'expand1': False,
+                   'keep_all_tokens': False,
+                   'priority': None,
+                   'template_source': None},
+       'order': 0,
+       'origin': {'__type__': 'NonTerminal', 'name': 'wildcard_name_test'}},
+ 144: {'__type__': 'Rule',
+       'alias': None,
+       'expansion': [{'__type__': 'NonTerminal', 'name': 'leaf_node_test'},
+                     {'__type__': 'Terminal', 'filter_out': True, 'name': 'LPAR'},
+                     {'__type__': 'Terminal', 'filter_out': True, 'name': 'RPAR'}],
+       'options': {'__type__': 'RuleOptions',
+                   'empty_indices': (),
+                   'expand1': True,
+                   'keep_all_tokens': False,
+                   'priority': None,
+                   'template_source': None},
+       'order': 0,
+       'origin': {'__type__': 'NonTerminal', 'name': 'kind_test'}},
+ 145: {'__type__': 'Rule',
+       'alias': None,
+       'expansion': [{'__type__': 'NonTerminal', 'name': 'node_node_test'},
+                     {'__type__': 'Terminal', 'filter_out': True, 'name': 'LPAR'},
+                     {'__type__': 'Terminal', 'filter_out': True, 'name': 'RPAR'}],
+       'options': {'__type__': 'RuleOptions',
+                   'empty_indices': (),
+                   'expand1': True,
+                   'keep_all_tokens': False,
+                   'priority': None,
+                   'template_source': None},
+       'order': 1,
+       'origin': {'__type__': 'NonTerminal', 'name': 'kind_test'}},
+ 146: {'__type__': 'Rule',
+       'alias': None,
+       'expansion': [{'__type__': 'Terminal', 'filter_out': True, 'name': 'LEAF'}],
+       'options': {'__type__': 'RuleOptions',
+                   'empty_indices': (),
+                   'expand1': False,
+                   'keep_all_tokens': False,
+                   'priority': None,
+                   'template_source': None},
+       'order': 0,
+       'origin': {'__type__': 'NonTerminal', 'name': 'leaf_node_test'}},
+ 147: {'__type__': 'Rule',
+       'alias': None,
+       'expansion': [{'__type__': 'Terminal', 'filter_out': True, 'name': 'NODE'}],
+       'options': {'__type__': 'RuleOptions',
+                   'empty_indices': (),
+                   'expand1': False,
+                   'keep_all_tokens': False,
+                   'priority': None,
+                   'template_source': None},
+       'order': 0,
+       'origin': {'__type__': 'NonTerminal', 'name': 'node_node_test'}},
+ 148: {'__type__': 'Rule',
+       'alias': None,
+       'expansion': [{'__type__': 'NonTerminal', 'name': 'varref'}],
+       'options': {'__type__': 'RuleOptions',
+                   'empty_indices': (),
+                   'expand1': True,
+                   'keep_all_tokens': False,
+                   'priority': None,
+                   'template_source': None},
+       'order': 0,
+       'origin': {'__type__': 'NonTerminal', 'name': 'primary_expr'}},
+ 149: {'__type__': 'Rule',
+       'alias': None,
+       'expansion': [{'__type__': 'NonTerminal', 'name': 'parenthesized_expr'}],
+       'options': {'__type__': 'RuleOptions',
+                   'empty_indices': (),
+                   'expand1': True,
+                   'keep_all_tokens': False,
+                   'priority': None,
+                   'template_source': None},
+       'order': 1,
+       'origin': {'__type__': 'NonTerminal', 'name': 'primary_expr'}},
+ 150: {'__type__': 'Rule',
+       'alias': None,
+       'expansion': [{'__type__': 'NonTerminal', 'name': '_literal'}],
+       'options': {'__type__': 'RuleOptions',
+                   'empty_indices': (),
+                   'expand1': True,
+                   'keep_all_tokens': False,
+                   'priority': None,
+                   'template_source': None},
+       'order': 2,
+       'origin': {'__type__': 'NonTerminal', 'name': 'primary_expr'}},
+ 151: {'__type__': 'Rule',
+       'alias': None,
+       'expansion': [{'__type__': 'NonTerminal', 'name': 'functioncall'}],
+       'options': {'__type__': 'RuleOptions',
+                   'empty_indices': (),
+                   'expand1': True,
+                   'keep_all_tokens': False,
+                   'priority': None,
+                   'template_source': None},
+       'order': 3,
+       'origin': {'__type__': 'NonTerminal', 'name': 'primary_expr'}},
+ 152: {'__type__': 'Rule',
+       'alias': None,
+       'expansion': [{'__type__': 'NonTerminal', 'name': 'attribute_accessor'}],
+       'options': {'__type__': 'RuleOptions',
+                   'empty_indices': (),
+                   'expand1': True,
+                   'keep_all_tokens': False,
+                   'priority': None,
+                   'template_source': None},
+       'order': 4,
+       'origin': {'__type__': 'NonTerminal', 'name': 'primary_expr'}},
+ 153: {'__type__': 'Rule',
+       'alias': None,
+       'expansion': [{'__type__': 'Terminal', 'filter_out': True, 'name': 'DOLLAR'},
+                     {'__type__': 'NonTerminal', 'name': '_tname'}],
+       'options': {'__type__': 'RuleOptions',
+                   'empty_indices': (),
+                   'expand1': False,
+                   'keep_all_tokens': False,
+                   'priority': None,
+                   'template_source': None},
+       'order': 0,
+       'origin': {'__type__': 'NonTerminal', 'name': 'varref'}},
+ 154: {'__type__': 'Rule',
+       'alias': None,
+       'expansion': [{'__type__': 'Terminal', 'filter_out': True, 'name': 'LPAR'},
+                     {'__type__': 'NonTerminal', 'name': 'expr'},
+                     {'__type__': 'Terminal', 'filter_out': True, 'name': 'RPAR'}],
+       'options': {'__type__': 'RuleOptions',
+                   'empty_indices': (),
+                   'expand1': False,
+                   'keep_all_tokens': False,
+                   'priority': None,
+                   'template_source': None},
+       'order': 0,
+       'origin': {'__type__': 'NonTerminal', 'name': 'parenthesized_expr'}},
+ 155: {'__type__': 'Rule',
+       'alias': None,
+       'expansion': [{'__type__': 'Terminal', 'filter_out': True, 'name': 'AT'},
+                     {'__type__': 'NonTerminal', 'name': '_tname'}],
+       'options': {'__type__': 'RuleOptions',
+                   'empty_indices': (),
+                   'expand1': False,
+                   'keep_all_tokens': False,
+                   'priority': None,
+                   'template_source': None},
+       'order': 0,
+       'origin': {'__type__': 'NonTerminal', 'name': 'attribute_accessor'}},
+ 156: {'__type__': 'Rule',
+       'alias': None,
+       'expansion': [{'__type__': 'NonTerminal', 'name': '_tname'},
+                     {'__type__': 'Terminal', 'filter_out': True, 'name': 'LPAR'},
+                     {'__type__': 'NonTerminal', 'name': 'functioncall_list'},
+                     {'__type__': 'Terminal', 'filter_out': True, 'name': 'RPAR'}],
+       'options': {'__type__': 'RuleOptions',
+                   'empty_indices': (),
+                   'expand1': False,
+                   'keep_all_tokens': False,
+                   'priority': None,
+                   'template_source': None},
+       'order': 0,
+       'origin': {'__type__': 'NonTerminal', 'name': 'functioncall'}},
+ 157: {'__type__': 'Rule',
+       'alias': None,
+       'expansion': [{'__type__': 'NonTerminal', 'name': '_tname'},
+                     {'__type__': 'Terminal', 'filter_out': True, 'name': 'LPAR'},
+                     {'__type__': 'Terminal', 'filter_out': True, 'name': 'RPAR'}],
+       'options': {'__type__': 'RuleOptions',
+                   'empty_indices': (),
+                   'expand1': False,
+                   'keep_all_tokens': False,
+                   'priority': None,
+                   'template_source': None},
+       'order': 1,
+       'origin': {'__type__': 'NonTerminal', 'name': 'functioncall'}},
+ 158: {'__type__': 'Rule',
+       'alias': None,
+       'expansion': [{'__type__': 'NonTerminal', 'name': 'functioncall_list'},
+                     {'__type__': 'Terminal', 'filter_out': True, 'name': 'COMMA'},
+                     {'__type__': 'NonTerminal', 'name': 'expr'}],
+       'options': {'__type__': 'RuleOptions',
+                   'empty_indices': (),
+                   'expand1': True,
+                   'keep_all_tokens': False,
+                   'priority': None,
+                   'template_source': None},
+       'order': 0,
+       'origin': {'__type__': 'NonTerminal', 'name': 'functioncall_list'}},
+ 159: {'__type__': 'Rule',
+       'alias': None,
+       'expansion': [{'__type__': 'NonTerminal', 'name': 'expr'}],
+       'options': {'__type__': 'RuleOptions',
+                   'empty_indices': (),
+                   'expand1': True,
+                   'keep_all_tokens': False,
+                   'priority': None,
+                   'template_source': None},
+       'order': 1,
+       'origin': {'__type__': 'NonTerminal', 'name': 'functioncall_list'}},
+ 160: {'__type__': 'Rule',
+       'alias': None,
+       'expansion': [{'__type__': 'Terminal', 'filter_out': False, 'name': 'INTEGER_LITERAL'},
+                     {'__type__': 'Terminal', 'filter_out': False, 'name': 'COLON'},
+                     {'__type__': 'Terminal', 'filter_out': False, 'name': 'INTEGER_LITERAL'},
+                     {'__type__': 'Terminal', 'filter_out': False, 'name': 'COLON'},
+                     {'__type__': 'Terminal', 'filter_out': False, 'name': 'INTEGER_LITERAL'}],
+       'options': {'__type__': 'RuleOptions',
+                   'empty_indices': (),
+                   'expand1': False,
+                   'keep_all_tokens': True,
+                   'priority': None,
+                   'template_source': None},
+       'order': 0,
+       'origin': {'__type__': 'NonTerminal', 'name': 'slice_expr'}},
+ 161: {'__type__': 'Rule',
+       'alias': None,
+       'expansion': [{'__type__': 'Terminal', 'filter_out': False, 'name': 'INTEGER_LITERAL'},
+                     {'__type__': 'Terminal', 'filter_out': False, 'name': 'COLON'},
+                     {'__type__': 'Terminal', 'filter_out': False, 'name': 'INTEGER_LITERAL'}],
+       'options': {'__type__': 'RuleOptions',
+                   'empty_indices': (),
+                   'expand1': False,
+                   'keep_all_tokens': True,
+                   'priority': None,
+                   'template_source': None},
+       'order': 1,
+       'origin': {'__type__': 'NonTerminal', 'name': 'slice_expr'}},
+ 162: {'__type__': 'Rule',
+       'alias': None,
+       'expansion': [{'__type__': 'Terminal', 'filter_out': False, 'name': 'INTEGER_LITERAL'},
+                     {'__type__': 'Terminal', 'filter_out': False, 'name': 'COLON'},
+                     {'__type__': 'Terminal', 'filter_out': False, 'name': 'COLON'},
+                     {'__type__': 'Terminal', 'filter_out': False, 'name': 'INTEGER_LITERAL'}],
+       'options': {'__type__': 'RuleOptions',
+                   'empty_indices': (),
+                   'expand1': False,
+                   'keep_all_tokens': True,
+                   'priority': None,
+                   'template_source': None},
+       'order': 2,
+       'origin': {'__type__': 'NonTerminal', 'name': 'slice_expr'}},
+ 163: {'__type__': 'Rule',
+       'alias': None,
+       'expansion': [{'__type__': 'Terminal', 'filter_out': False, 'name': 'INTEGER_LITERAL'},
+                     {'__type__': 'Terminal', 'filter_out': False, 'name': 'COLON'}],
+       'options': {'__type__': 'RuleOptions',
+                   'empty_indices': (),
+                   'expand1': False,
+                   'keep_all_tokens': True,
+                   'priority': None,
+                   'template_source': None},
+       'order': 3,
+       'origin': {'__type__': 'NonTerminal', 'name': 'slice_expr'}},
+ 164: {'__type__': 'Rule',
+       'alias': None,
+       'expansion': [{'__type__': 'Terminal', 'filter_out': False, 'name': 'COLON'},
+                     {'__type__': 'Terminal', 'filter_out': False, 'name': 'INTEGER_LITERAL'},
+                     {'__type__': 'Terminal', 'filter_out': False, 'name': 'COLON'},
+                     {'__type__': 'Terminal', 'filter_out': False, 'name': 'INTEGER_LITERAL'}],
+       'options': {'__type__': 'RuleOptions',
+                   'empty_indices': (),
+                   'expand1': False,
+                   'keep_all_tokens': True,
+                   'priority': None,
+                   'template_source': None},
+       'order': 4,
+       'origin': {'__type__': 'NonTerminal', 'name': 'slice_expr'}},
+ 165: {'__type__': 'Rule',
+       'alias': None,
+       'expansion': [{'__type__': 'Terminal', 'filter_out': False, 'name': 'COLON'},
+                     {'__type__': 'Terminal', 'filter_out': False, 'name': 'INTEGER_LITERAL'}],
+       'options': {'__type__': 'RuleOptions',
+                   'empty_indices': (),
+                   'expand1': False,
+                   'keep_all_tokens': True,
+                   'priority': None,
+                   'template_source': None},
+       'order': 5,
+       'origin': {'__type__': 'NonTerminal', 'name': 'slice_expr'}},
+ 166: {'__type__': 'Rule',
+       'alias': None,
+       'expansion': [{'__type__': 'Terminal', 'filter_out': False, 'name': 'COLON'},
+                     {'__type__': 'Terminal', 'filter_out': False, 'name': 'COLON'},
+                     {'__type__': 'Terminal', 'filter_out': False, 'name': 'INTEGER_LITERAL'}],
+       'options': {'__type__': 'RuleOptions',
+                   'empty_indices': (),
+                   'expand1': False,
+                   'keep_all_tokens': True,
+                   'priority': None,
+                   'template_source': None},
+       'order': 6,
+       'origin': {'__type__': 'NonTerminal', 'name': 'slice_expr'}},
+ 167: {'__type__': 'Rule',
+       'alias': None,
+       'expansion': [{'__type__': 'Terminal', 'filter_out': False, 'name': 'COLON'}],
+       'options': {'__type__': 'RuleOptions',
+                   'empty_indices': (),
+                   'expand1': False,
+                   'keep_all_tokens': True,
+                   'priority': None,
+                   'template_source': None},
+       'order': 7,
+       'origin': {'__type__': 'NonTerminal', 'name': 'slice_expr'}},
+ 168: {'__type__': 'Rule',
+       'alias': None,
+       'expansion': [{'__type__': 'NonTerminal', 'name': 'string_literal'}],
+       'options': {'__type__': 'RuleOptions',
+                   'empty_indices': (),
+                   'expand1': False,
+                   'keep_all_tokens': False,
+                   'priority': None,
+                   'template_source': None},
+       'order': 0,
+       'origin': {'__type__': 'NonTerminal', 'name': '_literal'}},
+ 169: {'__type__': 'Rule',
+       'alias': None,
+       'expansion': [{'__type__': 'NonTerminal', 'name': 'integer_literal'}],
+       'options': {'__type__': 'RuleOptions',
+                   'empty_indices': (),
+                   'expand1': False,
+                   'keep_all_tokens': False,
+                   'priority': None,
+                   'template_source': None},
+       'order': 1,
+       'origin': {'__type__': 'NonTerminal', 'name': '_literal'}},
+ 170: {'__type__': 'Rule',
+       'alias': None,
+       'expansion': [{'__type__': 'NonTerminal', 'name': 'decimal_literal'}],
+       'options': {'__type__': 'RuleOptions',
+                   'empty_indices': (),
+                   'expand1': False,
+                   'keep_all_tokens': False,
+                   'priority': None,
+                   'template_source': None},
+       'order': 2,
+       'origin': {'__type__': 'NonTerminal', 'name': '_literal'}},
+ 171: {'__type__': 'Rule',
+       'alias': None,
+       'expansion': [{'__type__': 'Terminal', 'filter_out': False, 'name': 'INTEGER_LITERAL'}],
+       'options': {'__type__': 'RuleOptions',
+                   'empty_indices': (),
+                   'expand1': False,
+                   'keep_all_tokens': False,
+                   'priority': None,
+                   'template_source': None},
+       'order': 0,
+       'origin': {'__type__': 'NonTerminal', 'name': 'integer_literal'}},
+ 172: {'__type__': 'Rule',
+       'alias': None,
+       'expansion': [{'__type__': 'Terminal', 'filter_out': False, 'name': 'STRING_LITERAL'}],
+       'options': {'__type__': 'RuleOptions',
+                   'empty_indices': (),
+                   'expand1': False,
+                   'keep_all_tokens': False,
+                   'priority': None,
+                   'template_source': None},
+       'order': 0,
+       'origin': {'__type__': 'NonTerminal', 'name': 'string_literal'}},
+ 173: {'__type__': 'Rule',
+       'alias': None,
+       'expansion': [{'__type__': 'Terminal', 'filter_out': False, 'name': 'DECIMAL_LITERAL'}],
+       'options': {'__type__': 'RuleOptions',
+                   'empty_indices': (),
+                   'expand1': False,
+                   'keep_all_tokens': False,
+                   'priority': None,
+                   'template_source': None},
+       'order': 0,
+       'origin': {'__type__': 'NonTerminal', 'name': 'decimal_literal'}},
+ 174: {'__type__': 'Rule',
+       'alias': None,
+       'expansion': [{'__type__': 'Terminal', 'filter_out': False, 'name': 'CNAME'}],
+       'options': {'__type__': 'RuleOptions',
+                   'empty_indices': (),
+                   'expand1': False,
+                   'keep_all_tokens': False,
+                   'priority': None,
+                   'template_source': None},
+       'order': 0,
+       'origin': {'__type__': 'NonTerminal', 'name': '_tname'}},
+ 175: {'__type__': 'Rule',
+       'alias': None,
+       'expansion': [{'__type__': 'Terminal', 'filter_out': True, 'name': 'VBAR'},
+                     {'__type__': 'NonTerminal', 'name': 'location_path'}],
+       'options': {'__type__': 'RuleOptions',
+                   'empty_indices': (),
+                   'expand1': False,
+                   'keep_all_tokens': False,
+                   'priority': None,
+                   'template_source': None},
+       'order': 0,
+       'origin': {'__type__': 'NonTerminal', 'name': '__location_union_plus_0'}},
+ 176: {'__type__': 'Rule',
+       'alias': None,
+       'expansion': [{'__type__': 'NonTerminal', 'name': '__location_union_plus_0'},
+                     {'__type__': 'Terminal', 'filter_out': True, 'name': 'VBAR'},
+                     {'__type__': 'NonTerminal', 'name': 'location_path'}],
+       'options': {'__type__': 'RuleOptions',
+                   'empty_indices': (),
+                   'expand1': False,
+                   'keep_all_tokens': False,
+                   'priority': None,
+                   'template_source': None},
+       'order': 1,
+       'origin': {'__type__': 'NonTerminal', 'name': '__location_union_plus_0'}},
+ 177: {'__type__': 'Rule',
+       'alias': None,
+       'expansion': [{'__type__': 'NonTerminal', 'name': 'step'}],
+       'options': {'__type__': 'RuleOptions',
+                   'empty_indices': (),
+                   'expand1': False,
+                   'keep_all_tokens': False,
+                   'priority': None,
+                   'template_source': None},
+       'order': 0,
+       'origin': {'__type__': 'NonTerminal', 'name': '___root_location_path_star_1'}},
+ 178: {'__type__': 'Rule',
+       'alias': None,
+       'expansion': [{'__type__': 'NonTerminal', 'name': '___root_location_path_star_1'},
+                     {'__type__': 'NonTerminal', 'name': 'step'}],
+       'options': {'__type__': 'RuleOptions',
+                   'empty_indices': (),
+                   'expand1': False,
+                   'keep_all_tokens': False,
+                   'priority': None,
+                   'template_source': None},
+       'order': 1,
+       'origin': {'__type__': 'NonTerminal', 'name': '___root_location_path_star_1'}},
+ 179: {'__type__': 'Rule',
+       'alias': None,
+       'expansion': [{'__type__': 'NonTerminal', 'name': 'predicate'}],
+       'options': {'__type__': 'RuleOptions',
+                   'empty_indices': (),
+                   'expand1': False,
+                   'keep_all_tokens': False,
+                   'priority': None,
+                   'template_source': None},
+       'order': 0,
+       'origin': {'__type__': 'NonTerminal', 'name': '___raw_path_step_star_2'}},
+ 180: {'__type__': 'Rule',
+       'alias': None,
+       'expansion': [{'__type__': 'NonTerminal', 'name': '___raw_path_step_star_2'},
+                     {'__type__': 'NonTerminal', 'name': 'predicate'}],
+       'options': {'__type__': 'RuleOptions',
+                   'empty_indices': (),
+                   'expand1': False,
+                   'keep_all_tokens': False,
+                   'priority': None,
+                   'template_source': None},
+       'order': 1,
+       'origin': {'__type__': 'NonTerminal', 'name': '___raw_path_step_star_2'}}}
@@ -0,0 +1,75 @@
+"""Generates _query_grammar.py: the query grammar's parser, with its LALR tables
+serialized as Python data. Loading it doesn't read the grammar or build tables,
+so starting up is fast & doesn't depend on a cache file.
+
+Run after changing tree_ql.lark or upgrading Lark:
+
+    python -m tree_ql.build_parser
+
+The output is deterministic: the same grammar & Lark version generate the same file.
+setup.py runs it when building the package, if the generated parser is out of date. 
+If the grammar or Lark version doesn't match the generated parser, the parser is 
+built from the grammar at startup instead."""
+from pprint import pformat
+import runpy
+import lark
+from lark import Lark
+from lark.grammar import Rule
+from lark.lexer import TerminalDef
+from .tree_ql import _GRAMMAR, _PARSER_OPTIONS, _PRECOMPILED_PARSER, _grammar_hash
+
+_SHIFT = 0
+
+def build(path=_PRECOMPILED_PARSER):
+    parser = Lark.open(_GRAMMAR, **_PARSER_OPTIONS)
+    data, memo = parser.memo_serialize([TerminalDef, Rule])
+    data['parser']['parser'] = _canonical_table(data['parser']['parser'])
+    with open(path, 'w') as f:
+        f.write(f'# Generated by "python -m tree_ql.build_parser" from {_GRAMMAR.name}. Do not edit\n')
+        f.write(f'LARK_VERSION = {lark.__version__!r}\n')
+        f.write(f'GRAMMAR_HASH = {_grammar_hash()!r}\n')
+        f.write(f'DATA = {pformat(data, width=120)}\n')
+        f.write(f'MEMO = {pformat(memo, width=120)}\n')
+
+def is_current(path=_PRECOMPILED_PARSER):
+    """True if the generated parser is for this grammar & Lark version"""
+    try:
+        namespace = runpy.run_path(str(path))
+    except (OSError, SyntaxError):
+        return False
+    return namespace.get('LARK_VERSION')==lark.__version__ and namespace.get('GRAMMAR_HASH')==_grammar_hash()
+
+def _canonical_table(table):
+    """The LALR parse table with its tokens & states renumbered in a fixed order: 
+    tokens by name, states breadth first from the start states, following shifts 
+    in token name order. Lark numbers them by iterating sets, which varies between 
+    runs, so otherwise the same grammar generates a different file each time"""
+    names = table['tokens']
+    tokens = {token: number for number, token in enumerate(sorted(names, key=names.get))}
+    states = {}
+    pending = [table['start_states'][start] for start in sorted(table['start_states'])]
+    while pending:
+        state = pending.pop(0)
+        if state in states:
+            continue
+        states[state] = len(states)
+        actions = table['states'][state]
+        pending.extend(arg for _, (action, arg) in sorted(actions.items(), key=lambda item: names[item[0]]) if action==_SHIFT)
+    for state in sorted(table['states']):
+        # Unreachable states, if there are any
+        states.setdefault(state, len(states))
+
+    renumbered = {}
+    for state, number in sorted(states.items(), key=lambda item: item[1]):
+        actions = table['states'][state]
+        renumbered[number] = {tokens[token]: (action, states[arg] if action==_SHIFT else arg)
+                              for token, (action, arg) in sorted(actions.items(), key=lambda item: names[item[0]])}
+    return {
+        'tokens': {number: names[token] for token, number in tokens.items()},
+        'states': renumbered,
+        'start_states': {start: states[state] for start, state in table['start_states'].items()},
+        'end_states': {start: states[state] for start, state in table['end_states'].items()},
+    }
+
+if __name__ == '__main__':
+    build()
@@ -0,0 +1,389 @@
+import itertools
+import operator
+import more_itertools
+from lark.exceptions import VisitError
+from lark import Token
+from .optimizer import INDEX_AXES
+from .tree_ql import (_terminal_transformer, index_working_set, _has_descendant_match, _root_index, _INDEX_KINDS, _AGGREGATES, _exists, _optional,
+                      _NUMERIC_OPERATORS, _negate)
+
+# Operators the generated code writes inline
+_OPERATORS = {
+    operator.eq: '==',
+    operator.ne: '!=',
+}
+
+_NULL_AXIS = object()
+_ANY_NODE = Token('WILDCARD', '*')
+
+class unsupported_query(Exception):
+    """The query uses a construct the code generator can't compile"""
+
+class _step:
+    """A generated generator function: (working set, context) -> working set"""
+    def __init__(self, name):
+        self.name = name
+
+class _path:
+    """A generated function: (working set, context) -> working set"""
+    def __init__(self, name):
+        self.name = name
+
+class _expr:
+    """Python source for an expression of the current item"""
+    def __init__(self, source):
+        self.source = source
+
+class _value(_expr):
+    """Python source for a value (rather than a boolean) of the current item"""
+
+class _codegen_transformer(_terminal_transformer):
+    """Compiles a query plan to Python source: one function per step, with the
+    axis, node test and filters written as inline loops and comparisons.
+
+    This avoids the per-item function call overhead of the closure chain
+    that _inline_transformer generates"""
+
+    def __init__(self, tree_node_nameattr, tree_node_childattr):
+        """
+        tree_node_nameattr is the name of the attribute that provides the tree node name
+        tree_node_childattr is the name of the attribute that accesses a tree nodes children
+        """
+        self._tree_node_nameattr = tree_node_nameattr
+        self._tree_node_childattr = tree_node_childattr
+
+    def compile(self, plan, query_str):
+        """Compile a query plan to a function: context -> context, like the closure engine.
+        Raises unsupported_query if the plan can't be compiled"""
+        self._functions = []
+        self._counter = itertools.count()
+        try:
+            source = self.transform(plan)
+        except VisitError as e:
+            if isinstance(e.orig_exc, unsupported_query):
+                raise e.orig_exc
+            raise
+        namespace = {
+            '_exists': _exists,
+            '_aggregates': _AGGREGATES,
+            '_optional': _optional,
+            '_negate': _negate,
+            **{f'_{op.__name__}': apply for op, apply in _NUMERIC_OPERATORS.items()},
+            '_index': index_working_set,
+            '_islice': more_itertools.islice_extended,
+            '_root_index': _root_index,
+            '_has_descendant_match': _has_descendant_match,
+        }
+        exec(compile(source, f'<tree_ql: {query_str}>', 'exec'), namespace)
+        query = namespace['_query']
+        query.tree_ql_source = source
+        return query
+
+    def __default__(self, data, children, meta):
+        raise unsupported_query(data)
+
+#region rule_processing
+
+    def start(self, children):
+        path = self._as_path(children[0])
+        self._functions.append('\n'.join([
+            'def _query(context):',
+            f'    return context.update_working_set({path.name}(context.working_set, context))']))
+        return '\n\n'.join(self._functions) + '\n'
+
+    def absolutelocation_path(self, children):
+        return self._path_function(children, absolute=True)
+
+    def relativelocation_path(self, children):
+        return self._path_function(children, absolute=False)
+
+    def child_step(self, children):
+        return self._attribute_step(children)
+
+    def descendent_step(self, children):
+        return self._attribute_step(children)
+
+    def null_axis_specifier(self, children):
+        return _NULL_AXIS
+
+    def attribute_step(self, children):
+        if len(children)>1:
+            raise unsupported_query('attribute_step predicate')
+        return self._function('_attribute', [
+            'for item in ws:',
+            f'    yield getattr(item, {children[0].value!r}, None)'])
+
+    def fused_step(self, children):
+        axis, node_test, attribute_tests = children[0].value, children[1], children[2]
+        if axis=='self' and node_test.type=='WILDCARD' and not attribute_tests:
+            # Just the predicates
+            return self._path_function(children[3:], absolute=False)
+        if axis=='self':
+            step = self._filter_step('_self', node_test, attribute_tests, 'ws')
+        elif axis in INDEX_AXES:
+            step = self._function('_axis', [
+               f'index = _root_index(context, {self._tree_node_nameattr!r}, {self._tree_node_childattr!r})',
+               f'for node in index.axis(ws, {axis!r}):',
+               *self._yield_if(self._test_source('node', node_test, attribute_tests), 4)])
+        elif axis=='child':
+            step = self._function('_child', [
+                'for item in ws:',
+               f'    children = getattr(item, {self._tree_node_childattr!r}, None)',
+                '    if children is None:',
+                '        continue',
+                '    for node in children:',
+               *self._yield_if(self._test_source('node', node_test, attribute_tests), 8)])
+        else:
+            step = self._descendant_step(axis, node_test, attribute_tests)
+        return self._path_function([step] + children[3:], absolute=False) if len(children)>3 else step
+
+    def structural_join(self, children):
+        steps = list(zip(children[::2], children[1::2]))
+        fallback = self._path_function([self.fused_step([axis, name_test, []]) for axis, name_test in steps], absolute=False)
+        joined = self._function('_joined', [
+            'index = context.index',
+            'ws = list(ws)',
+            'positions = index.positions(ws)',
+            'if positions is None:',
+           f'    yield from {fallback.name}(ws, context)',
+            '    return',
+           *[f'positions = index.join(positions, {name_test.value!r}, {axis.value=="descendant-or-self"})' for axis, name_test in steps],
+            'for position in positions:',
+            '    yield index.items[position]'])
+        return self._function('_join', [
+            'if context.index is None:',
+           f'    return {fallback.name}(ws, context)',
+           f'return {joined.name}(ws, context)'])
+
+    def fused_filter(self, children):
+        return children
+
+    def fused_attribute_test(self, children):
+        return (children[0].value, children[1].value, children[2].value)
+
+    def predicate_expr(self, children):
+        expr = self._as_expr(children[0])
+        return self._function('_predicate', [
+            'for item in ws:',
+           f'    if {expr.source}:',
+            '        yield item'])
+
+    def descendant_exists(self, children):
+        axis, node_test, attribute_tests = children[0].value, children[1], children[2]
+        test = self._test_source('node', node_test, attribute_tests) or 'True'
+        if len(children)>3:
+            predicates = self._path_function(children[3:], absolute=False)
+            test = f'{test} and _exists({predicates.name}([node], context))'
+        if node_test.type=='NAME_TEST':
+            lookup = f'index.named({node_test.value!r}, start, end)'
+        else:
+            lookup = f'index.scan(start, end, {_INDEX_KINDS.get(node_test.value)!r})'
+        # Memo key, for _has_descendant_match
+        key = f'_key_{next(self._counter)}'
+        self._functions.append(f'{key} = object()')
+        return self._function('_exists', [
+           f'matches = lambda node: {test}',
+           f'lookup = lambda index, start, end: {lookup}',
+            'for item in ws:',
+           f'    if {"matches(item) or " if axis=="descendant-or-self" else ""}_has_descendant_match(context, {key}, item, matches, lookup, {self._tree_node_childattr!r}):',
+            '        yield item'])
+
+    def index_predicate(self, children):
+        return self._function('_index', [f'return _index(ws, {children[0].value!r})'])
+
+    def slice_expr(self, children):
+        start, stop, step = self._slice_args(children)
+        return self._function('_slice', [f'return _islice(ws, {start!r}, {stop!r}, {step!r})'])
+
+    def equality_expr(self, children):
+        lhs, op, rhs = children
+        if op.value not in _OPERATORS:
+            raise unsupported_query(op.type)
+        return _expr(f'({self._as_value(lhs).source} {_OPERATORS[op.value]} {self._as_value(rhs).source})')
+
+    def relational_expr(self, children):
+        lhs, op, rhs = children
+        return _expr(f'_{op.value.__name__}({self._as_value(lhs).source}, {self._as_value(rhs).source})')
+
+    def additive_expr(self, children):
+        lhs, op, rhs = children
+        return _value(f'_{op.value.__name__}({self._as_value(lhs).source}, {self._as_value(rhs).source})')
+
+    multiply_expr = additive_expr
+
+    def unary_expr(self, children):
+        return _value(f'_negate({self._as_value(children[0]).source})')
+
+    def parenthesized_expr(self, children):
+        return children[0]
+
+    def or_expr(self, children):
+        return _expr(f'({self._as_expr(children[0]).source} or {self._as_expr(children[1]).source})')
+
+    def and_expr(self, children):
+        return _expr(f'({self._as_expr(children[0]).source} and {self._as_expr(children[1]).source})')
+
+    def attribute_accessor(self, children):
+        return _value(f'getattr(item, {children[0].value!r}, None)')
+
+    def string_literal(self, children):
+        return _value(repr(children[0].value))
+
+    def integer_literal(self, children):
+        return _value(repr(children[0].value))
+
+    def decimal_literal(self, children):
+        return _value(repr(children[0].value))
+
+    def boolean_literal(self, children):
+        return _value(repr(children[0].value))
+
+    def functioncall(self, children):
+        args = children[1] if len(children)>1 and isinstance(children[1], list) else [child for child in children[1:] if child is not None]
+        if children[0].value not in _AGGREGATES or len(args)!=1:
+            # The closure backend reports the error
+            raise unsupported_query('functioncall')
+        arg = args[0]
+        if isinstance(arg, (_step, _path)):
+            items = f'{arg.name}([item], context)'
+        elif isinstance(arg, _value):
+            items = f'_optional({arg.source})'
+        else:
+            raise unsupported_query('function argument')
+        return _value(f'_aggregates[{children[0].value!r}]({items})')
+
+    def functioncall_list(self, children):
+        return (children[0] if isinstance(children[0], list) else children[:1]) + children[1:]
+
+    def varref(self, children):
+        return _value(f'context.variables[{children[0].value!r}]')
+
+#endregion
+
+#region Support methods
+
+    def _function(self, prefix, body, signature='ws, context'):
+        name = f'{prefix}_{next(self._counter)}'
+        self._functions.append('\n'.join([f'def {name}({signature}):'] + ['    '+line for line in body]))
+        return _step(name)
+
+    def _path_function(self, children, absolute):
+        steps = [child for child in children if child is not _NULL_AXIS]
+        if not all(isinstance(step, (_step, _path)) for step in steps):
+            raise unsupported_query('path step')
+        body = ['ws = [context.root]'] if absolute else []
+        body += [f'ws = {step.name}(ws, context)' for step in steps]
+        body += ['return ws']
+        function = self._function('_path', body)
+        return _path(function.name)
+
+    def _attribute_step(self, children):
+        if children[0] is not _NULL_AXIS:
+            raise unsupported_query('unfused step')
+        return children[1]
+
+    def _as_path(self, child):
+        if not isinstance(child, (_step, _path)):
+            raise unsupported_query('path')
+        return child
+
+    def _as_expr(self, child):
+        """A boolean expression of the current item"""
+        if isinstance(child, (_step, _path)):
+            return _expr(f'_exists({child.name}([item], context))')
+        if isinstance(child, _expr) and not isinstance(child, _value):
+            return child
+        raise unsupported_query('predicate')
+
+    def _as_value(self, child):
+        if isinstance(child, _value):
+            return child
+        raise unsupported_query('operand')
+
+    def _yield_if(self, test, indent):
+        if test is None:
+            return [' '*indent + 'yield node']
+        return [' '*indent + f'if {test}:', ' '*indent + '    yield node']
+
+    def _test_source(self, var, node_test, attribute_tests):
+        """Python source testing var against a node test & attribute tests. None if there's nothing to test"""
+        tests = []
+        if node_test.type=='NAME_TEST':
+            tests.append(f'getattr({var}, {self._tree_node_nameattr!r}, None) == {node_test.value!r}')
+        elif node_test.value=='leaf':
+            tests.append(f'not hasattr({var}, {self._tree_node_childattr!r})')
+        elif node_test.value=='node':
+            tests.append(f'hasattr({var}, {self._tree_node_childattr!r})')
+        for attribute, op, value in attribute_tests:
+            if op not in _OPERATORS:
+                raise unsupported_query(op.__name__)
+            tests.append(f'getattr({var}, {attribute!r}, None) {_OPERATORS[op]} {value!r}')
+        return ' and '.join(tests) if tests else None
+
+    def _filter_step(self, prefix, node_test, attribute_tests, source):
+        return self._function(prefix, [
+            f'for node in {source}:',
+            *self._yield_if(self._test_source('node', node_test, attribute_tests), 4)])
+
+    def _descendant_step(self, axis, node_test, attribute_tests):
+        """Explicit stack traversal, skipping already visited subtrees, as 
+        _inline_transformer._scan_nodes. Skips empty items.
+        Name tests skip the subtrees of nodes named in pruned"""
+        test = self._test_source('node', node_test, attribute_tests)
+        childattr = self._tree_node_childattr
+        named = node_test.type=='NAME_TEST'
+        is_pruned = lambda var: f'(pruned and getattr({var}, {self._tree_node_nameattr!r}, None) in pruned)'
+        if axis=='descendant':
+            start = [f'    children = getattr(item, {childattr!r}, None)',
+                     f'    if children is None{" or " + is_pruned("item") if named else ""}:',
+                      '        continue',
+                      '    visited.add(id(item))',
+                      '    stack = [iter(children)]']
+        else:
+            start = ['    stack = [iter((item,))]']
+        scan_step = self._function('_descendant', [
+            'visited = set()',
+            'for item in ws:',
+            '    if id(item) in visited:',
+            '        continue',
+            *start,
+            '    while stack:',
+            '        for node in stack[-1]:',
+            '            if not node:',
+            '                continue',
+            *self._yield_if(test, 12),
+           f'            node_children = getattr(node, {childattr!r}, None)',
+           f'            if node_children is not None{" and not " + is_pruned("node") if named else ""}:',
+            '                visited.add(id(node))',
+            '                stack.append(iter(node_children))',
+            '                break',
+            # Leaves too: a later working set item would emit itself
+            *(['            visited.add(id(node))'] if axis=='descendant-or-self' else []),
+            '        else:',
+            '            stack.pop()'], signature='ws, pruned=None')
+
+        # Can be answered from an index, if there is one: a range scan of each item's subtree
+        start_offset = '' if axis=='descendant-or-self' else '+1'
+        if node_test.type=='NAME_TEST':
+            lookup = f'index.named({node_test.value!r}, start{start_offset}, end)'
+        else:
+            lookup = f'index.scan(start{start_offset}, end, {_INDEX_KINDS.get(node_test.value)!r})'
+        indexed = self._function('_indexed', [
+            'covered = 0',
+            'for item in ws:',
+            '    span = index.span(item)',
+            '    if span is None:',
+           f'        yield from {scan_step.name}([item])',
+            '        continue',
+            '    start, end = span',
+            '    if start < covered:',
+            '        continue',
+            '    covered = end',
+           f'    for node in {lookup}:',
+            *self._yield_if(self._test_source('node', _ANY_NODE, attribute_tests), 8)], signature='ws, index')
+        pruned = f'context.grammar.pruned({node_test.value!r}) if context.grammar else None' if named else ''
+        return self._function('_scan', [
+            'if context.index is None:',
+           f'    return {scan_step.name}(ws, {pruned})',
+           f'return {indexed.name}(ws, context.index)'])
+#endregion
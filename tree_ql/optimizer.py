@@ -0,0 +1,244 @@
+import functools
+import math
+from lark import Token, Tree
+from lark.visitors import Discard, Transformer
+from .tree_ql import _terminal_transformer, _NUMERIC_OPERATORS, _negate
+
+# Maps axis specifier rules to the axis they select
+_AXES = {
+    'child_axis_specifier': 'child',
+    'descendant_axis_specifier': 'descendant',
+    'descendant_or_self': 'descendant-or-self',
+    'self_axis_specifier': 'self',
+    'parent_axis_specifier': 'parent',
+    'ancestor_axis_specifier': 'ancestor',
+    'ancestor_or_self': 'ancestor-or-self',
+    'following_axis_specifier': 'following',
+    'following_sibling': 'following-sibling',
+    'preceding_axis_specifier': 'preceding',
+    'preceding_sibling': 'preceding-sibling',
+}
+
+# Axes that navigate using a tree_index
+INDEX_AXES = ('parent', 'ancestor', 'ancestor-or-self', 'following', 'following-sibling', 'preceding', 'preceding-sibling')
+
+_NODE_TESTS = ('tname_test', 'wildcard_name_test', 'leaf_node_test', 'node_node_test')
+_LITERALS = ('string_literal', 'integer_literal', 'decimal_literal')
+# Expressions computed when the query is compiled, if their operands are all constants
+_FOLDABLE = ('relational_expr', 'additive_expr', 'multiply_expr', 'unary_expr')
+_CONSTANTS = _LITERALS + ('boolean_literal',)
+# Axes whose steps can be fused into a union_step
+_UNION_AXES = ('child', 'descendant', 'descendant-or-self', 'self')
+# Operators that can be fused. Both are symmetric, so a literal on the left is swapped to the right
+_FUSABLE_OPS = ('OP_EQUAL', 'OP_NOT_EQUAL')
+
+class _query_optimizer(Transformer):
+    """Rewrites a parsed query (the query plan) before it is compiled.
+
+    Each step's axis, node test and any leading simple attribute predicates 
+    (E.g. [@type=="NAME" and @value=="x"]) are fused into one fused_step. That 
+    compiles to a single filtered traversal, rather than a traversal that 
+    generates every node followed by a chain of filters.
+    
+    Steps that are no-ops (E.g. self::*) are dropped.
+
+    Runs of consecutive, unfiltered descendant name steps (E.g. //funcdef//return_stmt)
+    are fused into a structural_join. Given an index, that is evaluated by merging 
+    each name's positions, rather than by scanning every intermediate subtree.
+
+    Unions of single steps on the same axis (E.g. //funcdef | //classdef) are fused
+    into a union_step: one traversal, testing for any of the steps.
+
+    Relational & arithmetic expressions of constants (E.g. 60*60) are folded into
+    a literal, so aren't recomputed for each node. Folded comparisons with an 
+    attribute can then be fused too. Parentheses, which only group, are dropped."""
+
+    def absolutelocation_path(self, children):
+        return Tree('absolutelocation_path', _join_descendant_steps(children))
+
+    def predicate_expr(self, children):
+        """A test for a descendant (E.g. [.//yield_expr]) becomes a descendant_exists, 
+        which tests every item in one pass. A union only needs any branch to match:
+        it becomes an or_expr of its branches, each tested from the item, so isn't merged"""
+        if _is_tree(children[0], 'union_expr'):
+            tests = [_descendant_exists(branch) or branch for branch in children[0].children]
+            return Tree('predicate_expr', [functools.reduce(lambda lhs, rhs: Tree('or_expr', [lhs, rhs]), tests)])
+        return _descendant_exists(children[0]) or Tree('predicate_expr', children)
+
+    def relational_expr(self, children):
+        return _fold(Tree('relational_expr', children))
+
+    def additive_expr(self, children):
+        return _fold(Tree('additive_expr', children))
+
+    def multiply_expr(self, children):
+        return _fold(Tree('multiply_expr', children))
+
+    def unary_expr(self, children):
+        return _fold(Tree('unary_expr', children))
+
+    def parenthesized_expr(self, children):
+        return children[0]
+
+    def union_expr(self, children):
+        """Flatten nested unions (a | b | c), and fuse unions of single, unfiltered
+        steps on the same axis from the same place into a union_step"""
+        branches = [branch for child in children for branch in (child.children if _is_tree(child, 'union_expr') else [child])]
+        steps = [_single_step(branch) for branch in branches]
+        if (all(steps) and len({branch.data for branch in branches})==1
+                and len({step.children[0] for step in steps})==1 and steps[0].children[0] in _UNION_AXES):
+            fused = [steps[0].children[0]] + [child for step in steps for child in step.children[1:3]]
+            return Tree(branches[0].data, [Tree('union_step', fused)])
+        return Tree('union_expr', branches)
+
+    def child_step(self, children):
+        return self._fuse_step('child_step', 'child', children)
+
+    def descendent_step(self, children):
+        return self._fuse_step('descendent_step', 'descendant', children)
+
+    def relativelocation_path(self, children):
+        """The first step of a relative path isn't wrapped in a step: fuse it in place,
+        if it has an explicit axis"""
+        first = 0
+        while first<len(children) and not _is_tree(children[first], 'child_step', 'descendent_step', 'fused_step'):
+            first += 1
+        if first and children[0].data in _AXES:
+            try:
+                children = [self._fuse_step(None, None, children[:first])] + children[first:]
+            except Discard:
+                children = children[first:]
+        return Tree('relativelocation_path', _join_descendant_steps(children))
+
+    def _fuse_step(self, rule, default_axis, children):
+        if children[0].data=='default_axis_specifier':
+            axis = default_axis
+        else:
+            axis = _AXES.get(children[0].data)
+        if axis is None:
+            # Not a path step (E.g. an attribute step)
+            return Tree(rule, children)
+
+        remaining = children[1:]
+        node_test = Token('WILDCARD', '*')
+        if remaining and _is_tree(remaining[0], *_NODE_TESTS):
+            node_test = _node_test_token(remaining[0])
+            remaining = remaining[1:]
+
+        attribute_tests = []
+        while remaining and _is_tree(remaining[0], 'predicate_expr') and _is_simple_filter(remaining[0].children[0]):
+            attribute_tests.extend(_attribute_tests(remaining[0].children[0]))
+            remaining = remaining[1:]
+
+        if axis=='self' and node_test.type=='WILDCARD' and not attribute_tests and not remaining:
+            raise Discard()
+
+        return Tree('fused_step', [Token('FUSED_AXIS', axis), node_test, Tree('fused_filter', attribute_tests)] + remaining)
+
+def needs_index(plan):
+    """True if a query plan (optimized or not) uses axes that need a tree_index, or
+    unions, which are merged in document order using one"""
+    return any(subtree.data in _AXES and _AXES[subtree.data] in INDEX_AXES
+               or subtree.data=='fused_step' and subtree.children[0] in INDEX_AXES
+               or subtree.data=='union_expr'
+               for subtree in plan.iter_subtrees())
+
+def _descendant_exists(path):
+    """A descendant_exists for a predicate's path, if it is a single descendant step"""
+    if _is_tree(path, 'relativelocation_path') and len(path.children)==1:
+        step = path.children[0]
+        if (_is_tree(step, 'fused_step') and step.children[0] in ('descendant', 'descendant-or-self')
+                and not any(_is_tree(predicate, 'index_predicate', 'slice_expr') for predicate in step.children[3:])):
+            return Tree('descendant_exists', step.children)
+    return None
+
+def _fold(expr):
+    """A literal for the expression's value, if its operands are all constants"""
+    operands = [child for child in expr.children if isinstance(child, Tree)]
+    if not all(_is_tree(operand, *_CONSTANTS) for operand in operands):
+        return expr
+    # Operand & operator values, as the compiled query would see them
+    converted = _terminal_transformer().transform(expr)
+    values = [child.children[0].value for child in converted.children if isinstance(child, Tree)]
+    if expr.data=='unary_expr':
+        value = _negate(values[0])
+    else:
+        value = _NUMERIC_OPERATORS[converted.children[1].value](*values)
+    return _literal(value) or expr
+
+def _literal(value):
+    """The literal for a folded value. None for values a literal can't represent
+    (E.g. the missing result of a division by zero)"""
+    if isinstance(value, bool):
+        return Tree('boolean_literal', [Token('BOOLEAN_LITERAL', str(value).lower())])
+    if isinstance(value, int):
+        return Tree('integer_literal', [Token('INTEGER_LITERAL', str(value))])
+    if isinstance(value, float) and math.isfinite(value):
+        return Tree('decimal_literal', [Token('DECIMAL_LITERAL', repr(value))])
+    return None
+
+def _single_step(path):
+    """The path's step, if it is a single fused_step without predicates"""
+    if _is_tree(path, 'absolutelocation_path', 'relativelocation_path') and len(path.children)==1:
+        step = path.children[0]
+        if _is_tree(step, 'fused_step') and len(step.children)==3:
+            return step
+    return None
+
+def optimize_query(tree):
+    """Returns the optimized query plan for a parsed query"""
+    return _query_optimizer().transform(tree)
+
+def _join_descendant_steps(steps):
+    """Replace each run of 2 or more descendant name steps, without filters, with 
+    a structural_join of their (axis, name test) pairs"""
+    joined = []
+    run = []
+    for step in steps + [None]:
+        if _is_joinable(step):
+            run.append(step)
+            continue
+        if len(run)>1:
+            joined.append(Tree('structural_join', [token for step in run for token in step.children[:2]]))
+        else:
+            joined.extend(run)
+        run = []
+        if step is not None:
+            joined.append(step)
+    return joined
+
+def _is_joinable(step):
+    return (_is_tree(step, 'fused_step') and len(step.children)==3 and not step.children[2].children
+            and step.children[0] in ('descendant', 'descendant-or-self') and step.children[1].type=='NAME_TEST')
+
+def _is_tree(item, *rules):
+    return isinstance(item, Tree) and item.data in rules
+
+def _node_test_token(node_test):
+    if node_test.data=='tname_test':
+        return Token('NAME_TEST', node_test.children[0].value)
+    if node_test.data=='leaf_node_test':
+        return Token('KIND_TEST', 'leaf')
+    if node_test.data=='node_node_test':
+        return Token('KIND_TEST', 'node')
+    return Token('WILDCARD', '*')
+
+def _is_simple_filter(expr):
+    """A comparison between an attribute & a literal, or an 'and' of those"""
+    if _is_tree(expr, 'and_expr'):
+        return all(_is_simple_filter(child) for child in expr.children)
+    if _is_tree(expr, 'equality_expr'):
+        lhs, op, rhs = expr.children
+        return op.type in _FUSABLE_OPS and (
+            (_is_tree(lhs, 'attribute_accessor') and _is_tree(rhs, *_LITERALS))
+            or (_is_tree(lhs, *_LITERALS) and _is_tree(rhs, 'attribute_accessor')))
+    return False
+
+def _attribute_tests(expr):
+    """Convert a simple filter to a list of fused_attribute_test: attribute, operator, literal"""
+    if _is_tree(expr, 'and_expr'):
+        return [test for child in expr.children for test in _attribute_tests(child)]
+    lhs, op, rhs = expr.children
+    if _is_tree(lhs, *_LITERALS):
+        lhs, rhs = rhs, lhs
+    return [Tree('fused_attribute_test', [lhs.children[0], op, rhs.children[0]])]
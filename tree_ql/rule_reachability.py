@@ -0,0 +1,127 @@
+from collections import defaultdict
+import weakref
+from lark import Tree
+
+class rule_reachability:
+    """Which tree names can appear below which others, from a Lark grammar's rules.
+
+    Descendant name scans (//foo) use this to skip subtrees that can't contain a
+    foo, and queries use it to report steps that can never match.
+
+    Rules that Lark inlines (_foo, ?foo with 1 child) don't create a tree of their
+    own, but what they can contain is still reachable from the rule that uses them.
+    Trees reshaped after parsing (E.g. by a Transformer) aren't described by the
+    grammar: don't use this for them."""
+
+    # Reachability tables, per Lark parser
+    _cache = weakref.WeakKeyDictionary()
+
+    def __init__(self, rules):
+        """rules: the Lark parser's rules (Lark.rules)"""
+        expansions = defaultdict(set)
+        produces = defaultdict(set)
+        for rule in rules:
+            origin = rule.origin.name
+            expansions[origin].update(symbol.name for symbol in rule.expansion if not symbol.is_term)
+            name = rule.alias or (None if origin.startswith('_') else origin)
+            if name:
+                produces[origin].add(name)
+
+        contains = defaultdict(set)
+        for origin, names in produces.items():
+            reached = set()
+            stack = list(expansions[origin])
+            while stack:
+                symbol = stack.pop()
+                if symbol not in reached:
+                    reached.add(symbol)
+                    stack.extend(expansions.get(symbol, ()))
+            descendants = set().union(*(produces.get(symbol, ()) for symbol in reached))
+            for name in names:
+                contains[name] |= descendants
+        self._contains = {name: frozenset(descendants) for name, descendants in contains.items()}
+        self._pruned = {}
+
+    @classmethod
+    def of(cls, grammar):
+        """The rule_reachability for grammar: a Lark parser, or a rule_reachability.
+        Shared by all queries using the same parser"""
+        if grammar is None or isinstance(grammar, rule_reachability):
+            return grammar
+        reachability = cls._cache.get(grammar)
+        if reachability is None:
+            reachability = cls._cache[grammar] = cls(grammar.rules)
+        return reachability
+
+    @property
+    def names(self):
+        """All the tree names the grammar can produce"""
+        return self._contains.keys()
+
+    def can_contain(self, name, descendant):
+        """False if a tree named name can never have a descendant tree named descendant.
+        True if it might, or if name isn't from the grammar"""
+        descendants = self._contains.get(name)
+        return descendants is None or descendant in descendants
+
+    def pruned(self, descendant):
+        """The tree names whose subtrees never contain a tree named descendant"""
+        pruned = self._pruned.get(descendant)
+        if pruned is None:
+            pruned = self._pruned[descendant] = frozenset(
+                name for name, descendants in self._contains.items() if descendant not in descendants)
+        return pruned
+
+    def unmatchable_steps(self, plan):
+        """The steps of a query plan (see _query_compiler.plan) that can never match
+        anything in a tree from this grammar. E.g. ['descendant::funcdef'] for
+        //expr_stmt//funcdef"""
+        unmatchable = []
+        self._check_expr(plan, None, unmatchable)
+        return unmatchable
+
+    def _check_expr(self, expr, names, unmatchable):
+        """Check the paths in expr. names: the possible names of the current item,
+        or None if unknown"""
+        if not isinstance(expr, Tree):
+            return
+        if expr.data=='absolutelocation_path':
+            self._check_path(expr.children, None, unmatchable)
+        elif expr.data=='relativelocation_path':
+            self._check_path(expr.children, names, unmatchable)
+        elif expr.data in ('fused_step', 'structural_join', 'descendant_exists'):
+            self._check_path([expr], names, unmatchable)
+        else:
+            for child in expr.children:
+                self._check_expr(child, names, unmatchable)
+
+    def _check_path(self, steps, names, unmatchable):
+        for step in steps:
+            if isinstance(step, Tree) and step.data in ('fused_step', 'descendant_exists'):
+                names = self._check_step(step.children[0], step.children[1], names, unmatchable)
+                for predicate in step.children[3:]:
+                    self._check_expr(predicate, names, unmatchable)
+            elif isinstance(step, Tree) and step.data=='structural_join':
+                for axis, node_test in zip(step.children[::2], step.children[1::2]):
+                    names = self._check_step(axis, node_test, names, unmatchable)
+            else:
+                self._check_expr(step, names, unmatchable)
+                names = None
+
+    def _check_step(self, axis, node_test, names, unmatchable):
+        """Returns the possible names after the step"""
+        if node_test.type!='NAME_TEST':
+            return None
+        name = node_test.value
+        if axis=='self':
+            possible = names is None or name in names
+        elif name not in self._contains:
+            possible = False
+        elif axis not in ('child', 'descendant', 'descendant-or-self'):
+            possible = True
+        else:
+            possible = names is None or any(self.can_contain(parent, name) for parent in names) or (
+                axis=='descendant-or-self' and name in names)
+        if not possible:
+            unmatchable.append(f'{axis}::{name}')
+        return {name}
@@ -0,0 +1,95 @@
+import time
+
+class step_profile:
+    """Execution statistics for one compiled step of a query, from LarkQuery.explain.
+
+    steps: the profiles of the steps inside this one. E.g. a path's steps, a step's predicates
+    evaluations: how many times the step was run. Steps in predicates run once per item tested
+    items_in: items pulled from the step's input working set
+    items_out: items the step generated
+    visited: items the step's node & attribute tests were applied to
+    time: seconds spent generating the step's output, excluding the time spent pulling
+    its input (the previous steps' time), but including nested steps' time.
+    For expressions, the total time spent evaluating them"""
+
+    def __init__(self, label=None):
+        self.label = label
+        self.steps = []
+        self.evaluations = 0
+        self.items_in = 0
+        self.items_out = 0
+        self.visited = 0
+        self.time = 0.0
+
+    def step(self, func):
+        """Wrap func, a step mapping a context to a context, to record its statistics"""
+        def profiled_step(context):
+            self.evaluations += 1
+            context.working_set = self._count_in(context.working_set)
+            context = func(context)
+            context.working_set = self._count_out(context.working_set)
+            return context
+        profiled_step.tree_ql_profile = self
+        return profiled_step
+
+    def expression(self, func):
+        """Wrap func, an expression evaluated for an item, to record its statistics"""
+        def profiled_expression(context):
+            self.evaluations += 1
+            start = time.perf_counter()
+            try:
+                return func(context)
+            finally:
+                self.time += time.perf_counter() - start
+        profiled_expression.tree_ql_profile = self
+        return profiled_expression
+
+    def test(self, func):
+        """Wrap func, a node test, to count the items it visits"""
+        def profiled_test(item):
+            self.visited += 1
+            return func(item)
+        return profiled_test
+
+    def walk(self, depth=0):
+        """Generates (depth, step_profile) for this profile and all the steps inside it"""
+        yield depth, self
+        for step in self.steps:
+            yield from step.walk(depth+1)
+
+    def __str__(self):
+        labels = [('  '*depth + str(profile.label), profile) for depth, profile in self.walk()]
+        width = max(len(label) for label, _ in labels)
+        lines = [f'{"step":<{width}} {"evals":>7} {"in":>8} {"out":>8} {"visited":>8} {"time (ms)":>10}']
+        for label, profile in labels:
+            lines.append(f'{label:<{width}} {profile.evaluations:>7} {profile.items_in:>8} {profile.items_out:>8} '
+                         f'{profile.visited:>8} {profile.time*1e3:>10.3f}')
+        return '\n'.join(lines)
+
+    def __repr__(self):
+        return (f'step_profile({self.label!r}, evaluations={self.evaluations}, items_in={self.items_in}, '
+                f'items_out={self.items_out}, visited={self.visited}, time={self.time:.6f}, steps={len(self.steps)})')
+
+    def _count_in(self, working_set):
+        for item in self._timed(working_set, -1):
+            self.items_in += 1
+            yield item
+
+    def _count_out(self, working_set):
+        for item in self._timed(working_set, 1):
+            self.items_out += 1
+            yield item
+
+    def _timed(self, working_set, sign):
+        """Generates the working set, adding (sign=1) or subtracting (sign=-1) the
+        time taken to generate each item"""
+        iterator = iter(working_set)
+        while True:
+            start = time.perf_counter()
+            try:
+                item = next(iterator)
+            except StopIteration:
+                return
+            finally:
+                self.time += sign*(time.perf_counter() - start)
+            yield item
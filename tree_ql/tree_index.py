@@ -0,0 +1,243 @@
+from array import array
+from bisect import bisect_left
+import threading
+
+# Item kinds
+LEAF = 0
+NODE = 1
+# Empty (falsy) items, E.g. None placeholders. They are children, but descendant scans skip them
+EMPTY = 2
+
+_MISSING = object()
+
+class tree_index:
+    """A flattened copy of a tree's structure, in document (pre-)order.
+
+    Item i's subtree is the interval [i, end[i]). Parallel arrays hold each item's
+    kind, interned name id, parent, depth and subtree end, so descendant steps
+    become range scans & name tests become lookups, rather than tree walks. The
+    original items are kept, to map positions back to them.
+
+    The index is built lazily, on first use. It is only valid while the tree is
+    unchanged: build a new one if the tree is modified."""
+
+    def __init__(self, root, tree_node_nameattr, tree_node_childattr):
+        """
+        root is the root node of the tree to index
+        tree_node_nameattr is the name of the attribute that provides the tree node name
+        tree_node_childattr is the name of the attribute that accesses a tree nodes children
+        """
+        self.root = root
+        self._tree_node_nameattr = tree_node_nameattr
+        self._tree_node_childattr = tree_node_childattr
+        self._lock = threading.Lock()
+        self._built = False
+
+    def __len__(self):
+        self._build()
+        return len(self.items)
+
+    def span(self, item):
+        """(position, end): item's document order position & the end of its subtree.
+        Its descendants are at positions position+1 to end-1.
+        Returns None if item isn't part of the indexed tree"""
+        self._build()
+        position = self._positions.get(id(item))
+        if position is None or self.items[position] is not item:
+            return None
+        return position, self.ends[position]
+
+    def named(self, name, start, end):
+        """Items named name with positions in [start, end), in document order"""
+        self._build()
+        name_id = self._name_ids.get(name)
+        if name_id is None:
+            return ()
+        candidates = self._named[name_id]
+        lo = bisect_left(candidates, start)
+        hi = bisect_left(candidates, end, lo)
+        return (self.items[candidates[i]] for i in range(lo, hi))
+
+    def scan(self, start, end, kind=None):
+        """Non-empty items with positions in [start, end), in document order.
+        kind: only items of this kind (LEAF or NODE)"""
+        self._build()
+        if kind is None:
+            if not self._has_empty:
+                return self.items[start:end]
+            kind_filter = lambda i: self.kinds[i]!=EMPTY
+        else:
+            kind_filter = lambda i: self.kinds[i]==kind
+        return (self.items[i] for i in filter(kind_filter, range(start, end)))
+
+    def positions(self, items):
+        """The sorted positions of items. None if any of them isn't part of the indexed tree"""
+        self._build()
+        positions = []
+        for item in items:
+            position = self._positions.get(id(item))
+            if position is None or self.items[position] is not item:
+                return None
+            positions.append(position)
+        return array('i', sorted(positions))
+
+    def join(self, positions, name, or_self=False):
+        """Structural join: the positions of items named name that are descendants
+        (or_self: or self) of the items at positions, which must be sorted.
+
+        A merge of positions with name's positions. Subtree intervals nest, so the
+        stack of open ancestors reduces to the outermost one's end: positions inside
+        it are skipped. The result is sorted & duplicate free, ready for the next join"""
+        self._build()
+        joined = array('i')
+        name_id = self._name_ids.get(name)
+        if name_id is None:
+            return joined
+        candidates = self._named[name_id]
+        ends = self.ends
+        open_end = 0
+        lo = 0
+        for position in positions:
+            if position < open_end:
+                continue
+            open_end = ends[position]
+            lo = bisect_left(candidates, position if or_self else position+1, lo)
+            hi = bisect_left(candidates, open_end, lo)
+            joined.extend(candidates[lo:hi])
+            lo = hi
+        return joined
+
+    def axis(self, items, axis):
+        """Generates the items on axis (parent, ancestor, ancestor-or-self, following,
+        following-sibling, preceding or preceding-sibling) from any of items, in
+        document order, without duplicates. Items that aren't part of the indexed
+        tree have nothing on these axes. Empty items are skipped, as for descendants"""
+        self._build()
+        positions = [position for position, _ in filter(None, map(self.span, items))]
+        if not positions:
+            return
+        parents = self.parents
+        ends = self.ends
+        if axis=='following':
+            found = range(min(ends[position] for position in positions), len(self.items))
+        elif axis=='preceding':
+            # Everything before the last item, except its ancestors
+            last = max(positions)
+            ancestors = set(self._ancestors(parents[last]))
+            found = (position for position in range(last) if position not in ancestors)
+        else:
+            found = set()
+            for position in positions:
+                if axis=='parent':
+                    found.update(self._ancestors(parents[position], 1))
+                elif axis=='ancestor':
+                    found.update(self._ancestors(parents[position], stop=found))
+                elif axis=='ancestor-or-self':
+                    found.update(self._ancestors(position, stop=found))
+                elif parents[position]>=0:
+                    parent = parents[position]
+                    if axis=='following-sibling':
+                        sibling, end = ends[position], ends[parent]
+                    else:
+                        sibling, end = parent+1, position
+                    while sibling<end:
+                        found.add(sibling)
+                        sibling = ends[sibling]
+            found = sorted(found)
+        kinds = self.kinds
+        for position in found:
+            if kinds[position]!=EMPTY:
+                yield self.items[position]
+
+    def _ancestors(self, position, limit=-1, stop=()):
+        """position, then its ancestors: up to limit of them, or until one in stop"""
+        parents = self.parents
+        while position>=0 and limit and position not in stop:
+            yield position
+            position = parents[position]
+            limit -= 1
+
+    def name_of(self, position):
+        """The name of the item at position, or None"""
+        name_id = self.name_ids[position]
+        return None if name_id<0 else self.names[name_id]
+
+    def _build(self):
+        if self._built:
+            return
+        with self._lock:
+            if not self._built:
+                self._build_index()
+                self._built = True
+
+    def _build_index(self):
+        items = []
+        kinds = array('b')
+        name_ids = array('i')
+        parents = array('i')
+        depths = array('i')
+        ends = array('i')
+        positions = {}
+        names = []
+        interned = {}
+        childattr = self._tree_node_childattr
+        nameattr = self._tree_node_nameattr
+
+        def _add(item, parent, depth):
+            position = len(items)
+            items.append(item)
+            parents.append(parent)
+            depths.append(depth)
+            ends.append(position+1)
+            name = getattr(item, nameattr, None) if item else None
+            if name is None:
+                name_ids.append(-1)
+            else:
+                name_id = interned.get(name)
+                if name_id is None:
+                    name_id = interned[name] = len(names)
+                    names.append(name)
+                name_ids.append(name_id)
+            if item:
+                positions[id(item)] = position
+                children = getattr(item, childattr, _MISSING)
+                if children is _MISSING:
+                    children = None
+                    kinds.append(LEAF)
+                else:
+                    kinds.append(NODE)
+            else:
+                children = None
+                kinds.append(EMPTY)
+            return position, children
+
+        # Explicit stack, as trees can be deeper than the recursion limit
+        root_position, root_children = _add(self.root, -1, 0)
+        stack = [(root_position, iter(root_children or ()))]
+        while stack:
+            parent, children = stack[-1]
+            for item in children:
+                position, item_children = _add(item, parent, len(stack))
+                if item_children is not None:
+                    stack.append((position, iter(item_children or ())))
+                    break
+            else:
+                stack.pop()
+                ends[parent] = len(items)
+
+        named = [array('i') for _ in names]
+        for position, name_id in enumerate(name_ids):
+            if name_id>=0:
+                named[name_id].append(position)
+
+        self.items = items
+        self.kinds = kinds
+        self.name_ids = name_ids
+        self.parents = parents
+        self.depths = depths
+        self.ends = ends
+        self.names = names
+        self._name_ids = interned
+        self._named = named
+        self._positions = positions
+        self._has_empty = EMPTY in kinds
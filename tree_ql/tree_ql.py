@@ -1,34 +1,209 @@
 from lark.visitors import Transformer
+from lark.exceptions import VisitError
+import functools
+import heapq
+import math
 import more_itertools
 import operator
 import logging
+import threading
+from lark import Token, Tree
 from .utils import logger
+from .tree_index import LEAF, NODE, tree_index
+from .step_profile import step_profile
 from python_log_indenter import IndentedLoggerAdapter
 
-logger = IndentedLoggerAdapter(logger)
+class _thread_indented_logger(IndentedLoggerAdapter):
+    """An IndentedLoggerAdapter with an indent level per thread, so traced queries
+    executing concurrently don't change each other's indentation"""
+
+    def __init__(self, *args, **kwargs):
+        self._local = threading.local()
+        super().__init__(*args, **kwargs)
+
+    @property
+    def _current_indent(self):
+        return getattr(self._local, 'indent', 0)
+
+    @_current_indent.setter
+    def _current_indent(self, indent):
+        self._local.indent = indent
+
+logger = _thread_indented_logger(logger)
+
+# tree_index item kinds for the kind tests
+_INDEX_KINDS = {'leaf': LEAF, 'node': NODE}
+# A node test any item passes
+_ANY_NODE = Token('WILDCARD', '*')
+# Sorts union results that aren't in the index after the others
+_UNINDEXED = math.inf
 
 class query_context:
-    def __init__(self, root, working_set):
+    def __init__(self, root, working_set, index=None, grammar=None, memo=None, variables=None):
+        """index: an optional tree_index for the tree containing root
+        grammar: an optional rule_reachability for the grammar the tree was parsed with
+        memo: results memoized for this execution of the query
+        variables: the values of the query's variables ($name), by name"""
         self.root = root
         self.working_set = working_set
+        self.index = index
+        self.grammar = grammar
+        self.memo = {} if memo is None else memo
+        self.variables = {} if variables is None else variables
+
+    def derive(self, working_set):
+        """A new context for the same tree & execution"""
+        return query_context(self.root, working_set, self.index, self.grammar, self.memo, self.variables)
 
     def update_working_set(self, new_set):
-        self.working_set = list(new_set)
+        """new_set can be any iterable, including a generator. Steps chain lazily, so 
+        the tree is only walked as results are pulled from the final working set"""
+        self.working_set = new_set
         return self
 
     def __bool__(self):
-        """For predicates - anything in the workinf set implies True"""
+        """For predicates - anything in the working set implies True.
+        Only the first item is generated, so existence tests stop at the first match"""
+        self.working_set = more_itertools.peekable(self.working_set)
         return True if self.working_set else False
 
-class _inline_transformer(Transformer):
-    
-    def __init__(self, tree_node_nameattr, tree_node_childattr):
-        """
-        tree_node_nameattr is the name of the attribute that provides the tree node name
-        tree_node_childattr is the name of the attribute that accesses a tree nodes children
-        """
-        self._tree_node_nameattr = tree_node_nameattr
-        self._tree_node_childattr = tree_node_childattr
+def to_result(working_set):
+    """Convert a final working set to a query result: None, a single item or a list"""
+    result = list(working_set)
+    if result:
+        if len(result)==1:
+            return result[0]
+        return result 
+    return None
+
+_MISSING = object()
+
+def _nth(working_set, index):
+    # A generator, so the working set isn't consumed until the result is needed
+    item = more_itertools.nth(working_set, index, _MISSING)
+    if item is not _MISSING:
+        yield item
+
+def _exists(working_set):
+    """True if the working set has any items. Only the first item is generated"""
+    return next(iter(working_set), _MISSING) is not _MISSING
+
+def _as_number(value):
+    """A value as a number (E.g. a token's text), or None if it isn't one"""
+    if value.__class__ in (int, float):
+        return value
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+def _numbers(items):
+    """The items that are numbers, as numbers. Others (E.g. names, nodes) are skipped"""
+    return (value for value in map(_as_number, items) if value is not None)
+
+def _optional(value):
+    """The items of a value: none, for a missing value"""
+    return () if value is None else (value,)
+
+# Aggregate functions: each reduces the items of its argument, as they are generated
+_AGGREGATES = {
+    'count': more_itertools.ilen,
+    'sum': lambda items: sum(_numbers(items)),
+    'min': lambda items: min(_numbers(items), default=None),
+    'max': lambda items: max(_numbers(items), default=None),
+    'boolean': _exists,
+    'exists': _exists,
+}
+
+def _arithmetic(op):
+    """op applied to its operands as numbers. None if either isn't a number, 
+    or there's no result (E.g. division by zero)"""
+    def apply(lhs, rhs):
+        lhs, rhs = _as_number(lhs), _as_number(rhs)
+        if lhs is None or rhs is None:
+            return None
+        try:
+            return op(lhs, rhs)
+        except ZeroDivisionError:
+            return None
+    return apply
+
+def _comparison(op):
+    """op comparing its operands as numbers. False if either isn't a number"""
+    def compare(lhs, rhs):
+        lhs, rhs = _as_number(lhs), _as_number(rhs)
+        return lhs is not None and rhs is not None and op(lhs, rhs)
+    return compare
+
+def _negate(value):
+    value = _as_number(value)
+    return None if value is None else -value
+
+# Relational & arithmetic operators, by the operator their token is converted to
+_NUMERIC_OPERATORS = {
+    **{op: _comparison(op) for op in (operator.lt, operator.gt, operator.le, operator.ge)},
+    **{op: _arithmetic(op) for op in (operator.add, operator.sub, operator.mul, operator.truediv, operator.mod)},
+}
+
+def index_working_set(working_set, index):
+    """The working set item at index, lazily. Negative indices count from the end.
+    Empty if there is no such item"""
+    return _nth(working_set, index) if index>=0 else more_itertools.islice_extended(working_set)[index:index+1 or None]
+
+def _root_index(context, nameattr, childattr):
+    """An index covering the context's root: the context's own, unless it has none or
+    it is an index of another tree. A new one replaces it in the context"""
+    index = context.index
+    if index is None or index.span(context.root) is None:
+        index = context.index = tree_index(context.root, nameattr, childattr)
+    return index
+
+def _has_descendant_match(context, key, item, matches, lookup, childattr):
+    """True if item has a descendant for which matches(node) is true.
+
+    Results are memoized under key for the rest of the execution, by node id. A scan
+    records every subtree it finishes without a match, and stops at the first match,
+    recording the nodes it is inside. Later items skip recorded subtrees, so nested
+    items (E.g. //funcdef[.//yield_expr]) don't rescan them.
+    lookup(index, start, end) returns the candidate nodes at positions in [start, end)
+    of a tree_index. It's used if the context has an index containing item"""
+    memo = context.memo.get(key)
+    if memo is None:
+        memo = context.memo[key] = {}
+    known = memo.get(id(item))
+    if known is not None:
+        return known
+
+    span = context.index.span(item) if context.index is not None else None
+    if span is not None:
+        found = memo[id(item)] = any(map(matches, lookup(context.index, span[0]+1, span[1])))
+        return found
+
+    children = getattr(item, childattr, None)
+    if children is None:
+        memo[id(item)] = False
+        return False
+    # (id, child iterator) of the nodes the scan is inside
+    stack = [(id(item), iter(children))]
+    while stack:
+        for node in stack[-1][1]:
+            if not node:
+                continue
+            if matches(node) or memo.get(id(node)):
+                for node_id, _ in stack:
+                    memo[node_id] = True
+                return True
+            node_children = getattr(node, childattr, None)
+            if node_children is not None and id(node) not in memo:
+                stack.append((id(node), iter(node_children)))
+                break
+        else:
+            memo[stack.pop()[0]] = False
+    return False
+
+class _terminal_transformer(Transformer):
+    """Converts terminals in the query plan to their Python values. 
+    Base for the transformers that compile the plan"""
 
     # Converts or adjusts terminals
 #region terminal_processing
@@ -60,29 +235,61 @@ class _inline_transformer(Transformer):
         return token.update(value=operator.truediv)       
     def MOD_OP(self, token):
         return token.update(value=operator.mod)       
+    def BOOLEAN_LITERAL(self, token):
+        return token.update(value=token.value=='true')
     def INDEX_PREDICATE_TAG(self, token):
         return token.update(value=int(token.value.lstrip('[').rstrip(']')))
 
 #endregion
 
+    @staticmethod
+    def _slice_args(children):
+        """(start, stop, step) from a slice_expr's children"""
+        def _get_first_int(children):
+            if children and children[0].type=='INTEGER_LITERAL':
+                return children[0].value
+            return None
+
+        start = _get_first_int(children)
+        children = children[(2 if start is not None else 1):]
+        stop = _get_first_int(children)
+        children = children[(2 if stop is not None else 1):]
+        step = _get_first_int(children)
+        return start, stop, step
+
+class _inline_transformer(_terminal_transformer):
+    
+    def __init__(self, tree_node_nameattr, tree_node_childattr, trace=False, profile=False):
+        """
+        tree_node_nameattr is the name of the attribute that provides the tree node name
+        tree_node_childattr is the name of the attribute that accesses a tree nodes children
+        trace: if True, wrap each compiled step so it logs as it executes. If False,
+        no tracing wrappers are generated at all
+        profile: if True, wrap each compiled step to record its execution statistics in a
+        step_profile. The compiled query's tree_ql_profiles are the top level step_profiles.
+        Each compile creates new step_profiles, so compile a query for each profiled execution
+        """
+        self._tree_node_nameattr = tree_node_nameattr
+        self._tree_node_childattr = tree_node_childattr
+        self._trace = trace and not profile
+        self._profile = profile
+        # While profiling: the step_profiles created by the rule being transformed, and
+        # one created by _fused_test, for the step being compiled
+        self._profiles = []
+        self._pending_profile = None
+
     # 'Compiles' the query
 #region rule_processing
 
     def start(self, children):
-        def _to_result(context):
-            result = list(context.working_set)
-            if result:
-                if len(result)==1:
-                    return result[0]
-                return result 
-            return None
-
-        return lambda context: _to_result(children[0](context))
+        """The compiled query: maps a context to the final context. Nothing is evaluated
+        until the final working set is iterated"""
+        return children[0]
 
     def absolutelocation_path(self, children):
         """Reset to use the root of the tree"""
         remaining_terms = self.__class__._chain_functions(children)
-        func = lambda context: remaining_terms(query_context(context.root, [context.root]))
+        func = lambda context: remaining_terms(context.derive([context.root]))
         return self._log_wrapper(func, 'absolutelocation_path')
 
     def relativelocation_path(self, children):
@@ -93,19 +300,13 @@ class _inline_transformer(Transformer):
     def child_step(self, children):
         """Navigate one level down the tree I.e. "\". 
         We need to apply the default axes (child) if not explicitly set"""
-        def _step(context):
-            context = self._apply_axis_specifier(context, children[0], self.child_axis_specifier([]))
-            return self.__class__._chain_functions(children[1:])(context)
-            
+        _step = self.__class__._chain_functions(self._resolve_axis_specifier(children, self.child_axis_specifier([])))
         return self._log_wrapper(self._log_indent_wrapper(_step), 'child_step')
 
     def descendent_step(self, children):
         """Navigate to all items in the tree starting at from teh workign set I.e."\\"
         We need to apply the default axes (descendant) if not explicitly set"""
-        def _descendent_step(context):
-            context = self._apply_axis_specifier(context, children[0], self.descendant_axis_specifier([]))
-            return self.__class__._chain_functions(children[1:])(context)            
-            
+        _descendent_step = self.__class__._chain_functions(self._resolve_axis_specifier(children, self.descendant_axis_specifier([])))
         return self._log_wrapper(self._log_indent_wrapper(_descendent_step), 'descendent_step')
 
     def default_axis_specifier(self, children):
@@ -125,7 +326,7 @@ class _inline_transformer(Transformer):
 
     def descendant_axis_specifier(self, children):
         """Swap the working set for all descendants of the working set"""
-        func = lambda context: context.update_working_set(self._all_nodes(self._to_children(context.working_set)))
+        func = lambda context: context.update_working_set(self._all_nodes(context.working_set, or_self=False))
         return self._log_wrapper(func, 'descendant::')             
 
     def self_axis_specifier(self, children):
@@ -133,9 +334,37 @@ class _inline_transformer(Transformer):
         func = lambda context: context
         return self._log_wrapper(func, 'self::') 
 
+    def parent_axis_specifier(self, children):
+        """Swap the working set for the parents of the working set"""
+        return self._log_wrapper(self._index_axis('parent'), 'parent::')
+
+    def ancestor_axis_specifier(self, children):
+        """Swap the working set for all ancestors of the working set"""
+        return self._log_wrapper(self._index_axis('ancestor'), 'ancestor::')
+
+    def ancestor_or_self(self, children):
+        """Add all ancestors of the working set to it"""
+        return self._log_wrapper(self._index_axis('ancestor-or-self'), 'ancestor-or-self::')
+
+    def following_axis_specifier(self, children):
+        """Swap the working set for everything after it in the tree, except descendants"""
+        return self._log_wrapper(self._index_axis('following'), 'following::')
+
+    def following_sibling(self, children):
+        """Swap the working set for the later siblings of the working set"""
+        return self._log_wrapper(self._index_axis('following-sibling'), 'following-sibling::')
+
+    def preceding_axis_specifier(self, children):
+        """Swap the working set for everything before it in the tree, except ancestors"""
+        return self._log_wrapper(self._index_axis('preceding'), 'preceding::')
+
+    def preceding_sibling(self, children):
+        """Swap the working set for the earlier siblings of the working set"""
+        return self._log_wrapper(self._index_axis('preceding-sibling'), 'preceding-sibling::')
+
     def descendant_or_self(self, children):
         """Add all descendants of the working set to it"""
-        func = lambda context: context.update_working_set(self._all_nodes(context.working_set))
+        func = lambda context: context.update_working_set(self._all_nodes(context.working_set, or_self=True))
         return self._log_wrapper(func, 'descendant-or-self::') 
 
     def attribute_step(self, children):
@@ -145,39 +374,139 @@ class _inline_transformer(Transformer):
 
     def slice_expr(self, children):
         """Python slice of the working set"""
-        def _get_first_int(children):
-            if children and children[0].type=='INTEGER_LITERAL':
-                return children[0].value
-            return None
-
-        start = _get_first_int(children)
-        children = children[(2 if start else 1):]
-        stop = _get_first_int(children)
-        children = children[(2 if stop else 1):]
-        step = _get_first_int(children)
-
+        start, stop, step = self._slice_args(children)
         func = lambda context: context.update_working_set(more_itertools.islice_extended(context.working_set, start, stop, step))
         return self._log_wrapper(func, f'slice[{start}:{stop}:{step}]]') 
 
     def predicate_expr(self, children):
         """A non-slice predicate. I.e [some expression]
-        This will filter items in the working set"""
+        This will filter items in the working set. A path expression is true if it
+        matches anything: evaluation stops at the first matching node"""
 
         def _item_context(current_context, item):
             """For the recrsive grammar to work, we need a new working set containing
             just the item being tested."""
-            return query_context(current_context.root, [item])
+            return current_context.derive([item])
 
         expr = self._log_indent_wrapper(self.__class__._chain_functions(children))
         func = lambda context:context.update_working_set(item for item in context.working_set if expr(_item_context(context, item)))
         return self._log_wrapper(func, 'predicate_expr')
 
+    def descendant_exists(self, children):
+        """A predicate testing for a matching descendant (E.g. [.//yield_expr]), fused by
+        the optimizer from a single descendant step. Results are memoized per node for
+        the execution, so nested items don't rescan the same subtrees: nested tests
+        (//classdef[.//funcdef[.//raise_stmt]]) take about linear, rather than quadratic, time"""
+        axis, node_test, attribute_tests = children[0].value, children[1], children[2]
+        test = self._fused_test(node_test, attribute_tests) or (lambda node: True)
+        if len(children)>3:
+            predicates = self.__class__._chain_functions(children[3:])
+            matches = lambda context, node: test(node) and bool(predicates(context.derive([node])))
+        else:
+            matches = lambda context, node: test(node)
+        lookup = self._index_lookup(node_test)
+        or_self = axis=='descendant-or-self'
+        key = object()
+
+        def _filter(context, working_set):
+            item_matches = functools.partial(matches, context)
+            childattr = self._tree_node_childattr
+            for item in working_set:
+                if (or_self and item_matches(item)) or _has_descendant_match(context, key, item, item_matches, lookup, childattr):
+                    yield item
+
+        func = lambda context: context.update_working_set(_filter(context, context.working_set))
+        return self._log_wrapper(func, f'exists({axis}::{node_test.value})')
+
     def index_predicate(self, children):
         """ [<int>] """
         index = children[0].value
-        func = lambda context: context.update_working_set([more_itertools.nth(context.working_set, index)] if index>=0 else more_itertools.islice_extended(context.working_set)[index:])
+        func = lambda context: context.update_working_set(index_working_set(context.working_set, index))
         return self._log_wrapper(func, f'index[{index}]') 
 
+    def fused_step(self, children):
+        """A step's axis, node test and simple attribute tests, fused by the 
+        optimizer into a single filtered traversal"""
+        axis, node_test, attribute_tests = children[0].value, children[1], children[2]
+        test = self._fused_test(node_test, attribute_tests)
+        # Index lookups find the items matching the node test: then apply the attribute tests
+        index_test = self._fused_test(_ANY_NODE, attribute_tests) if axis in ('descendant', 'descendant-or-self') else None
+        func = self._traversal(axis, node_test, test, index_test)
+
+        tests = ''.join(f'[@{attribute} {op.__name__} {value!r}]' for attribute, op, value in attribute_tests)
+        func = self._log_wrapper(func, f'{axis}::{node_test.value}{tests}')
+        return self.__class__._chain_functions([func] + children[3:])
+
+    def union_step(self, children):
+        """Steps on the same axis, without predicates, fused by the optimizer from a
+        union (E.g. //funcdef | //classdef): a single traversal testing for any of the
+        steps. So the results are in document order, without duplicates"""
+        axis = children[0].value
+        steps = list(zip(children[1::2], children[2::2]))
+        tests = [self._combined_test(node_test, attribute_tests) or (lambda item: True) for node_test, attribute_tests in steps]
+        test = self._counted_test(lambda item: any(step_test(item) for step_test in tests))
+        func = self._traversal(axis, _ANY_NODE, test, test)
+        return self._log_wrapper(func, f'{axis}::(' + ' | '.join(node_test.value for node_test, _ in steps) + ')')
+
+    def structural_join(self, children):
+        """Consecutive descendant name steps, fused by the optimizer. Given an index,
+        each step is a structural join of positions: the intermediate items are never
+        generated. Otherwise, the steps are scanned as usual"""
+        steps = list(zip(children[::2], children[1::2]))
+        fallback = self.__class__._chain_functions([self.fused_step([axis, name_test, []]) for axis, name_test in steps])
+        joins = [(name_test.value, axis.value=='descendant-or-self') for axis, name_test in steps]
+
+        def _joined(context, working_set):
+            index = context.index
+            working_set = list(working_set)
+            positions = index.positions(working_set)
+            if positions is None:
+                # Not all in the index
+                yield from fallback(context.derive(working_set)).working_set
+                return
+            for name, or_self in joins:
+                positions = index.join(positions, name, or_self)
+            yield from map(index.items.__getitem__, positions)
+
+        def func(context):
+            if context.index is None:
+                return fallback(context)
+            return context.update_working_set(_joined(context, context.working_set))
+        return self._log_wrapper(func, 'join::' + '//'.join(f'{axis}::{name_test}' for axis, name_test in steps))
+
+    def union_expr(self, children):
+        """Union of paths: a | b. Results are merged in document order, without duplicates.
+        Each branch generates its results in document order, so they are merged by
+        their tree_index positions as they are generated: no branch is generated ahead
+        of the others. An index is created for the context, if it doesn't have one, 
+        or for the merge, if the context's index doesn't cover the tree.
+        Results that aren't in the index (E.g. attribute values) follow the others"""
+        def _merged(context, working_set):
+            index = _root_index(context, self._tree_node_nameattr, self._tree_node_childattr)
+            working_set = list(working_set)
+
+            def _positioned(results):
+                for item in results:
+                    span = index.span(item)
+                    yield (_UNINDEXED if span is None else span[0]), item
+
+            branches = [_positioned(branch(context.derive(working_set)).working_set) for branch in children]
+            last = None
+            for position, item in heapq.merge(*branches, key=operator.itemgetter(0)):
+                if position!=last or position==_UNINDEXED:
+                    yield item
+                last = position
+
+        func = lambda context: context.update_working_set(_merged(context, context.working_set))
+        return self._log_wrapper(func, 'union')
+
+    def fused_filter(self, children):
+        return children
+
+    def fused_attribute_test(self, children):
+        """(attribute name, operator, literal value)"""
+        return (children[0].value, children[1].value, children[2].value)
+
     def tname_test(self, children):
         """Test node (not leafs) names in the working set"""
         compare_name = children[0].value
@@ -202,80 +531,261 @@ class _inline_transformer(Transformer):
 
     def equality_expr(self, children):
         """Execute an (in)equality expression"""
-        func = lambda context: children[1].value(children[0](context.working_set[0]), children[2](context.working_set[0]))
-        return self._log_wrapper(self._log_indent_wrapper(func), f'equality_expr: {children[1].value.__name__}')
+        lhs, op, rhs = self._own_context(children[0]), children[1].value, self._own_context(children[2])
+        func = lambda context: op(lhs(context), rhs(context))
+        return self._log_wrapper(self._log_indent_wrapper(func), f'equality_expr: {children[1].value.__name__}', 'expression')
+
+    def relational_expr(self, children):
+        """Compare 2 values as numbers. E.g. @line > 100"""
+        lhs, op, rhs = self._own_context(children[0]), children[1], self._own_context(children[2])
+        compare = _NUMERIC_OPERATORS[op.value]
+        func = lambda context: compare(lhs(context), rhs(context))
+        return self._log_wrapper(self._log_indent_wrapper(func), f'relational_expr: {op.value.__name__}', 'expression')
+
+    def additive_expr(self, children):
+        """Add or subtract 2 values as numbers. None if either isn't a number"""
+        return self._arithmetic_expr(children)
+
+    def multiply_expr(self, children):
+        """Multiply, divide (div) or take the modulus (mod) of 2 values as numbers.
+        None if either isn't a number, or for division by zero"""
+        return self._arithmetic_expr(children)
+
+    def unary_expr(self, children):
+        """Negate a value. E.g. -@line"""
+        operand = self._own_context(children[0])
+        func = lambda context: _negate(operand(context))
+        return self._log_wrapper(func, 'negate', 'value')
+
+    def parenthesized_expr(self, children):
+        """Parentheses only group: the expression inside them"""
+        return children[0]
+
+    def _arithmetic_expr(self, children):
+        lhs, op, rhs = self._own_context(children[0]), children[1], self._own_context(children[2])
+        apply = _NUMERIC_OPERATORS[op.value]
+        func = lambda context: apply(lhs(context), rhs(context))
+        return self._log_wrapper(func, op.value.__name__, 'value')
 
     def or_expr(self, children):
         """Boolean or"""
-        lhs_func = self._log_indent_wrapper(children[0])
-        rhs_func = self._log_indent_wrapper(children[1])
+        lhs_func = self._log_indent_wrapper(self._own_context(children[0]))
+        rhs_func = self._log_indent_wrapper(self._own_context(children[1]))
         func = lambda context: lhs_func(context) or rhs_func(context)
-        return self._log_wrapper(func, 'or_expr')
+        return self._log_wrapper(func, 'or_expr', 'expression')
 
     def and_expr(self, children):
         """Boolean and"""
-        lhs_func = self._log_indent_wrapper(children[0])
-        rhs_func = self._log_indent_wrapper(children[1])
+        lhs_func = self._log_indent_wrapper(self._own_context(children[0]))
+        rhs_func = self._log_indent_wrapper(self._own_context(children[1]))
         func = lambda context: lhs_func(context) and rhs_func(context)
-        return self._log_wrapper(func, 'and_expr')
+        return self._log_wrapper(func, 'and_expr', 'expression')
 
     def attribute_accessor(self, children):
         """Get an attribute value as part of an expression"""
-        func = lambda item: getattr(item, children[0].value, None)
-        return self._log_wrapper(func, f'@{children[0].value}')
+        func = lambda context: getattr(context.working_set[0], children[0].value, None)
+        return self._log_wrapper(func, f'@{children[0].value}', 'value')
 
     def string_literal(self, children):
-        func = lambda item: children[0].value
-        return self._log_wrapper(func, children[0].value)
+        func = lambda context: children[0].value
+        return self._log_wrapper(func, children[0].value, 'value')
 
     def integer_literal(self, children):
-        func = lambda item: children[0].value
-        return self._log_wrapper(func, children[0].value)
+        func = lambda context: children[0].value
+        return self._log_wrapper(func, str(children[0].value), 'value')
 
     def decimal_literal(self, children):
-        func = lambda item: children[0].value
-        return self._log_wrapper(func, children[0].value)
+        func = lambda context: children[0].value
+        return self._log_wrapper(func, str(children[0].value), 'value')
+
+    def boolean_literal(self, children):
+        """A constant boolean, folded by the optimizer. E.g. from 1 < 2"""
+        func = lambda context: children[0].value
+        return self._log_wrapper(func, str(children[0].value), 'value')
+
+    def functioncall(self, children):
+        """An aggregate function of a path or value. E.g. count(.//return_stmt).
+        A streaming reduction: the path's items are reduced as they are generated,
+        never collected. A value's items are the value, or none if it is missing (None)"""
+        name = children[0].value
+        args = children[1] if len(children)>1 and isinstance(children[1], list) else [child for child in children[1:] if child is not None]
+        aggregate = _AGGREGATES.get(name)
+        if aggregate is None:
+            raise ValueError(f'Unknown function: {name}()')
+        if len(args)!=1:
+            raise ValueError(f'{name}() takes 1 argument, not {len(args)}')
+        arg = args[0]
+
+        def func(context):
+            # A new context, as steps update the context they are given
+            result = arg(context.derive(context.working_set))
+            return aggregate(result.working_set if isinstance(result, query_context) else _optional(result))
+        return self._log_wrapper(func, f'{name}()', 'value')
+
+    def functioncall_list(self, children):
+        """A function's arguments, as a list"""
+        return (children[0] if isinstance(children[0], list) else children[:1]) + children[1:]
+
+    def varref(self, children):
+        """A variable's value, bound when the query is executed. I.e. $name"""
+        name = children[0].value
+        func = lambda context: context.variables[name]
+        return self._log_wrapper(func, f'${name}', 'value')
 
 #endregion
 
 #region Support methods
     
+    def _index_axis(self, axis):
+        """Navigate an axis that needs the parent & position map in a tree_index.
+        One is created for the context's root, if the context doesn't have one covering it"""
+        def func(context):
+            index = _root_index(context, self._tree_node_nameattr, self._tree_node_childattr)
+            return context.update_working_set(index.axis(context.working_set, axis))
+        return func
+
+    def _traversal(self, axis, node_test, test, index_test):
+        """A function navigating axis, keeping the items test(item) is true for (all, if
+        test is None). Given an index, descendant axes look up the items matching
+        node_test, then keep those index_test(item) is true for"""
+        if axis in INDEX_AXES:
+            navigate = self._index_axis(axis)
+            return (lambda context: navigate(context).update_working_set(filter(test, context.working_set))) if test else navigate
+        if axis=='child':
+            scan = (lambda working_set: filter(test, self._to_children(working_set))) if test else self._to_children
+        elif axis=='self':
+            scan = (lambda working_set: filter(test, working_set)) if test else (lambda working_set: working_set)
+        else:
+            truthy_test = (lambda item: item and test(item)) if test else (lambda item: item)
+            or_self = axis=='descendant-or-self'
+            scan = lambda working_set, pruned=None: self._scan_nodes(working_set, truthy_test, or_self, pruned)
+            # Subtrees the grammar says can't contain a match are skipped
+            pruned = (lambda context: context.grammar.pruned(node_test.value) if context.grammar else None
+                      ) if node_test.type=='NAME_TEST' else (lambda context: None)
+
+            # Can be answered from an index, if there is one
+            def func(context):
+                if context.index is None:
+                    return context.update_working_set(scan(context.working_set, pruned(context)))
+                return context.update_working_set(self._indexed_scan(context.index, context.working_set, node_test, or_self, index_test, scan))
+            return func
+        return lambda context: context.update_working_set(scan(context.working_set))
+
     def _is_node(self, item):
         return hasattr(item, self._tree_node_childattr)
 
-    def _all_nodes(self, context):
-        return self._scan_nodes(context, lambda c : c)
-
-    def _scan_nodes(self, context, pred):
-        """Return all values in the tree that evaluate pred(value) as true."""
-        for item in context:
-            if pred(item):
-                yield item
-            yield from self._scan_nodes(self._to_children([item]), pred)   
+    def _all_nodes(self, working_set, or_self):
+        return self._scan_nodes(working_set, lambda c : c, or_self)
+
+    def _scan_nodes(self, working_set, pred, or_self, pruned=None):
+        """Return all descendants of the working set (or_self: and the working set 
+        items themselves) that evaluate pred(value) as true.
+        pruned: optional set of node names whose subtrees aren't scanned
+
+        Results are in document order, without duplicates, if the working set is. 
+        A working set item that was visited as a descendant of an earlier item is 
+        skipped: its subtree has already been scanned. 
+        Uses an explicit stack of child iterators, so tree depth costs neither
+        recursion nor nested generator frames"""
+        childattr = self._tree_node_childattr
+        nameattr = self._tree_node_nameattr
+        visited = set()
+        items = more_itertools.peekable(working_set)
+        for item in items:
+            if id(item) in visited:
+                continue
+            if or_self:
+                stack = [iter((item,))]
+            elif self._is_node(item) and not (pruned and getattr(item, nameattr, None) in pruned):
+                visited.add(id(item))
+                stack = [iter(getattr(item, childattr))]
+            else:
+                continue
+
+            # Visited nodes only need recording if there are more items to scan
+            record = visited.add if items else lambda _: None
+            while stack:
+                for node in stack[-1]:
+                    if pred(node):
+                        yield node
+                    children = getattr(node, childattr, None)
+                    if children is not None and not (pruned and getattr(node, nameattr, None) in pruned):
+                        record(id(node))
+                        stack.append(iter(children))
+                        break
+                    if or_self:
+                        # Leaves too: a later working set item would emit itself
+                        record(id(node))
+                else:
+                    stack.pop()
 
     def _to_children(self, working_set):
         return more_itertools.collapse((getattr(item, self._tree_node_childattr) for item in working_set if self._is_node(item)))
 
     def _log_indent_wrapper(self, func):
+        if not self._trace:
+            return func
+
         def indent_func_wrapper(*args, **kwargs):
             logger.add()
-            result = func(*args, **kwargs)
-            logger.sub()
-            return result
+            try:
+                return func(*args, **kwargs)
+            finally:
+                logger.sub()
 
         return indent_func_wrapper
 
-    def _log_wrapper(self, func, msg):
-        def func_wrapper(*args, **kwargs):
-            logger.debug(msg)
-            return func(*args, **kwargs)
+    def _log_wrapper(self, func, msg, kind='step'):
+        """kind: 'step' for functions mapping a context to a context, 'expression' for
+        expressions evaluated for an item's context or 'value' for an item's values"""
+        if self._profile:
+            f = self._profile_wrapper(func, msg, kind)
+        elif not self._trace or hasattr(func, 'tree_ql_tag'):
+            f = func
+        else:
+            def func_wrapper(*args, **kwargs):
+                logger.debug(msg)
+                return func(*args, **kwargs)
+            f = func_wrapper
+            f.tree_ql_tag = msg
+        if kind!='step':
+            # Doesn't update the context it's given
+            f.tree_ql_pure = True
+        return f
 
-        if hasattr(func, 'tree_ql_tag'):
+    @staticmethod
+    def _own_context(func):
+        """An expression's operand, evaluated with its own context: steps (E.g. a path
+        operand) update the context they are given, which the other operand also uses"""
+        if getattr(func, 'tree_ql_pure', False):
             return func
+        return lambda context: func(context.derive(context.working_set))
 
-        f = func_wrapper
-        f.tree_ql_tag = msg
-        return f
+    def _profile_wrapper(self, func, label, kind):
+        if kind=='value':
+            return func
+        profile = self._pending_profile or step_profile()
+        self._pending_profile = None
+        profile.label = label
+        self._profiles.append(profile)
+        return profile.step(func) if kind=='step' else profile.expression(func)
+
+    def _call_userfunc(self, tree, new_children=None):
+        """While profiling, nest the profiles of the rule's children in the last profile
+        the rule created (its outermost function), with any others it created"""
+        if not self._profile:
+            return super()._call_userfunc(tree, new_children)
+        children = new_children if new_children is not None else tree.children
+        child_profiles = [profile for child in children for profile in getattr(child, 'tree_ql_profiles', ())]
+        self._profiles = []
+        result = super()._call_userfunc(tree, new_children)
+        profiles = child_profiles
+        if self._profiles:
+            profiles = [self._profiles[-1]]
+            profiles[0].steps = self._profiles[:-1] + child_profiles
+        if callable(result) and not hasattr(result, '__self__'):
+            result.tree_ql_profiles = profiles
+        return result
 
     @staticmethod
     def _chain_functions(children):
@@ -289,24 +799,219 @@ class _inline_transformer(Transformer):
         else:
             return _chain_functions_inner
 
-    def _apply_axis_specifier(self, context, specifier, default):
+    def _resolve_axis_specifier(self, children, default):
+        """Resolve the axis specifier at the start of a step's children, returning the 
+        step's functions"""
+        specifier = children[0]
         if specifier==self.default_axis_specifier:
-            return default(context)
+            return [default] + children[1:]
         elif specifier==self.null_axis_specifier:
-            return context
+            return children[1:]
+        return children
+
+    def _fused_test(self, node_test, attribute_tests):
+        """A single function testing an item against a fused_step's node test and
+        attribute tests. None if there is nothing to test"""
+        return self._counted_test(self._combined_test(node_test, attribute_tests))
+
+    def _counted_test(self, test):
+        """While profiling, test counts the items it's applied to, for the profile of
+        the step being compiled (then there is always a test)"""
+        if not self._profile:
+            return test
+        self._pending_profile = self._pending_profile or step_profile()
+        return self._pending_profile.test(test or (lambda item: True))
+
+    def _combined_test(self, node_test, attribute_tests):
+        tests = []
+        if node_test.type=='NAME_TEST':
+            name = node_test.value
+            tests.append(lambda item: getattr(item, self._tree_node_nameattr, None)==name)
+        elif node_test.value=='leaf':
+            tests.append(lambda item: not self._is_node(item))
+        elif node_test.value=='node':
+            tests.append(self._is_node)
+        for attribute, op, value in attribute_tests:
+            tests.append(lambda item, attribute=attribute, op=op, value=value: op(getattr(item, attribute, None), value))
+        return functools.reduce(lambda lhs, rhs: lambda item: lhs(item) and rhs(item), tests) if tests else None
+
+    def _index_lookup(self, node_test):
+        """A function: (tree_index, start, end) -> the indexed items in [start, end)
+        that may match node_test"""
+        if node_test.type=='NAME_TEST':
+            return lambda index, start, end: index.named(node_test.value, start, end)
+        return lambda index, start, end: index.scan(start, end, _INDEX_KINDS.get(node_test.value))
+
+    def _indexed_scan(self, index, working_set, node_test, or_self, attribute_test, scan):
+        """Look up descendants of the working set matching node_test in the index: 
+        a range scan of each item's subtree interval. As _scan_nodes, items inside 
+        an earlier item's subtree are skipped"""
+        if node_test.type=='NAME_TEST':
+            lookup = functools.partial(index.named, node_test.value)
         else:
-            return specifier(context)
+            lookup = functools.partial(index.scan, kind=_INDEX_KINDS.get(node_test.value))
+        covered = 0
+        for item in working_set:
+            span = index.span(item)
+            if span is None:
+                # Not in the index - fall back to scanning
+                yield from scan([item])
+                continue
+            start, end = span
+            if start < covered:
+                continue
+            covered = end
+            found = lookup(start if or_self else start+1, end)
+            yield from filter(attribute_test, found) if attribute_test else found
 #endregion
 
 from pathlib import Path
+import hashlib
+import lark
 from lark import Lark
+from .optimizer import INDEX_AXES, needs_index, optimize_query
+from .codegen import _codegen_transformer, unsupported_query
 
 _GRAMMAR = Path(__file__).parent / 'tree_ql.lark'
-_GRAMMAR_CACHE = _GRAMMAR.with_suffix('.lark.cache')
+_PARSER_OPTIONS = dict(parser = 'lalr', maybe_placeholders=True)
+# Generated by build_parser
+_PRECOMPILED_PARSER = Path(__file__).parent / '_query_grammar.py'
+
+# The query grammar's parser, shared by all compilers. Loaded on first use by _query_parser
+_parser = None
+# Guards loading the parser & parsing with it
+_parser_lock = threading.RLock()
+
+def _query_parser():
+    global _parser
+    if _parser is None:
+        with _parser_lock:
+            if _parser is None:
+                _parser = _load_parser()
+    return _parser
+
+def _load_parser():
+    """The precompiled parser, if it was generated from this grammar by this Lark version.
+    Otherwise, the parser is built from the grammar (slow)"""
+    try:
+        from . import _query_grammar
+    except ImportError:
+        _query_grammar = None
+    if _query_grammar is not None and _query_grammar.LARK_VERSION==lark.__version__ and _query_grammar.GRAMMAR_HASH==_grammar_hash():
+        return Lark._load_from_dict(_query_grammar.DATA, _query_grammar.MEMO)
+    logger.warning(f'{_PRECOMPILED_PARSER.name} is missing or out of date: building the query parser. Run "python -m tree_ql.build_parser" to regenerate it')
+    return Lark.open(_GRAMMAR, **_PARSER_OPTIONS)
+
+def _grammar_hash():
+    """Identifies the version of the grammar a parser was generated from"""
+    return hashlib.sha256(_GRAMMAR.read_bytes()).hexdigest()
+
+class _query_compiler:
+    """Compiles queries in 3 passes: parse to a query plan, optimize the plan, 
+    then transform the plan into a chain of functions (the 'closure' backend) or
+    generated Python code (the 'codegen' backend).
+
+    All compilers share one parser for the query grammar, loaded on the first compile.
+    The transformers keep state while compiling, so compiles are serialized by a lock:
+    a compiler can be shared between threads. Compiled queries keep their state in
+    the query_context, so can be executed by many threads at once"""
+
+    def __init__(self, transformer, codegen):
+        self._transformer = transformer
+        self._codegen = codegen
+        self._lock = threading.RLock()
+
+    def plan(self, query_str, optimize=True):
+        """The (optimized) query plan: the query's parse tree"""
+        parser = _query_parser()
+        with _parser_lock:
+            plan = parser.parse(query_str)
+        return optimize_query(plan) if optimize else plan
+
+    def parse(self, query_str, optimize=True, backend='closure'):
+        """Compile a query. Queries the codegen backend doesn't support are
+        compiled by the closure backend.
+        The compiled query's tree_ql_needs_index is True if it navigates using a tree_index,
+        and its tree_ql_variables are the names of the variables it uses"""
+        return self.compile(self.plan(query_str, optimize), query_str, backend)
+
+    def compile(self, plan, query_str, backend='closure'):
+        """Compile a query plan, as parse. query_str: the query the plan is from"""
+        query = None
+        with self._lock:
+            if backend=='codegen':
+                try:
+                    query = self._codegen.compile(plan, query_str)
+                except unsupported_query:
+                    pass
+            elif backend!='closure':
+                raise ValueError(f'Unknown backend: {backend}')
+            if query is None:
+                try:
+                    query = self._transformer.transform(plan)
+                except VisitError as e:
+                    # E.g. an unknown function
+                    raise e.orig_exc
+        query.tree_ql_needs_index = needs_index(plan)
+        query.tree_ql_variables = frozenset(varref.children[0].value for varref in plan.find_data('varref'))
+        return query
+
+    def split_scan(self, query_str, backend='closure'):
+        """Split off the first step of a query that starts by scanning the whole tree 
+        for items a tree_index can't look up by name (E.g. //*[@type=="NAME"]/.., 
+        //leaf()), so many queries can share one scan. None for other queries"""
+        plan = self.plan(query_str)
+        path = plan.children[0]
+        if not (isinstance(path, Tree) and path.data=='absolutelocation_path'):
+            return None
+        step = path.children[0]
+        if not (isinstance(step, Tree) and step.data=='fused_step' and step.children[0] in ('descendant', 'descendant-or-self')
+                and step.children[1].type!='NAME_TEST'):
+            return None
 
-def create_tree_parser(tree_node_nameattr, tree_node_childattr):
+        axis, node_test, fused_filter = step.children[:3]
+        with self._lock:
+            attribute_tests = self._transformer.transform(fused_filter)
+            # Equality tests to look matching items up by: the other tests are applied to them
+            key, others = {}, []
+            for attribute, op, value in attribute_tests:
+                if op is operator.eq and attribute not in key:
+                    key[attribute] = value
+                else:
+                    others.append((attribute, op, value))
+            test = self._transformer._combined_test(_ANY_NODE, others)
+        key = (tuple(key), tuple(key.values())) if key else None
+        # The step's predicates, then the rest of the path
+        predicates = [Tree('fused_step', [Token('FUSED_AXIS', 'self'), _ANY_NODE, Tree('fused_filter', [])] + step.children[3:])] if step.children[3:] else []
+        remaining = predicates + path.children[1:]
+        rest = self.compile(Tree('start', [Tree('relativelocation_path', remaining)]), query_str, backend) if remaining else None
+        return _scan_step(axis=='descendant-or-self', _INDEX_KINDS.get(node_test.value), key, test, rest)
+
+class _scan_step:
+    """The first step of a query that scans the whole tree, from _query_compiler.split_scan.
+    An item matches if it is of kind (LEAF or NODE, if there is a kind), its attributes
+    key[0] equal the values key[1] (if there is a key) and it passes test (if there is 
+    one). E.g. key=(('type', 'value'), ('NAME', 'x'))
+    or_self: the tree's root is scanned too
+    rest: the compiled query for the rest of the query (the step's predicates, and the
+    steps after it), applied to the step's matches. None if there isn't any"""
+
+    def __init__(self, or_self, kind, key, test, rest):
+        self.or_self = or_self
+        self.kind = kind
+        self.key = key
+        self.test = test
+        self.rest = rest
+
+def create_tree_parser(tree_node_nameattr, tree_node_childattr, trace=False, profile=False):
     """
     tree_node_nameattr is the name of the attribute that provides the tree node name
     tree_node_childattr is the name of the attribute that accesses a tree nodes children
+    trace: compile queries that log each step as they execute
+    profile: compile queries that record each step's execution statistics (closure backend only)
+
+    Cheap: the query grammar is only loaded when the first query is compiled, and is shared
+    by all the compilers created, whatever attribute names they use
     """    
-    return Lark.open(_GRAMMAR, parser = 'lalr', maybe_placeholders=True, transformer = _inline_transformer(tree_node_nameattr, tree_node_childattr), cache=str(_GRAMMAR_CACHE))
+    return _query_compiler(_inline_transformer(tree_node_nameattr, tree_node_childattr, trace, profile),
+                           _codegen_transformer(tree_node_nameattr, tree_node_childattr))